@@ -0,0 +1,138 @@
+"""Numeric views of ``Building_Data`` and ``Fields_Data`` compiled once at import.
+
+The source tables mix two conventions: a building entry at level ``L`` holds
+the cost and build time *to reach* ``L``, while a field entry at ``L`` holds
+the cost and time to *leave* ``L`` (with ``[False]`` marking the last level).
+Everything here is normalised to "state at level ``L``" plus "upgrade from
+``L`` to ``L + 1``", with build times already converted to seconds.
+
+Each ``CompiledTable`` keeps two read-only layouts of the same data:
+
+* contiguous NumPy arrays indexed ``[id, level]`` for vectorised consumers
+  and for sharing with worker processes;
+* ``records[id][level]`` tuples of plain Python values for the scalar
+  lookups on the simulation hot path.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, List, Mapping, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+import Base_Data.Building_Data as b_data
+import Base_Data.Fields_Data as f_data
+from Generic_Functions.generic_functions import sec_val
+
+RESOURCE_NAMES: Tuple[str, ...] = ("Wood", "Clay", "Iron", "Crop")
+
+
+class LevelRecord(NamedTuple):
+    """Everything the simulation needs to know about one (id, level) cell."""
+
+    exists: bool
+    cp: int
+    pop: int
+    value: Any
+    upgradeable: bool
+    upgrade_cost: Optional[Tuple[int, int, int, int]]
+    upgrade_seconds: Optional[int]
+    cp_delta: int
+    pop_delta: int
+
+
+_MISSING = LevelRecord(False, 0, 0, None, False, None, None, 0, 0)
+
+
+def _has_cost(entry: Optional[List[Any]]) -> bool:
+    return entry is not None and entry[0] and entry[0][0] is not False
+
+
+class CompiledTable:
+    """Read-only per-(id, level) arrays and records for one family of tables."""
+
+    def __init__(self, tables: Mapping[str, Mapping[int, List[Any]]], cost_on_target_level: bool) -> None:
+        self.names: Tuple[str, ...] = tuple(tables)
+        self.ids: Dict[str, int] = {name: index for index, name in enumerate(self.names)}
+        top = max((max(table) for table in tables.values() if table), default=0)
+        #one spare level so "upgrade from the top level" lookups stay in bounds
+        shape = (len(self.names), top + 2)
+
+        self.exists = np.zeros(shape, dtype=bool)
+        self.cp = np.zeros(shape, dtype=np.int64)
+        self.pop = np.zeros(shape, dtype=np.int64)
+        self.value = np.full(shape, np.nan, dtype=np.float64)
+        self.upgradeable = np.zeros(shape, dtype=bool)
+        self.upgrade_cost = np.zeros(shape + (4,), dtype=np.int64)
+        self.upgrade_seconds = np.zeros(shape, dtype=np.int64)
+        self.max_level = np.zeros(len(self.names), dtype=np.int64)
+
+        self.records: List[List[LevelRecord]] = []
+        for row, name in enumerate(self.names):
+            table = tables[name]
+            self.max_level[row] = max(table, default=0)
+            row_records = []
+            for level in range(shape[1]):
+                entry = table.get(level)
+                #the entry that prices the upgrade out of this level
+                upgrade_entry = table.get(level + 1) if cost_on_target_level else entry
+                next_entry = table.get(level + 1)
+                cp = entry[1] if entry is not None else 0
+                pop = entry[2] if entry is not None else 0
+                value = entry[4] if entry is not None else None
+                upgradeable = _has_cost(upgrade_entry)
+                if upgradeable:
+                    upgrade_cost = tuple(upgrade_entry[0])
+                    upgrade_seconds = sec_val(upgrade_entry[3])
+                    cp_delta = next_entry[1] - cp
+                    pop_delta = next_entry[2] - pop
+                else:
+                    upgrade_cost = None
+                    upgrade_seconds = None
+                    cp_delta = 0
+                    pop_delta = 0
+                if entry is None and not upgradeable:
+                    row_records.append(_MISSING)
+                    continue
+                row_records.append(
+                    LevelRecord(entry is not None, cp, pop, value, upgradeable,
+                                upgrade_cost, upgrade_seconds, cp_delta, pop_delta)
+                )
+                self.exists[row, level] = entry is not None
+                self.cp[row, level] = cp
+                self.pop[row, level] = pop
+                if isinstance(value, (int, float)):
+                    self.value[row, level] = value
+                self.upgradeable[row, level] = upgradeable
+                if upgradeable:
+                    self.upgrade_cost[row, level] = upgrade_cost
+                    self.upgrade_seconds[row, level] = upgrade_seconds
+            self.records.append(row_records)
+
+        for array in self._arrays():
+            array.flags.writeable = False
+
+    def _arrays(self) -> Iterable[np.ndarray]:
+        return (self.exists, self.cp, self.pop, self.value, self.upgradeable,
+                self.upgrade_cost, self.upgrade_seconds, self.max_level)
+
+    def record(self, name: str, level: int) -> LevelRecord:
+        """Return the record for ``name`` at ``level`` (an empty record if unknown)."""
+        row = self.ids.get(name)
+        if row is None:
+            return _MISSING
+        row_records = self.records[row]
+        if level < 0 or level >= len(row_records):
+            return _MISSING
+        return row_records[level]
+
+
+#building levels start at 1 and each entry prices the level it reaches
+BUILDINGS = CompiledTable(b_data.building_dict, cost_on_target_level=True)
+#field levels start at 0 and each entry prices the upgrade out of that level
+FIELDS = CompiledTable({name: f_data.field_dict[name] for name in RESOURCE_NAMES}, cost_on_target_level=False)
+
+BUILDING_ID: Dict[str, int] = BUILDINGS.ids
+RESOURCE_ID: Dict[str, int] = FIELDS.ids
+
+__all__ = ["LevelRecord", "CompiledTable", "BUILDINGS", "FIELDS", "BUILDING_ID", "RESOURCE_ID", "RESOURCE_NAMES"]
@@ -1,6 +1,4 @@
-﻿import random
-
-from Classes.AI_Classes.generic_ai_base import GenericAIBase
+﻿from Classes.AI_Classes.generic_ai_base import GenericAIBase
 
 
 class BalancedLowestLevel(GenericAIBase):
@@ -30,4 +28,4 @@ class BalancedLowestLevel(GenericAIBase):
 
         if len(choose_from_list) == 0:
             return None
-        return random.choice(choose_from_list)
+        return self.choose(choose_from_list, info_packet)
@@ -1,5 +1,3 @@
-import random
-
 from Classes.AI_Classes.generic_ai_base import GenericAIBase
 
 
@@ -22,5 +20,5 @@ class BuildingFocus(GenericAIBase):
         if len(choose_from_list) == 0:
             return None
 
-        chosen_action = random.choice(choose_from_list)
+        chosen_action = self.choose(choose_from_list, info_packet)
         return chosen_action
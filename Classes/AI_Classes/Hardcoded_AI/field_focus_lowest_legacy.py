@@ -1,6 +1,4 @@
-﻿import random
-
-from Classes.AI_Classes.generic_ai_base import GenericAIBase
+﻿from Classes.AI_Classes.generic_ai_base import GenericAIBase
 
 
 class FieldFocusLowestLegacy(GenericAIBase):
@@ -47,4 +45,4 @@ class FieldFocusLowestLegacy(GenericAIBase):
 
         if not choose_from_list:
             return None
-        return random.choice(choose_from_list)
+        return self.choose(choose_from_list, info_packet)
@@ -1,6 +1,4 @@
-﻿import random
-
-from Classes.AI_Classes.generic_ai_base import GenericAIBase
+﻿from Classes.AI_Classes.generic_ai_base import GenericAIBase
 
 
 class MainBuildingBias(GenericAIBase):
@@ -33,4 +31,4 @@ class MainBuildingBias(GenericAIBase):
         if len(choose_from_list) == 0:
             return None
 
-        return random.choice(choose_from_list)
+        return self.choose(choose_from_list, info_packet)
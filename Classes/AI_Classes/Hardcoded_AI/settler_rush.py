@@ -1,5 +1,3 @@
-import random
-
 from Classes.AI_Classes.generic_ai_base import GenericAIBase
 
 
@@ -78,7 +76,4 @@ class SettlerRush(GenericAIBase):
     def _choose(self, options):
         if not options:
             return None
-        rng = getattr(self.owning_player, "rng_holder", None)
-        if rng is None:
-            return random.choice(options)
-        return rng.choice(options)
+        return self.choose(options)
@@ -8,6 +8,10 @@ village, game timers, etc.).  Sub-classes can decide what to do with
 that data and simply return a choice from the list or ``None`` to skip.
 """
 
+import random
+
+from Base_Data.compiled_tables import BUILDINGS, FIELDS
+
 
 class GenericAIBase:
     def __init__(self, owning_player):
@@ -18,6 +22,19 @@ class GenericAIBase:
         """Hook for clearing any cached data before a fresh run."""
         return
 
+    def choose(self, options, info_packet=None):
+        """
+        Pick one of ``options`` with the run's RNG: the info packet's, else
+        the owning player's.  The global ``random`` is only a last resort,
+        so interleaved runs do not share random state.
+        """
+        rng = None
+        if isinstance(info_packet, dict):
+            rng = info_packet.get("rng")
+        if rng is None:
+            rng = getattr(self.owning_player, "rng_holder", None) or random
+        return rng.choice(options)
+
     def select_building(self, possible_actions, info_packet):
         """
         Decide which upgrade to take from the supplied options.
@@ -46,4 +63,9 @@ def build_info_packet(player, village, game_time, global_last_active):
         "global_last_active": global_last_active,
         "settlers_built": getattr(player, "settlers_built", 0),
         "settle_points": getattr(player, "settle_points", 0),
+        #the player's own seeded RNG; agents should draw from this rather than the global random
+        "rng": getattr(player, "rng_holder", None),
+        #compiled cost/time tables so agents can price options without the raw dicts
+        "building_table": BUILDINGS,
+        "field_table": FIELDS,
     }
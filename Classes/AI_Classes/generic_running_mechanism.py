@@ -38,8 +38,28 @@ class base_controller(player.Player):
         self.villages = villages
         self.rng_holder = rng_holder if rng_holder is not None else random
         self.next_action_due_at = 0
+        #None falls back to the module-level logger; a GameState attaches its own RunLogger
+        self._run_logger = None
         self.ai_label = getattr(self.ai_controller, "name", "Generic Random")
 
+    #resolved on use rather than stored, so controllers (and the villages and maps that
+    #reference them) stay picklable for process pools
+    @property
+    def run_logger(self):
+        if self._run_logger is None:
+            return run_logger
+        return self._run_logger
+
+    @run_logger.setter
+    def run_logger(self, logger):
+        self._run_logger = logger
+
+    def __getstate__(self):
+        #the attached logger belongs to its GameState (open sink, writer thread) and is not shipped
+        state = self.__dict__.copy()
+        state["_run_logger"] = None
+        return state
+
     def _count_jobs(self, job_type):
         """Count outstanding jobs of a given type across all villages."""
         total = 0
@@ -51,7 +71,7 @@ class base_controller(player.Player):
 
     def _log_action_event(self, village, action_type, target_repr, wait_time, reason=None):
         """Common logger wrapper for controller-initiated actions."""
-        run_logger.log_action(
+        self.run_logger.log_action(
             player=self.name,
             village_location=getattr(village, "location", None),
             action_type=action_type,
@@ -115,9 +135,8 @@ class base_controller(player.Player):
         if wait_duration is not None:
             self.next_action_due_at = current_time + wait_duration
         else:
-            #issue - this is hardcoded into the AI as a "wait 20k seconds" element - should be dynamic and
-            #controlled at a high level
-            # [ISS-033] Align idle wake-ups with periodic_monitor cadence once controller scheduling is refactored.
+            #only reached when no village has a job queued or a candidate that will become
+            #affordable, so nothing can change until the game state does
             self.next_action_due_at = current_time + 20000
         #issue - this function doesn't return anything, but it should absolutely log stuff
 
@@ -126,7 +145,6 @@ class base_controller(player.Player):
         if remaining > 0:
             return remaining
 
-        local_duration_slept = current_time - self.Last_Active
         self.Last_Active = current_time
 
         wait_time_list = []
@@ -136,32 +154,19 @@ class base_controller(player.Player):
         total_culture_rate = 0.0
 
         for curr_village in self.villages:
-            curr_village.culture_points_total += curr_village.culture_points_rate * (local_duration_slept / 3600)
+            #resources and culture accrue lazily; the village only needs to know the time
+            curr_village.advance_clock(current_time)
             total_culture += curr_village.culture_points_total
             total_culture_rate += curr_village.culture_points_rate
-            resources_gained = curr_village.yield_calc()
-            for i in range(len(resources_gained)):
-                resources_gained[i] *= local_duration_slept
-            current_stockpile = curr_village.stored
-            current_max = curr_village.storage_cap
-            for i in range(len(resources_gained)):
-                updated_amount = current_stockpile[i] + resources_gained[i]
-                if updated_amount > current_max[i]:
-                    current_stockpile[i] = current_max[i]
-                elif updated_amount < 0:
-                    current_stockpile[i] = 0
-                else:
-                    current_stockpile[i] = updated_amount
-            curr_village.stored = current_stockpile
 
-            completed_jobs = curr_village.advance_upgrade_jobs(local_duration_slept)
+            completed_jobs = curr_village.due_upgrade_jobs(current_time)
             for job in completed_jobs:
                 location = getattr(curr_village, "location", None)
                 owner = getattr(curr_village, "owner", None)
                 job_type = job.get("type")
                 if job_type == "building":
                     curr_village.building_upgraded(job)
-                    run_logger.log_completion(
+                    self.run_logger.log_completion(
                         player=self.name,
                         village_location=location,
                         job_type="building",
@@ -170,8 +175,8 @@ class base_controller(player.Player):
                         culture_rate=curr_village.culture_points_rate,
                         culture_total=curr_village.culture_points_total,
                         total_yield=curr_village.total_yield,
-                        resources=curr_village.stored.copy(),
-                        storage_cap=curr_village.storage_cap.copy(),
+                        resources=curr_village.stored,
+                        storage_cap=curr_village.storage_cap,
                         ai_label=self.ai_label,
                         game_time=current_time,
                         settlers_built=getattr(owner, "settlers_built", None),
@@ -179,7 +184,7 @@ class base_controller(player.Player):
                     )
                 elif job_type == "field":
                     curr_village.field_upgraded(job)
-                    run_logger.log_completion(
+                    self.run_logger.log_completion(
                         player=self.name,
                         village_location=location,
                         job_type="field",
@@ -188,8 +193,8 @@ class base_controller(player.Player):
                         culture_rate=curr_village.culture_points_rate,
                         culture_total=curr_village.culture_points_total,
                         total_yield=curr_village.total_yield,
-                        resources=curr_village.stored.copy(),
-                        storage_cap=curr_village.storage_cap.copy(),
+                        resources=curr_village.stored,
+                        storage_cap=curr_village.storage_cap,
                         ai_label=self.ai_label,
                         game_time=current_time,
                         settlers_built=getattr(owner, "settlers_built", None),
@@ -198,7 +203,7 @@ class base_controller(player.Player):
                 elif job_type == "train_settler":
                     if owner is not None:
                         owner.settlers_built += 1
-                    run_logger.log_completion(
+                    self.run_logger.log_completion(
                         player=self.name,
                         village_location=location,
                         job_type="train_settler",
@@ -207,8 +212,8 @@ class base_controller(player.Player):
                         culture_rate=curr_village.culture_points_rate,
                         culture_total=curr_village.culture_points_total,
                         total_yield=curr_village.total_yield,
-                        resources=curr_village.stored.copy(),
-                        storage_cap=curr_village.storage_cap.copy(),
+                        resources=curr_village.stored,
+                        storage_cap=curr_village.storage_cap,
                         ai_label=self.ai_label,
                         game_time=current_time,
                         settlers_built=getattr(owner, "settlers_built", None),
@@ -220,7 +225,7 @@ class base_controller(player.Player):
                         owner.settlers_built -= 3
                         owner.settle_points += 1
                     # [ISS-032] Settlements should refund the population (crop usage) from the departing settlers.
-                    run_logger.log_completion(
+                    self.run_logger.log_completion(
                         player=self.name,
                         village_location=location,
                         job_type="settle",
@@ -229,8 +234,8 @@ class base_controller(player.Player):
                         culture_rate=curr_village.culture_points_rate,
                         culture_total=curr_village.culture_points_total,
                         total_yield=curr_village.total_yield,
-                        resources=curr_village.stored.copy(),
-                        storage_cap=curr_village.storage_cap.copy(),
+                        resources=curr_village.stored,
+                        storage_cap=curr_village.storage_cap,
                         ai_label=self.ai_label,
                         game_time=current_time,
                         settlers_built=getattr(owner, "settlers_built", None),
@@ -276,6 +281,11 @@ class base_controller(player.Player):
                     None,
                     reason="no available upgrades",
                 )
+                #sleep until the cheapest blocked candidate can be paid for
+                affordable_wait = curr_village.next_affordable_in()
+                if affordable_wait is not None:
+                    reset_time = True
+                    wait_time_list.append(affordable_wait)
             else:
                 reset_time = True
                 item_type = chosen_item.get("type")
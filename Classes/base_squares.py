@@ -1,6 +1,8 @@
 import random
 
 class Location:
+    __slots__ = ('location', 'interactable', 'owner', 'last_active', 'sleep')
+
     def __init__(self, location):
         self.location = location
         self.interactable = True
@@ -9,8 +11,14 @@ class Location:
         self.sleep = True
 
 class Square(Location):
-    def __init__(self, location):
+    __slots__ = ('type_square',)
+
+    def __init__(self, location, type_square=None):
         super().__init__(location)
+        #generated maps pass the type in; otherwise roll for it
+        if type_square is not None:
+            self.type_square = type_square
+            return
         randval = random.randint(0,100)
         if randval < 10:
             self.type_square = 'wilderness'
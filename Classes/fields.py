@@ -1,16 +1,48 @@
-import Generic_Functions.generic_functions as generic_func
-import Base_Data.Fields_Data as f_data
+from Base_Data.compiled_tables import FIELDS
+
+
+class FieldRecordMixin:
+    #cost, cp, pop and upgrade time all follow from the level via the compiled tables
+    __slots__ = ()
+
+    @property
+    def upgrade_cost(self):
+        return FIELDS.record(self.type_field, self.level).upgrade_cost
+
+    @property
+    def cp(self):
+        return FIELDS.record(self.type_field, self.level).cp
+
+    @property
+    def pop(self):
+        return FIELDS.record(self.type_field, self.level).pop
+
+    @property
+    def upgrade_time(self):
+        return FIELDS.record(self.type_field, self.level).upgrade_seconds or 0
+
+
+class Field(FieldRecordMixin):
+    __slots__ = ('type_field', 'level', 'upgradeable', 'field_yield')
 
-class Field():
     def __init__(self, type_field, upgradeable=True,level=0):
         #high level logic
         self.type_field = type_field
         self.level=level
-        #low level logic
-        self.upgrade_cost = f_data.field_dict[self.type_field][self.level][0]
-        #the below used to be int forced but I don't know why, lets see if it breaks without it.
-        self.field_yield = (f_data.field_dict[self.type_field][self.level][4])
-        self.cp = (f_data.field_dict[self.type_field][self.level][1])
-        self.pop = (f_data.field_dict[self.type_field][self.level][2])
-        self.upgrade_time = (generic_func.sec_val(f_data.field_dict[self.type_field][self.level][3]))
-        self.upgradeable = upgradeable
\ No newline at end of file
+        self.upgradeable = upgradeable
+        #kept as a plain attribute so callers can override yields (tests zero them out)
+        self.field_yield = FIELDS.record(self.type_field, self.level).value
+
+
+class FieldTemplate(FieldRecordMixin):
+    #read-only field shared by every unsettled tile; villages copy it into their own arrays
+    __slots__ = ('type_field', 'level', 'upgradeable', 'field_yield')
+
+    def __init__(self, type_field, upgradeable=True, level=0):
+        object.__setattr__(self, 'type_field', type_field)
+        object.__setattr__(self, 'level', level)
+        object.__setattr__(self, 'upgradeable', upgradeable)
+        object.__setattr__(self, 'field_yield', FIELDS.record(type_field, level).value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("field templates are shared; found a village to change fields")
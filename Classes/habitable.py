@@ -1,42 +1,63 @@
 import Classes.base_squares as base_squares
 import Classes.fields as fields
 import random
+from types import MappingProxyType
+
+FIELD_NAMES = ['Wood', 'Clay', 'Iron', 'Crop']
+#type_hab -> read-only field dict shared by every unsettled tile with that composition
+_FIELD_TEMPLATES = {}
+
+
+def field_template(type_hab):
+    key = tuple(type_hab)
+    template = _FIELD_TEMPLATES.get(key)
+    if template is None:
+        # fields occur in list, wood,clay,iron,crop
+        field_list_dict = {}
+        for i in range(len(key)):
+            shared = fields.FieldTemplate(FIELD_NAMES[i])
+            for j in range(1, key[i] + 1):
+                field_list_dict[FIELD_NAMES[i] + str(j)] = shared
+        template = MappingProxyType(field_list_dict)
+        _FIELD_TEMPLATES[key] = template
+    return template
+
 
 class Habitable(base_squares.Square):
+    __slots__ = ('type_hab', 'field_list_dict', 'next_action')
+
     # make sure the default classes go at the end
-    def __init__(self, location):
-        super().__init__(location)
+    def __init__(self, location, type_hab=None):
+        super().__init__(location, 'habitable')
         self.interactable=False
-        #note - is the below needed? it looks like it should inhabit it directly from base_squares?
-        self.type_square = 'habitable'
 
+        #generated maps pass the composition in; otherwise roll for it
+        if type_hab is not None:
+            self.type_hab = list(type_hab)
+        else:
+            self.type_hab = self._roll_type_hab()
+
+        # fields stay level 0 until a village is founded, so every tile with the same
+        # composition points at one shared template; Village copies it into its own arrays
+        self.field_list_dict = field_template(self.type_hab)
+
+        self.next_action = False
+
+    @staticmethod
+    def _roll_type_hab():
         randval = random.randint(0, 100)
         if randval < 10:
-            self.type_hab = [1, 1, 1, 15]
+            return [1, 1, 1, 15]
         elif randval < 25:
-            self.type_hab = [3, 3, 3, 9]
+            return [3, 3, 3, 9]
         elif randval < 35:
-            self.type_hab = [4, 3, 4, 7]
+            return [4, 3, 4, 7]
         elif randval < 45:
-            self.type_hab = [4, 4, 3, 7]
+            return [4, 4, 3, 7]
         elif randval < 55:
-            self.type_hab = [3, 4, 4, 7]
+            return [3, 4, 4, 7]
         else:
-            self.type_hab = [4, 4, 4, 6]
-
-        # now we expand this out a bit, to create the fields
-        # fields occur in list, wood,clay,iron,crop
-        # we're using lists above so we can iterate through them to create
-        # without doing this seperately dependent on the type above
-        field_list = ['Wood', 'Clay', 'Iron', 'Crop']
-        self.field_list_dict = {}
-        for i in range(len(self.type_hab)):
-            for j in range(1, self.type_hab[i] + 1):
-                key = field_list[i] + str(j)
-                holdval = fields.Field(field_list[i])
-                self.field_list_dict[key] = holdval
-
-        self.next_action = False
+            return [4, 4, 4, 6]
 
     def next_update(self):
         # [ISS-002] resolved: habitable tiles are currently passive; report no interaction required.
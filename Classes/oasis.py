@@ -2,25 +2,16 @@ import Classes.base_squares as loc_sq
 import random
 
 class Oasis(loc_sq.Square):
-    def __init__(self, location):
-        super().__init__(location)
-        self.type_square = 'oasis'
+    __slots__ = ('resources', 'storage', 'next_action')
+
+    def __init__(self, location, resources=None):
+        super().__init__(location, 'oasis')
         self.interactable = False
-        self.resources = []
-        # type one addition
-        randval = random.randint(0, 100)
-        if randval < 25:
-            self.resources.append('wood')
-        elif randval < 50:
-            self.resources.append('clay')
-        elif randval < 75:
-            self.resources.append('iron')
-        elif randval <= 100:
-            self.resources.append('crop')
-        #type two addition for dual type oases
-        randval = random.randint(0 ,100)
-        if randval > 80:
-            self.resources.append('crop')
+        #generated maps pass the resources in; otherwise roll for them
+        if resources is not None:
+            self.resources = list(resources)
+        else:
+            self.resources = self._roll_resources()
         # now define the storage
         self.storage = []
         #ammended below code heavily - unsure why it used to input dual list types.
@@ -45,6 +36,25 @@ class Oasis(loc_sq.Square):
         #below is a holder that makes them non interactable for now
         self.next_action = False
     
+    @staticmethod
+    def _roll_resources():
+        resources = []
+        # type one addition
+        randval = random.randint(0, 100)
+        if randval < 25:
+            resources.append('wood')
+        elif randval < 50:
+            resources.append('clay')
+        elif randval < 75:
+            resources.append('iron')
+        elif randval <= 100:
+            resources.append('crop')
+        #type two addition for dual type oases
+        randval = random.randint(0 ,100)
+        if randval > 80:
+            resources.append('crop')
+        return resources
+
     def next_update(self):
         # [ISS-003] resolved: oases remain non-interactable until active behaviour is implemented.
         return None
@@ -1,229 +1,385 @@
 import Classes.base_squares as base_squares
-import Base_Data.Building_Data as b_data
-import Base_Data.Fields_Data as f_data
+from Base_Data.compiled_tables import BUILDINGS, FIELDS, RESOURCE_NAMES
+from Classes.village_views import BuildingSlots, FieldMap
 import Generic_Functions.generic_functions as gen_func
+from array import array
+from collections import namedtuple
+import heapq
+import math
 import random
 
 from master_controller import game_rules
 
+#field prefix -> resource index used by the yield cache
+RESOURCE_INDEX = {'Wood': 0, 'Clay': 1, 'Iron': 2, 'Crop': 3}
+#bonus building -> resource index it boosts
+BONUS_BUILDINGS = {'sawmill': 0, 'brickyard': 1, 'iron_foundry': 2, 'grain_mill': 3, 'bakery': 3}
+BONUS_BUILDING_IDS = {BUILDINGS.ids[name]: index for name, index in BONUS_BUILDINGS.items()}
+WAREHOUSE_ID = BUILDINGS.ids['warehouse']
+GRANARY_ID = BUILDINGS.ids['granary']
+MAIN_BUILDING_ID = BUILDINGS.ids['main_building']
+RESIDENCE_ID = BUILDINGS.ids['residence']
+BUILDING_SLOT_COUNT = 23
+
+#field ids and resource ids for one field composition, shared by every village that has it
+FieldLayout = namedtuple('FieldLayout', ['names', 'index', 'resources'])
+_FIELD_LAYOUTS = {}
+
+
+def _field_layout(names):
+    layout = _FIELD_LAYOUTS.get(names)
+    if layout is None:
+        resources = array('b', [RESOURCE_INDEX[name[:4]] for name in names])
+        layout = FieldLayout(names, {name: i for i, name in enumerate(names)}, resources)
+        _FIELD_LAYOUTS[names] = layout
+    return layout
+
+
 class Village(base_squares.Square):
+    #buildings and fields live in flat arrays; .buildings and .fields are views over them
+    __slots__ = ('type_hab', 'available_buildings', 'storage_cap',
+                 '_slot_building', '_slot_level', '_slot_upgradeable',
+                 '_field_layout', '_field_level', '_field_upgradeable', '_field_yield',
+                 '_clock', '_resource_sync_time', '_resource_stock', '_resource_rate', '_culture_stock',
+                 '_field_yield_base', '_yield_bonus', '_yield_vector',
+                 'currently_upgrading', '_job_heap', '_upgrade_job_sequence',
+                 '_population', 'culture_points_rate', 'total_yield')
+
     def __init__(self, location, type_hab, field_list_dict, owner, type_square='village'):
-        super().__init__(location)
+        super().__init__(location, type_square)
         self.location = location
         self.interactable = True
         self.type_hab = type_hab
-        self.fields = field_list_dict
+        self._load_fields(field_list_dict)
         self.type_square = type_square
         self.owner = owner
-        self.buildings = {0: '', 1: '', 2: '', 3: '', 4: '', 5: '', 6: '', 7: '', 8: '',
-                    9: '', 10: '', 11: '', 12: '', 13: '', 14: '', 15: '', 16: '',
-                    17: '', 18: '', 19: '', 20: '', 21: '', 22: ''}
+        #per slot: BUILDINGS id (-1 when empty), level, upgradeable flag
+        self._slot_building = array('h', [-1] * BUILDING_SLOT_COUNT)
+        self._slot_level = array('B', [0] * BUILDING_SLOT_COUNT)
+        self._slot_upgradeable = array('b', [0] * BUILDING_SLOT_COUNT)
         #structure of the below - reference key for buildings_dict lookup, level, upgradeable bool.
-        self.buildings[0] = ['main_building', 1, True]
+        #written straight to the arrays: accrual and caches are only set up further down
+        self._slot_building[0] = BUILDINGS.ids['main_building']
+        self._slot_level[0] = 1
+        self._slot_upgradeable[0] = True
 
-        self.available_buildings = set(b_data.building_dict.keys())
-        for slot_info in self.buildings.values():
-            if isinstance(slot_info, list) and len(slot_info) > 0:
-                self.available_buildings.discard(slot_info[0])
+        self.available_buildings = set(BUILDINGS.names)
+        for building_id in self._slot_building:
+            if building_id >= 0:
+                self.available_buildings.discard(BUILDINGS.names[building_id])
 
         #default instantiation values
         self.storage_cap = [800, 800, 800, 800]
-        self.stored = [800,800,800,800]
+        #resources and culture accrue lazily: (last sync time, stock at sync, rate) plus the village clock
+        self._clock = 0
+        self._resource_sync_time = 0
+        self._resource_stock = [800, 800, 800, 800]
+        self._resource_rate = None
+        self._culture_stock = 0.0
+        #yield cache: per-resource field totals, bonus multipliers and the per-second vector
+        self._field_yield_base = None
+        self._yield_bonus = None
+        self._yield_vector = None
+        #job id -> job, with a (completes_at, job id) min-heap alongside for completion lookups
         self.currently_upgrading = {}
+        self._job_heap = []
         self._upgrade_job_sequence = 0
-        self.population = 0
+        self._population = 0
         self.culture_points_rate = 0.0
-        self.culture_points_total = 0.0
         self.total_yield = 0.0
         self._recalculate_population_and_culture()
 
+    def _load_fields(self, field_list_dict):
+        layout = _field_layout(tuple(field_list_dict))
+        self._field_layout = layout
+        self._field_level = array('B', [field_list_dict[name].level for name in layout.names])
+        self._field_upgradeable = array('b', [bool(field_list_dict[name].upgradeable) for name in layout.names])
+        self._field_yield = array('l', [field_list_dict[name].field_yield for name in layout.names])
+
+    #slot -> '' or [name, level, upgradeable], written through to the slot arrays
+    @property
+    def buildings(self):
+        return BuildingSlots(self)
+
+    #field id -> Field-like view, written through to the field arrays
+    @property
+    def fields(self):
+        return FieldMap(self)
+
+    #stored resources are computed in closed form at the village clock
+    @property
+    def stored(self):
+        return self.resources_at(self._clock)
+
+    @stored.setter
+    def stored(self, values):
+        self._sync_resources()
+        self._resource_stock = list(values)
+
+    #population feeds crop consumption, so changing it settles accrual and drops the yield vector
+    @property
+    def population(self):
+        return self._population
+
+    @population.setter
+    def population(self, value):
+        self._sync_resources()
+        self._population = value
+        self._yield_vector = None
+
+    @property
+    def culture_points_total(self):
+        return self.culture_total_at(self._clock)
+
+    @culture_points_total.setter
+    def culture_points_total(self, value):
+        self._sync_resources()
+        self._culture_stock = value
+
+    def advance_clock(self, game_time):
+        """Move the village clock forward; no accrual work happens until a read."""
+        if game_time > self._clock:
+            self._clock = game_time
+
+    def resources_at(self, game_time):
+        """Return stored resources at game_time; accrual is clamped to storage caps and zero."""
+        stock = self._resource_stock
+        cap = self.storage_cap
+        elapsed = game_time - self._resource_sync_time
+        if elapsed <= 0:
+            return list(stock)
+        rate = self._resource_rate
+        if rate is None:
+            rate = self._resource_rate = self.yield_calc()
+        return [min(cap[i], max(0, stock[i] + rate[i] * elapsed)) for i in range(4)]
+
+    def culture_total_at(self, game_time):
+        """Return accumulated culture points at game_time."""
+        elapsed = game_time - self._resource_sync_time
+        if elapsed <= 0:
+            return self._culture_stock
+        return self._culture_stock + self.culture_points_rate * (elapsed / 3600)
+
+    def _sync_resources(self):
+        """Fold accrual up to the village clock into the stock; call before rates or caps change."""
+        now = self._clock
+        if now > self._resource_sync_time:
+            self._resource_stock = self.resources_at(now)
+            self._culture_stock = self.culture_total_at(now)
+            self._resource_sync_time = now
+        self._resource_rate = None
+
+    def _spend_resources(self, cost):
+        """Deduct a cost vector from the current stock."""
+        current = self.stored
+        self.stored = [current[i] - cost[i] for i in range(4)]
+
     #function to calculate storage, ignoring existence of the premade 800 setup for empty vils
     def calculate_storage(self):
         warehouse_storage = 0
         granary_storage = 0
-        for key in self.buildings:
-            holder = self.buildings[key]
-            #check if its empty
-            if len(holder) > 0:
-                if 'warehouse' in holder[0]:
-                    level = holder[1]
-                    storage = b_data.building_dict['warehouse'][level][4]
-                    warehouse_storage += storage
-                if 'granary' in holder[0]:
-                    level = holder[1]
-                    storage = b_data.building_dict['granary'][level][4]
-                    granary_storage += storage
+        records = BUILDINGS.records
+        for slot, building_id in enumerate(self._slot_building):
+            #a level-0 placeholder (still under construction) has no value and stores nothing
+            if building_id == WAREHOUSE_ID:
+                warehouse_storage += records[building_id][self._slot_level[slot]].value or 0
+            elif building_id == GRANARY_ID:
+                granary_storage += records[building_id][self._slot_level[slot]].value or 0
             #extra section to stop it setting back to 0 if buildings destroyed
         self.storage_cap = [max(warehouse_storage, 800),
                             max(warehouse_storage, 800),
                             max(warehouse_storage, 800),
                             max(granary_storage, 800)]
 
-    #fairly basic function to calculate yield, has some innefficiencies noted below
     #returns per second yields, which then get multiplied out by time elapsed
+    #the result is cached and only rebuilt after field/building completions or population changes
     def yield_calc(self):
-        wood_yield = 0
-        clay_yield = 0
-        iron_yield = 0
-        crop_yield = 0
-        for key3, field_obj in self.fields.items():
-            if 'Wood' in key3:
-                wood_yield += field_obj.field_yield
-            if 'Clay' in key3:
-                clay_yield += field_obj.field_yield
-            if 'Iron' in key3:
-                iron_yield += field_obj.field_yield
-            if 'Crop' in key3:
-                crop_yield += field_obj.field_yield
-
-        wood_bonus = 0.0
-        clay_bonus = 0.0
-        iron_bonus = 0.0
-        crop_bonus = 0.0
-        for building in self.buildings.values():
-            if not building or len(building) <= 1:
+        if self._yield_vector is None:
+            if self._field_yield_base is None:
+                self._field_yield_base = self._calculate_field_yields()
+            if self._yield_bonus is None:
+                self._yield_bonus = self._calculate_yield_bonus()
+            base = self._field_yield_base
+            bonus = self._yield_bonus
+            wood_yield = base[0] * (1.0 + bonus[0]) / 3600
+            clay_yield = base[1] * (1.0 + bonus[1]) / 3600
+            iron_yield = base[2] * (1.0 + bonus[2]) / 3600
+            net_crop = base[3] * (1.0 + bonus[3]) - self.population
+            crop_yield = net_crop / 3600
+            self._yield_vector = [wood_yield, clay_yield, iron_yield, crop_yield]
+        return list(self._yield_vector)
+
+    def _calculate_field_yields(self):
+        """Sum hourly field output per resource (wood, clay, iron, crop)."""
+        totals = [0, 0, 0, 0]
+        for index, field_yield in zip(self._field_layout.resources, self._field_yield):
+            totals[index] += field_yield
+        return totals
+
+    def _calculate_yield_bonus(self):
+        """Sum the fractional production bonus from resource buildings."""
+        bonus = [0.0, 0.0, 0.0, 0.0]
+        for slot, building_id in enumerate(self._slot_building):
+            index = BONUS_BUILDING_IDS.get(building_id)
+            if index is None:
+                continue
+            bonus[index] += BUILDINGS.records[building_id][self._slot_level[slot]].value or 0.0
+        return bonus
+
+    def _write_layout(self, writes, buildings):
+        """Apply (array, index, value) writes from the attribute views, keeping derived state current.
+
+        Accrual is settled at the old rates first, then the yield cache is dropped and, for
+        building slots, the storage caps are recalculated.
+        """
+        self._sync_resources()
+        for array, index, value in writes:
+            array[index] = value
+        if buildings:
+            self.invalidate_yield_cache(fields=False)
+            self.calculate_storage()
+        else:
+            self.invalidate_yield_cache(buildings=False)
+
+    def invalidate_yield_cache(self, fields=True, buildings=True):
+        """Drop cached yields; call after field or bonus-building levels change."""
+        if fields:
+            self._field_yield_base = None
+        if buildings:
+            self._yield_bonus = None
+        self._yield_vector = None
+
+    def _upgrade_candidates(self):
+        #yields (bucket, candidate, cost) for every upgrade that passes the
+        #non-resource checks, in the order possible_buildings reports them
+        crop_yield_per_hour = self.yield_calc()[3] * 3600
+        for key, building_id in enumerate(self._slot_building):
+            #if buildings exist that can be built, and are upgradeable
+            if building_id < 0 or not self._slot_upgradeable[key]:
+                continue
+            holdval_level = self._slot_level[key]
+            record = BUILDINGS.records[building_id][holdval_level]
+            if not record.upgradeable:
                 continue
-            name, level, _ = building
-            if name in ('sawmill', 'brickyard', 'iron_foundry', 'grain_mill', 'bakery'):
-                entry = b_data.building_dict.get(name, {}).get(level)
-                if entry is None:
+            if crop_yield_per_hour <= 0 or record.pop_delta >= crop_yield_per_hour:
+                continue
+            final_value = {
+                'type': 'building',
+                'slot': key,
+                'name': BUILDINGS.names[building_id],
+                'level': holdval_level,
+            }
+            yield 'buildings', final_value, record.upgrade_cost
+        #new builds are offered once per type; upgrade_building picks the slot
+        if self.available_buildings and self._first_empty_slot() is not None:  # [ISS-023] allow maxed storage buildings to bypass this guard later
+            for building_name in sorted(self.available_buildings):
+                record = BUILDINGS.record(building_name, 0)
+                if not record.upgradeable:
                     continue
-                bonus = entry[4] or 0.0
-                if name == 'sawmill':
-                    wood_bonus += bonus
-                elif name == 'brickyard':
-                    clay_bonus += bonus
-                elif name == 'iron_foundry':
-                    iron_bonus += bonus
-                else:
-                    crop_bonus += bonus
-
-        wood_yield *= (1.0 + wood_bonus)
-        clay_yield *= (1.0 + clay_bonus)
-        iron_yield *= (1.0 + iron_bonus)
-        crop_yield *= (1.0 + crop_bonus)
-
-        wood_yield = wood_yield / 3600
-        clay_yield = clay_yield / 3600
-        iron_yield = iron_yield / 3600
-        net_crop = crop_yield - self.population
-        crop_yield = net_crop / 3600
-
-        yields = [wood_yield, clay_yield, iron_yield, crop_yield]
-        return yields
-    
-    
+                final_value = {
+                    'type': 'building',
+                    'slot': None,
+                    'name': building_name,
+                    'level': 0,
+                    'new_build': True,
+                }
+                yield 'buildings', final_value, record.upgrade_cost
+        layout = self._field_layout
+        for index, key in enumerate(layout.names):
+            if not self._field_upgradeable[index]:
+                continue
+            resource = layout.resources[index]
+            holdval_level = self._field_level[index]
+            record = FIELDS.records[resource][holdval_level]
+            if not record.upgradeable:
+                continue
+            key2 = RESOURCE_NAMES[resource]
+            if key2 != 'Crop':
+                if crop_yield_per_hour <= 0 or record.pop_delta >= crop_yield_per_hour:
+                    continue
+            final_value = {
+                'type': 'field',
+                'field_id': key,
+                'resource': key2,
+                'level': holdval_level,
+            }
+            yield 'fields', final_value, record.upgrade_cost
+
     def possible_buildings(self):
         #modified to dictionary variant to store both in one item
         possible_buildings = {'buildings': [], 'fields': []}
-        crop_yield_per_hour = self.yield_calc()[3] * 3600
-        for key in self.buildings:
-            holdval = self.buildings[key]
-            #if buildings exist that can be built
-            if len(holdval) > 1:
-                holdval_level = holdval[1]
-                #if upgradeable
-                if holdval[2] == True:
-                    keyval = holdval[0]
-                    entry, _ = self._get_building_entry(keyval, holdval_level)
-                    next_entry, _ = self._get_building_entry(keyval, holdval_level + 1)
-                    if next_entry is None:
-                        continue
-                    previous_pop = entry[2] if entry is not None else 0
-                    pop_delta = next_entry[2] - previous_pop
-                    if crop_yield_per_hour <= 0 or pop_delta >= crop_yield_per_hour:
-                        continue
-                    upgrade_cost = next_entry[0]
-                    #default to assuming enough res, then make false if not true
-                    enough_res = True
-                    for i in range(4):
-                        if upgrade_cost[i] > self.stored[i]:
-                            enough_res = False
-                    if enough_res:
-                        final_value = {
-                            'type': 'building',
-                            'slot': key,
-                            'name': holdval[0],
-                            'level': holdval_level,
-                        }
-                        dictval = possible_buildings['buildings']
-                        dictval.append(final_value)
-        empty_slots = [slot for slot, value in self.buildings.items() if not value]  # [ISS-023] allow maxed storage buildings to bypass this guard later
-        if empty_slots and self.available_buildings:
-            for slot in empty_slots:
-                for building_name in sorted(self.available_buildings):
-                    level_data = b_data.building_dict.get(building_name, {}).get(1)
-                    if level_data is None:
-                        continue
-                    upgrade_cost = level_data[0]
-                    if all(self.stored[i] >= upgrade_cost[i] for i in range(4)):
-                        possible_buildings['buildings'].append(
-                            {
-                                'type': 'building',
-                                'slot': slot,
-                                'name': building_name,
-                                'level': 0,
-                                'new_build': True,
-                            }
-                        )
-        for key in self.fields:
-            holdval = self.fields[key]
-            holdval_level = holdval.level
-            key2 = key[:4]
-            if holdval.upgradeable is True:
-                current_entry = f_data.field_dict[key2][holdval_level]
-                next_entry = f_data.field_dict[key2].get(holdval_level + 1)
-                if next_entry is None:
-                    continue
-                pop_delta = next_entry[2] - current_entry[2]
-                if key2 != 'Crop':
-                    if crop_yield_per_hour <= 0 or pop_delta >= crop_yield_per_hour:
-                        continue
-                upgrade_cost = f_data.field_dict[key2][holdval_level][0]
-                enough_res = True
-                for i in range(4):
-                    if upgrade_cost[i] > self.stored[i]:
-                        enough_res = False
-                if enough_res:
-                    final_value = {
-                        'type': 'field',
-                        'field_id': key,
-                        'resource': key2,
-                        'level': holdval_level,
-                    }
-                    dictval = possible_buildings['fields']
-                    dictval.append(final_value)
-        return possible_buildings   
-    
+        stored = self.stored
+        for bucket, final_value, upgrade_cost in self._upgrade_candidates():
+            if all(stored[i] >= upgrade_cost[i] for i in range(4)):
+                possible_buildings[bucket].append(final_value)
+        return possible_buildings
+
+    def time_until_affordable(self, cost):
+        #seconds until stored resources cover cost at current yields; 0 if already
+        #affordable, None if a resource is capped below the cost or not growing
+        stored = self.stored
+        rate = self.yield_calc()
+        wait = 0
+        for i in range(4):
+            shortfall = cost[i] - stored[i]
+            if shortfall <= 0:
+                continue
+            if cost[i] > self.storage_cap[i] or rate[i] <= 0:
+                return None
+            wait = max(wait, math.ceil(shortfall / rate[i]))
+        return wait
+
+    def next_affordable_in(self):
+        #earliest wait until a currently unaffordable candidate becomes affordable,
+        #None when nothing will ever unlock without a completion changing the village
+        best = None
+        for _, _, upgrade_cost in self._upgrade_candidates():
+            wait = self.time_until_affordable(upgrade_cost)
+            if wait is None or wait <= 0:
+                continue
+            if best is None or wait < best:
+                best = wait
+        return best
+
+    def _first_empty_slot(self):
+        try:
+            return self._slot_building.index(-1)
+        except ValueError:
+            return None
+
     def upgrade_building(self, upgrade_target):
         building_dict_key = upgrade_target[0]
         building_data_key = upgrade_target[1]
-        relevant_target = self.buildings[building_dict_key]
-        is_new_build = not relevant_target
+        #new-build candidates carry no slot; place them in the first free one
+        if building_dict_key is None:
+            building_dict_key = self._first_empty_slot()
+            if building_dict_key is None:
+                raise ValueError(f"No empty building slot available for {building_data_key}")
+        is_new_build = self._slot_building[building_dict_key] < 0
         if is_new_build:
             current_level = 0
             upgradeable_check = True
         else:
-            current_level = relevant_target[1]
-            upgradeable_check = relevant_target[2]
+            current_level = self._slot_level[building_dict_key]
+            upgradeable_check = bool(self._slot_upgradeable[building_dict_key])
         if upgradeable_check is not True:
             raise ValueError("You appear to have attempted to upgrade a building that cannot be upgraded :(")
         target_level = current_level + 1
-        target_entry, _ = self._get_building_entry(building_data_key, target_level)
-        if target_entry is None:
+        record = BUILDINGS.record(building_data_key, current_level)
+        if not record.upgradeable:
             raise ValueError(f"Building data missing for {building_data_key} at level {target_level}")
-        upgrade_cost = target_entry[0]
-        upgrade_time = target_entry[3]
+        upgrade_cost = record.upgrade_cost
 
         speed_modifier = self._main_building_speed_modifier()
-        true_upgrade_time = gen_func.sec_val(upgrade_time)
-        true_upgrade_time = max(1, int(round(true_upgrade_time * speed_modifier)))
+        true_upgrade_time = max(1, int(round(record.upgrade_seconds * speed_modifier)))
 
-        for i in range(4):
-            self.stored[i] -= upgrade_cost[i]
+        self._spend_resources(upgrade_cost)
 
         if is_new_build:
-            self.buildings[building_dict_key] = [building_data_key, 0, True]
+            #a level-0 placeholder changes no yields or caps, so the arrays are written directly
+            self._slot_building[building_dict_key] = BUILDINGS.ids[building_data_key]
+            self._slot_level[building_dict_key] = 0
+            self._slot_upgradeable[building_dict_key] = True
             self.available_buildings.discard(building_data_key)
 
         sleep_duration = true_upgrade_time
@@ -236,19 +392,19 @@ class Village(base_squares.Square):
         return sleep_duration
 
     def _residence_level(self):
-        for data in self.buildings.values():
-            if data and len(data) > 1 and data[0] == 'residence':
-                return data[1]
+        for slot, building_id in enumerate(self._slot_building):
+            if building_id == RESIDENCE_ID:
+                return self._slot_level[slot]
         return 0
 
     def start_train_settler(self):
         if self._residence_level() < 10:
             raise ValueError("Residence level 10 required to train settlers.")
         cost = game_rules.SETTLER_COST
-        if any(self.stored[i] < cost[i] for i in range(4)):
+        stored = self.stored
+        if any(stored[i] < cost[i] for i in range(4)):
             return None
-        for i in range(4):
-            self.stored[i] -= cost[i]
+        self._spend_resources(cost)
         duration = gen_func.sec_val(game_rules.SETTLER_TIME)
         payload = {'village': getattr(self, "location", None)}
         self._register_upgrade_job('train_settler', payload, duration)
@@ -261,10 +417,10 @@ class Village(base_squares.Square):
         if owner.culture_points < game_rules.CP_THRESHOLD:
             return None
         cost = game_rules.SETTLE_COST
-        if any(self.stored[i] < cost[i] for i in range(4)):
+        stored = self.stored
+        if any(stored[i] < cost[i] for i in range(4)):
             return None
-        for i in range(4):
-            self.stored[i] -= cost[i]
+        self._spend_resources(cost)
         duration = gen_func.sec_val(game_rules.SETTLE_TIME)
         payload = {'village': getattr(self, "location", None)}
         self._register_upgrade_job('settle', payload, duration)
@@ -272,11 +428,11 @@ class Village(base_squares.Square):
     
     def upgrade_field(self, upgrade_target):
 
-        #find fields within self.fields, and get key, level, upgradeable
-        field_data = self.fields[upgrade_target]
+        #find fields within the field arrays, and get key, level, upgradeable
+        index = self._field_layout.index[upgrade_target]
         field_dict_key = upgrade_target[:4]
-        current_level = field_data.level
-        upgradeable_check = field_data.upgradeable
+        current_level = self._field_level[index]
+        upgradeable_check = bool(self._field_upgradeable[index])
 
         #this is fine for now, as i'm happy for it to break
         #however, this is a future issue and candidate for logging
@@ -285,17 +441,13 @@ class Village(base_squares.Square):
             raise ValueError("You appear to have attempted to upgrade a field that cannot be upgraded :(")
 
         #get upgrade cost and upgrade time
-        upgrade_cost = f_data.field_dict[field_dict_key][current_level][0]
-        upgrade_time = f_data.field_dict[field_dict_key][current_level][3]
+        record = FIELDS.record(field_dict_key, current_level)
+        upgrade_cost = record.upgrade_cost
         speed_modifier = self._main_building_speed_modifier()
-        true_upgrade_time = gen_func.sec_val(upgrade_time)
-        true_upgrade_time = max(1, int(round(true_upgrade_time * speed_modifier)))
+        true_upgrade_time = max(1, int(round(record.upgrade_seconds * speed_modifier)))
 
         #remove cost of everything used for upgrades
-        hold_vals = self.stored
-        for i in range(len(hold_vals)):
-            hold_vals[i] -= upgrade_cost[i]
-        self.stored = hold_vals
+        self._spend_resources(upgrade_cost)
 
         sleep_duration = true_upgrade_time
         job_payload = {
@@ -318,35 +470,34 @@ class Village(base_squares.Square):
         if building_dict_key is None or building_data_key is None:
             raise ValueError("Incomplete job payload for building upgrade completion")
 
+        #settle accrual at the old rates and caps before they change
+        self._sync_resources()
+
         #same start code as above
         #built and designed for the 2 key building logic in possible_buildings
-        relevant_target = self.buildings[building_dict_key]
-        current_level = relevant_target[1]
-        upgradeable_check = relevant_target[2]
+        current_level = self._slot_level[building_dict_key]
 
         #this is imperfect, but should work fine - you can't ugprade if its not upgradeable
         #so not risk of overflow error
         #however, this is still an extant issue, as it uses the false flag.
         level_plusone = current_level + 1
-        old_entry, _ = self._get_building_entry(building_data_key, current_level)
-        if old_entry is None:
-            old_entry = [[0, 0, 0, 0], 0, 0, [0, 0, 0], 0]
-        new_entry, upgrade_possible = self._get_building_entry(building_data_key, level_plusone)
-        if new_entry is None:
+        old_record = BUILDINGS.record(building_data_key, current_level)
+        new_record = BUILDINGS.record(building_data_key, level_plusone)
+        if not new_record.exists:
             raise ValueError(f"Building data missing for {building_data_key} at level {level_plusone}")
+        upgrade_possible = new_record.upgradeable
 
         #applying the new values derived above for the upgraded building
-        old_vals = self.buildings[building_dict_key]
-        old_vals[2] = upgrade_possible
-        old_vals[1] = level_plusone
-        #potentially not needed, superflous step
-        self.buildings[building_dict_key] = old_vals
-        pop_delta = new_entry[2] - old_entry[2]
+        self._slot_upgradeable[building_dict_key] = upgrade_possible
+        self._slot_level[building_dict_key] = level_plusone
+        pop_delta = old_record.pop_delta
         self.population += pop_delta
-        self.culture_points_rate += new_entry[1] - old_entry[1]
+        self.culture_points_rate += old_record.cp_delta
         #buildings do not directly add yield in the current dataset, so only the population delta applies
         self.total_yield -= pop_delta
 
+        if building_data_key in BONUS_BUILDINGS:
+            self.invalidate_yield_cache(fields=False)
         if building_data_key in ("warehouse", "granary"):
             self.calculate_storage()
 
@@ -365,35 +516,31 @@ class Village(base_squares.Square):
         if upgrade_target is None:
             raise ValueError("Incomplete job payload for field upgrade completion")
 
-        field_data = self.fields[upgrade_target]
+        #settle accrual at the old rates before they change
+        self._sync_resources()
+
+        index = self._field_layout.index[upgrade_target]
         field_dict_key = upgrade_target[:4]
 
-        current_level = field_data.level
+        current_level = self._field_level[index]
 
         #used to check if the new building is upgradeable
         # ISSUE : for fields in non capital, this will eventually need to cap at 10 in some way
         level_plusone = current_level + 1
-        still_upgradeable = f_data.field_dict[field_dict_key][level_plusone][0]
-        if still_upgradeable[0] == False:
-            upgrade_possible = False
-        else:
-            upgrade_possible = True
+        old_record = FIELDS.record(field_dict_key, current_level)
+        new_record = FIELDS.record(field_dict_key, level_plusone)
 
         # used to update the villages building list with the new level and upgradeability
-        field_data.level = level_plusone
-        field_data.upgradeable = upgrade_possible
-        old_entry = f_data.field_dict[field_dict_key][current_level]
-        new_entry = f_data.field_dict[field_dict_key][level_plusone]
-        field_data.upgrade_cost = new_entry[0]
-        field_data.field_yield = new_entry[4]
-        field_data.cp = new_entry[1]
-        field_data.pop = new_entry[2]
-        field_data.upgrade_time = gen_func.sec_val(new_entry[3])
-        pop_delta = new_entry[2] - old_entry[2]
-        yield_delta = new_entry[4] - old_entry[4]
+        #cost, cp, pop and upgrade time are derived from the level, so only these are stored
+        self._field_level[index] = level_plusone
+        self._field_upgradeable[index] = new_record.upgradeable
+        self._field_yield[index] = new_record.value
+        pop_delta = old_record.pop_delta
+        yield_delta = new_record.value - old_record.value
         self.population += pop_delta
-        self.culture_points_rate += new_entry[1] - old_entry[1]
+        self.culture_points_rate += old_record.cp_delta
         self.total_yield += yield_delta - pop_delta
+        self.invalidate_yield_cache(buildings=False)
 
         #remove only the completed job
         self.remove_upgrade_job(job.get('id'))
@@ -405,77 +552,76 @@ class Village(base_squares.Square):
         total_pop = 0
         total_cp_rate = 0.0
         total_field_yield = 0.0
-        for field_id, field_obj in self.fields.items():
-            prefix = field_id[:4]
-            entry = f_data.field_dict[prefix][field_obj.level]
-            total_pop += entry[2]
-            total_cp_rate += entry[1]
-            total_field_yield += entry[4]
-        for building in self.buildings.values():
-            if building and len(building) > 1:
-                building_key = building[0]
-                level = building[1]
-                entry = b_data.building_dict[building_key][level]
-                total_pop += entry[2]
-                total_cp_rate += entry[1]
+        for resource, level in zip(self._field_layout.resources, self._field_level):
+            record = FIELDS.records[resource][level]
+            total_pop += record.pop
+            total_cp_rate += record.cp
+            total_field_yield += record.value
+        for slot, building_id in enumerate(self._slot_building):
+            if building_id >= 0:
+                record = BUILDINGS.records[building_id][self._slot_level[slot]]
+                total_pop += record.pop
+                total_cp_rate += record.cp
         self.population = total_pop
         self.culture_points_rate = float(total_cp_rate)
         self.total_yield = float(total_field_yield - total_pop)
 
     def _main_building_speed_modifier(self):
         """Return the current main building speed modifier."""
-        main_building = self.buildings.get(0)
-        if main_building and len(main_building) > 1:
-            current_level = main_building[1]
-            try:
-                modifier = b_data.building_dict['main_building'][current_level][4]
-                if isinstance(modifier, (int, float)):
-                    return modifier
-            except KeyError:
-                pass
+        if self._slot_building[0] >= 0:
+            modifier = BUILDINGS.records[MAIN_BUILDING_ID][self._slot_level[0]].value
+            if isinstance(modifier, (int, float)):
+                return modifier
         return 5  # [ISS-034] relies on the main building remaining in slot 0; revisit when slots become dynamic.
 
-    def _get_building_entry(self, building_name, level):
-        """Safely fetch building data and indicate if further upgrades are available."""
-        table = b_data.building_dict.get(building_name)
-        if table is None:
-            return None, False
-        entry = table.get(level)
-        next_entry = table.get(level + 1) if entry is not None else None
-        if entry is None:
-            # level 0 (or missing) entries are treated as having no data but may still be upgradeable.
-            if level == 0 and table.get(1) is not None:
-                return None, True
-            return None, False
-        upgradeable = next_entry is not None
-        return entry, upgradeable
-
     def _register_upgrade_job(self, job_type, payload, duration):
-        """Add a new job to the upgrade queue."""
+        """Add a new job to the upgrade queue, stamped with its absolute completion time."""
         self._upgrade_job_sequence += 1
         job_id = self._upgrade_job_sequence
+        completes_at = self._clock + int(duration)
         job = {
             'id': job_id,
             'type': job_type,
             'payload': payload,
-            'time_remaining': int(duration),
+            'completes_at': completes_at,
             'initial_duration': int(duration),
         }
         self.currently_upgrading[job_id] = job
+        heapq.heappush(self._job_heap, (completes_at, job_id))
         return job
 
-    def advance_upgrade_jobs(self, elapsed):
-        """Reduce remaining time on all jobs and return any that completed."""
-        if elapsed <= 0 or not self.currently_upgrading:
-            return []
-        completed = []
-        for job in list(self.currently_upgrading.values()):
-            remaining = job.get('time_remaining', 0)
-            updated = max(0, int(round(remaining - elapsed)))
-            job['time_remaining'] = updated
-            if updated <= 0:
-                completed.append(job)
-        return completed
+    def _discard_stale_jobs(self):
+        """Drop heap entries for jobs that were already removed from the queue."""
+        heap = self._job_heap
+        while heap and heap[0][1] not in self.currently_upgrading:
+            heapq.heappop(heap)
+
+    def due_upgrade_jobs(self, game_time):
+        """Return jobs that have completed by game_time, in the order they were queued.
+
+        The heap is only read: a job leaves it once the caller removes it from
+        currently_upgrading, so a due job that is not completed stays visible.
+        """
+        due = []
+        heap = self._job_heap
+        self._discard_stale_jobs()
+        #walk the heap from the root; a child is never due before its parent, so stop at late entries
+        pending = [0] if heap else []
+        while pending:
+            index = pending.pop()
+            completes_at, job_id = heap[index]
+            if completes_at > game_time:
+                continue
+            job = self.currently_upgrading.get(job_id)
+            if job is not None:
+                due.append(job)
+            pending.extend(child for child in (2 * index + 1, 2 * index + 2) if child < len(heap))
+        due.sort(key=lambda job: job['id'])
+        return due
+
+    def job_time_remaining(self, job):
+        """Seconds left on a queued job relative to the village clock."""
+        return max(0, job['completes_at'] - self._clock)
 
     def describe_job(self, job):
         """Return a human-readable label for logging purposes."""
@@ -502,10 +648,8 @@ class Village(base_squares.Square):
         self.currently_upgrading.pop(job_id, None)
 
     def next_upgrade_completion(self):
-        """Return the smallest positive time remaining among queued jobs."""
-        if not self.currently_upgrading:
+        """Return the time remaining until the earliest queued job completes."""
+        self._discard_stale_jobs()
+        if not self._job_heap:
             return None
-        remaining_times = [job['time_remaining'] for job in self.currently_upgrading.values() if job['time_remaining'] > 0]
-        if not remaining_times:
-            return 0
-        return min(remaining_times)
+        return max(0, self._job_heap[0][0] - self._clock)
@@ -0,0 +1,166 @@
+from collections.abc import Mapping, MutableMapping
+
+from Base_Data.compiled_tables import BUILDINGS, RESOURCE_NAMES
+from Classes.fields import FieldRecordMixin
+
+#Village keeps buildings and fields in flat arrays; the classes below expose them
+#through the original dict/list/Field attribute API so existing callers keep working.
+#Writes go through Village._write_layout so accrual, yields and storage stay in step.
+
+
+class BuildingSlot:
+    """List-like [name, level, upgradeable] view of one occupied building slot."""
+
+    __slots__ = ('_village', '_slot')
+
+    def __init__(self, village, slot):
+        self._village = village
+        self._slot = slot
+
+    def __len__(self):
+        return 3
+
+    def __getitem__(self, index):
+        village = self._village
+        slot = self._slot
+        if index == 0:
+            return BUILDINGS.names[village._slot_building[slot]]
+        if index == 1:
+            return village._slot_level[slot]
+        if index == 2:
+            return bool(village._slot_upgradeable[slot])
+        raise IndexError(index)
+
+    def __setitem__(self, index, value):
+        village = self._village
+        slot = self._slot
+        if index == 0:
+            write = (village._slot_building, slot, BUILDINGS.ids[value])
+        elif index == 1:
+            write = (village._slot_level, slot, value)
+        elif index == 2:
+            write = (village._slot_upgradeable, slot, bool(value))
+        else:
+            raise IndexError(index)
+        village._write_layout((write,), buildings=True)
+
+    def __iter__(self):
+        return iter((self[0], self[1], self[2]))
+
+    def __eq__(self, other):
+        try:
+            return list(self) == list(other)
+        except TypeError:
+            return NotImplemented
+
+    def __repr__(self):
+        return repr(list(self))
+
+    def copy(self):
+        return list(self)
+
+
+class BuildingSlots(MutableMapping):
+    """Slot -> '' or [name, level, upgradeable] view over a village's slot arrays."""
+
+    __slots__ = ('_village',)
+
+    def __init__(self, village):
+        self._village = village
+
+    def __getitem__(self, slot):
+        village = self._village
+        if not 0 <= slot < len(village._slot_building):
+            raise KeyError(slot)
+        if village._slot_building[slot] < 0:
+            return ''
+        return BuildingSlot(village, slot)
+
+    def __setitem__(self, slot, value):
+        village = self._village
+        if not 0 <= slot < len(village._slot_building):
+            raise KeyError(slot)
+        if not value:
+            building_id, level, upgradeable = -1, 0, False
+        else:
+            name, level, upgradeable = value
+            building_id = BUILDINGS.ids[name]
+        village._write_layout(
+            (
+                (village._slot_building, slot, building_id),
+                (village._slot_level, slot, level),
+                (village._slot_upgradeable, slot, bool(upgradeable)),
+            ),
+            buildings=True,
+        )
+
+    def __delitem__(self, slot):
+        raise TypeError("building slots are fixed; assign '' to clear one")
+
+    def __iter__(self):
+        return iter(range(len(self._village._slot_building)))
+
+    def __len__(self):
+        return len(self._village._slot_building)
+
+
+class FieldView(FieldRecordMixin):
+    """Field-compatible view of one entry in a village's field arrays."""
+
+    __slots__ = ('_village', '_index')
+
+    def __init__(self, village, index):
+        self._village = village
+        self._index = index
+
+    @property
+    def type_field(self):
+        return RESOURCE_NAMES[self._village._field_layout.resources[self._index]]
+
+    @property
+    def level(self):
+        return self._village._field_level[self._index]
+
+    @level.setter
+    def level(self, value):
+        village = self._village
+        village._write_layout(((village._field_level, self._index, value),), buildings=False)
+
+    @property
+    def upgradeable(self):
+        return bool(self._village._field_upgradeable[self._index])
+
+    @upgradeable.setter
+    def upgradeable(self, value):
+        village = self._village
+        village._write_layout(((village._field_upgradeable, self._index, bool(value)),), buildings=False)
+
+    @property
+    def field_yield(self):
+        return self._village._field_yield[self._index]
+
+    @field_yield.setter
+    def field_yield(self, value):
+        village = self._village
+        village._write_layout(((village._field_yield, self._index, value),), buildings=False)
+
+
+class FieldMap(Mapping):
+    """Field id -> FieldView mapping over a village's field arrays."""
+
+    __slots__ = ('_village',)
+
+    def __init__(self, village):
+        self._village = village
+
+    def __getitem__(self, field_id):
+        return FieldView(self._village, self._village._field_layout.index[field_id])
+
+    def __iter__(self):
+        return iter(self._village._field_layout.names)
+
+    def __len__(self):
+        return len(self._village._field_layout.names)
+
+    def __contains__(self, field_id):
+        return field_id in self._village._field_layout.index
@@ -0,0 +1,167 @@
+from collections.abc import MutableMapping
+
+import numpy as np
+
+import Classes.base_squares as base_squares
+import Classes.habitable as habitable
+import Classes.oasis as oasis
+
+#tile types that can report scheduled work through next_update()
+PASSIVE_TILE_TYPES = ('habitable', 'oasis')
+
+#codes stored in the tile_type array
+TILE_WILDERNESS = 0
+TILE_OASIS = 1
+TILE_HABITABLE = 2
+TILE_TYPES = ('wilderness', 'oasis', 'habitable')
+#field compositions a habitable tile can have, indexed by the hab_type array
+HAB_TYPES = ((1, 1, 1, 15), (3, 3, 3, 9), (4, 3, 4, 7), (4, 4, 3, 7), (3, 4, 4, 7), (4, 4, 4, 6))
+#oasis resources, indexed by the oasis_primary array
+OASIS_RESOURCES = ('wood', 'clay', 'iron', 'crop')
+
+
+class WorldMap(MutableMapping):
+    """Coordinate -> tile mapping that also indexes tiles with pending events.
+
+    Generated maps keep the terrain as NumPy arrays (tile type, field
+    composition, oasis resources) and build tile objects on demand. A built
+    tile is stored alongside the assigned ones (villages) on first read, so
+    repeated reads return the same object and changes made to it persist;
+    tiles that are never read cost nothing beyond their array entries.
+
+    Tiles only sit in the passive registry while next_update() has something
+    to report (e.g. oasis regeneration), so inert tiles cost nothing per tick.
+    Generated terrain signs every habitable and oasis key up once; the first
+    refresh probes each tile and drops those with nothing pending without
+    keeping the probe object.
+    """
+
+    def __init__(self, radius=None, tile_type=None, hab_type=None, oasis_primary=None, oasis_crop_bonus=None):
+        self.radius = radius
+        self.tile_type = tile_type
+        self.hab_type = hab_type
+        self.oasis_primary = oasis_primary
+        self.oasis_crop_bonus = oasis_crop_bonus
+        #tiles that exist as objects: founded villages plus any terrain tile read so far
+        self._tiles = {}
+        #dict rather than set so iteration order stays deterministic
+        self.active_passives = {}
+        #village placement buckets, built on first use by village_creation
+        self.placement_index = None
+        if tile_type is not None:
+            self._register_terrain_passives()
+
+    def _register_terrain_passives(self):
+        #x-major like iteration, so registry order matches a full scan of the map
+        passive_codes = [TILE_TYPES.index(name) for name in PASSIVE_TILE_TYPES]
+        rows, cols = np.nonzero(np.isin(self.tile_type, passive_codes))
+        radius = self.radius
+        for key in zip((rows - radius).tolist(), (cols - radius).tolist()):
+            self.active_passives[key] = None
+
+    def _grid_index(self, key):
+        if self.radius is None or not isinstance(key, tuple) or len(key) != 2:
+            return None
+        radius = self.radius
+        x_val, y_val = key
+        if -radius <= x_val <= radius and -radius <= y_val <= radius:
+            return x_val + radius, y_val + radius
+        return None
+
+    def _build_tile(self, key, row, col):
+        code = self.tile_type[row, col]
+        if code == TILE_HABITABLE:
+            return habitable.Habitable(key, type_hab=list(HAB_TYPES[self.hab_type[row, col]]))
+        if code == TILE_OASIS:
+            resources = [OASIS_RESOURCES[self.oasis_primary[row, col]]]
+            if self.oasis_crop_bonus[row, col]:
+                resources.append('crop')
+            return oasis.Oasis(key, resources=resources)
+        return base_squares.Square(key, type_square='wilderness')
+
+    def __getitem__(self, key):
+        tile = self._tiles.get(key)
+        if tile is not None:
+            return tile
+        index = self._grid_index(key)
+        if index is None:
+            raise KeyError(key)
+        #kept from now on so the caller's object stays the map's tile; not a settlement,
+        #so the placement index is left alone
+        tile = self._build_tile(key, *index)
+        self._tiles[key] = tile
+        return tile
+
+    def __setitem__(self, key, value):
+        self._tiles[key] = value
+        #whatever now occupies the tile, it is no longer free to settle
+        if self.placement_index is not None:
+            self.placement_index.discard(key)
+
+    def __delitem__(self, key):
+        del self._tiles[key]
+
+    def __contains__(self, key):
+        return key in self._tiles or self._grid_index(key) is not None
+
+    def __iter__(self):
+        if self.radius is not None:
+            span = range(-self.radius, self.radius + 1)
+            for x_val in span:
+                for y_val in span:
+                    yield (x_val, y_val)
+        for key in self._tiles:
+            if self._grid_index(key) is None:
+                yield key
+
+    def __len__(self):
+        size = 0 if self.radius is None else (2 * self.radius + 1) ** 2
+        return size + sum(1 for key in self._tiles if self._grid_index(key) is None)
+
+    def habitable_keys(self, type_hab):
+        """Keys of unsettled habitable tiles with the given field composition, in map order."""
+        type_hab = list(type_hab)
+        keys = []
+        if self.radius is not None and tuple(type_hab) in HAB_TYPES:
+            mask = (self.tile_type == TILE_HABITABLE) & (self.hab_type == HAB_TYPES.index(tuple(type_hab)))
+            rows, cols = np.nonzero(mask)
+            keys = list(zip((rows - self.radius).tolist(), (cols - self.radius).tolist()))
+        tiles = self._tiles
+        if tiles:
+            keys = [key for key in keys if key not in tiles]
+            off_grid = []
+            for key, tile in tiles.items():
+                if getattr(tile, 'type_square', None) == 'habitable' and getattr(tile, 'type_hab', None) == type_hab:
+                    (keys if self._grid_index(key) is not None else off_grid).append(key)
+            #grid iteration is x-major then y, which is plain tuple order
+            keys.sort()
+            keys.extend(off_grid)
+        return keys
+
+    def register_passive(self, key):
+        """Sign a tile up for per-tick next_update() checks."""
+        self.active_passives[key] = None
+
+    def unregister_passive(self, key):
+        """Sign a tile off once it no longer has a pending event."""
+        self.active_passives.pop(key, None)
+
+    def refresh_passive(self, key):
+        """Re-evaluate a single tile and update its registry membership."""
+        tile = self._tiles.get(key)
+        stored = tile is not None
+        if not stored:
+            index = self._grid_index(key)
+            #probe a terrain tile without storing it unless it turns out to have work pending
+            tile = self._build_tile(key, *index) if index is not None else None
+        if tile is None or getattr(tile, 'type_square', None) not in PASSIVE_TILE_TYPES:
+            self.unregister_passive(key)
+            return None
+        holder = tile.next_update()
+        if holder is None or holder is True or holder is False:
+            self.unregister_passive(key)
+            return None
+        if not stored:
+            self._tiles[key] = tile
+        self.register_passive(key)
+        return holder
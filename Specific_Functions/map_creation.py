@@ -1,16 +1,45 @@
-import Classes.base_squares as base_squares
+import random
+
+import numpy as np
+
 import Classes.habitable as habitable
 import Classes.oasis as oasis
+from Classes.world_map import WorldMap, TILE_WILDERNESS, TILE_OASIS, TILE_HABITABLE
 
-def map_creation(map_radius):
-    map_dict = {}
-    for x in range((map_radius*-1), map_radius+1):
-        for y in range((map_radius*-1), map_radius+1):
-            locval = (x, y)
-            map_dict[locval] = base_squares.Square(locval)
-    return map_dict
+#bump whenever the generator below changes what a given seed produces
+MAP_GENERATOR_VERSION = 1
+
+
+def roll_terrain(map_radius, seed):
+    """Roll tile type, field composition and oasis resources as (2r+1, 2r+1) int8 arrays."""
+    rng = np.random.default_rng(seed)
+    shape = (2 * map_radius + 1, 2 * map_radius + 1)
+
+    #same 0-100 rolls and thresholds as Square, Habitable and Oasis use
+    type_roll = rng.integers(0, 101, size=shape)
+    tile_type = np.full(shape, TILE_HABITABLE, dtype=np.int8)
+    tile_type[type_roll < 30] = TILE_OASIS
+    tile_type[type_roll < 10] = TILE_WILDERNESS
+    hab_type = np.searchsorted([10, 25, 35, 45, 55], rng.integers(0, 101, size=shape), side='right').astype(np.int8)
+    oasis_primary = np.searchsorted([25, 50, 75], rng.integers(0, 101, size=shape), side='right').astype(np.int8)
+    oasis_crop_bonus = (rng.integers(0, 101, size=shape) > 80).astype(np.int8)
+    return tile_type, hab_type, oasis_primary, oasis_crop_bonus
+
+
+def map_creation(map_radius, seed=None):
+    #terrain is rolled as whole arrays; tile objects are only built when read or settled
+    #without an explicit seed one is drawn from the (already seeded) global random
+    if seed is None:
+        seed = random.getrandbits(64)
+    return WorldMap(map_radius, *roll_terrain(map_radius, seed))
 
 def modify_base_map(map_dict):
+    #generated WorldMaps already carry resolved tile types and register their passive
+    #terrain; probe those once so only tiles with a pending event stay registered
+    if getattr(map_dict, 'tile_type', None) is not None:
+        for key in list(map_dict.active_passives):
+            map_dict.refresh_passive(key)
+        return map_dict
     for key in map_dict:
         value = map_dict[key]
         if value.type_square == 'wilderness':
@@ -22,6 +51,7 @@ def modify_base_map(map_dict):
         if value.type_square == 'oasis':
             new_obj = oasis.Oasis(key)
             map_dict[key] = new_obj
+        #tiles only join the passive registry when they have a pending event
+        if hasattr(map_dict, 'refresh_passive'):
+            map_dict.refresh_passive(key)
     return map_dict
-
-
@@ -53,6 +53,8 @@ def populate_players_with_villages(map_dict, num_players, rng_holder=None):
     player_dict = populate_players(num_players)
     quadrant_options = [('+', '+'), ('+', '-'), ('-', '+'), ('-', '-')]
     failed_players = []
+    #bucket the candidate tiles once rather than rescanning the map per player
+    placement_index = village_creation.placement_index_for(map_dict)
     for key in list(player_dict.keys()):
         active_player = player_dict[key]
         if active_player.quadrant is None:
@@ -66,6 +68,7 @@ def populate_players_with_villages(map_dict, num_players, rng_holder=None):
                 active_player.name,
                 active_player.quadrant,
                 rng_holder,
+                placement_index=placement_index,
             )
             created_village = map_dict[village_key]
             created_village.location = village_key
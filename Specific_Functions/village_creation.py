@@ -1,6 +1,8 @@
 import Classes.village as village
 import random
 
+TARGET_TYPE_HAB = [4, 4, 4, 6]
+
 
 def _parse_location(location):
     # accepts either string like "[0, '/', 25]" or list [0, '/', 25]
@@ -46,66 +48,115 @@ def _interpret_quadrant(quadrant, rng_holder):
     return split_vals[0], split_vals[1]
 
 
-def create_village(map_dict, owner, quadrant=None, rng_holder=None):
+def _target_tile_keys(map_dict):
+    # keys of unsettled 4,4,4,6 tiles; generated maps answer from their arrays without building tiles
+    if hasattr(map_dict, "habitable_keys"):
+        return map_dict.habitable_keys(TARGET_TYPE_HAB)
+    keys = []
+    for key in map_dict:
+        tile = map_dict[key]
+        if tile.type_square == "habitable" and tile.type_hab == TARGET_TYPE_HAB:
+            keys.append(key)
+    return keys
+
+
+#(label, max distance from the origin, placement weight); the last band is open-ended
+DISTANCE_BANDS = (
+    ("inner", 60, 46),
+    ("mid_inner", 100, 40),
+    ("mid", 140, 10),
+    ("mid_outer", 180, 5),
+    ("outer", None, 1),
+)
+EXCLUSION_RADIUS = 20
+
+
+class PlacementIndex:
+    """Unsettled 4,4,4,6 tiles outside the exclusion zone, bucketed by quadrant and distance band.
+
+    Built once per map; settling a tile removes it in O(1) by swapping the
+    last key of its bucket into its place.
+    """
+
+    def __init__(self, map_dict):
+        self._buckets = {}
+        self._positions = {}
+        self._quadrant_totals = {}
+        for key in _target_tile_keys(map_dict):
+            coords = key if isinstance(key, tuple) else _parse_location(key)
+            x_val = coords[0]
+            y_val = coords[1]
+
+            # exclusion zone
+            if -EXCLUSION_RADIUS <= x_val <= EXCLUSION_RADIUS or -EXCLUSION_RADIUS <= y_val <= EXCLUSION_RADIUS:
+                continue
+
+            quadrant = ("+" if x_val >= 0 else "-", "+" if y_val >= 0 else "-")
+            distance_val = max(abs(x_val), abs(y_val))
+            for label, limit, _ in DISTANCE_BANDS:
+                if limit is None or distance_val <= limit:
+                    break
+            bucket_key = (quadrant, label)
+            bucket = self._buckets.setdefault(bucket_key, [])
+            self._positions[key] = (bucket_key, len(bucket))
+            bucket.append(key)
+            self._quadrant_totals[quadrant] = self._quadrant_totals.get(quadrant, 0) + 1
+
+    def __contains__(self, key):
+        return key in self._positions
+
+    def __len__(self):
+        return len(self._positions)
+
+    def quadrant_total(self, quadrant):
+        """Eligible tiles the quadrant started with, settled or not."""
+        return self._quadrant_totals.get(tuple(quadrant), 0)
+
+    def bands(self, quadrant):
+        """(label, weight, keys) for each non-empty band in the quadrant, inner first."""
+        quadrant = tuple(quadrant)
+        available = []
+        for label, _, weight in DISTANCE_BANDS:
+            bucket = self._buckets.get((quadrant, label))
+            if bucket:
+                available.append((label, weight, bucket))
+        return available
+
+    def discard(self, key):
+        """Drop a settled tile from its bucket."""
+        position = self._positions.pop(key, None)
+        if position is None:
+            return
+        bucket_key, index = position
+        bucket = self._buckets[bucket_key]
+        last = bucket.pop()
+        if last != key:
+            bucket[index] = last
+            self._positions[last] = (bucket_key, index)
+
+
+def placement_index_for(map_dict):
+    # WorldMaps keep their index so later settlements reuse it; plain dicts get a fresh one
+    index = getattr(map_dict, "placement_index", None)
+    if index is None:
+        index = PlacementIndex(map_dict)
+        if hasattr(map_dict, "placement_index"):
+            map_dict.placement_index = index
+    return index
+
+
+def create_village(map_dict, owner, quadrant=None, rng_holder=None, placement_index=None):
     if rng_holder is None:
         rng_holder = random
+    if placement_index is None:
+        placement_index = placement_index_for(map_dict)
 
     chosen_quadrant = _interpret_quadrant(quadrant, rng_holder)
 
-    inner_tiles = []
-    mid_inner_tiles = []
-    mid_tiles = []
-    mid_outer_tiles = []
-    outer_tiles = []
-    total_target_tiles = 0
-
-    for key in map_dict:
-        tile = map_dict[key]
-        if tile.type_square != "habitable":
-            continue
-        if tile.type_hab != [4, 4, 4, 6]:
-            continue
-        coords = tile.location if isinstance(tile.location, tuple) else tile.location if isinstance(tile.location, tuple) else _parse_location(tile.location)
-        x_val = coords[0]
-        y_val = coords[1]
-
-        # exclusion zone
-        if -20 <= x_val <= 20 or -20 <= y_val <= 20:
-            continue
-
-        # quadrant filter
-        x_sign = "+" if x_val >= 0 else "-"
-        y_sign = "+" if y_val >= 0 else "-"
-        if x_sign != chosen_quadrant[0] or y_sign != chosen_quadrant[1]:
-            continue
-
-        total_target_tiles += 1
-        distance_val = max(abs(x_val), abs(y_val))
-        if distance_val <= 60:
-            inner_tiles.append(key)
-        elif distance_val <= 100:
-            mid_inner_tiles.append(key)
-        elif distance_val <= 140:
-            mid_tiles.append(key)
-        elif distance_val <= 180:
-            mid_outer_tiles.append(key)
-        else:
-            outer_tiles.append(key)
-
-    available_tiles = []
-    if inner_tiles:
-        available_tiles.append(("inner", 46, inner_tiles))
-    if mid_inner_tiles:
-        available_tiles.append(("mid_inner", 40, mid_inner_tiles))
-    if mid_tiles:
-        available_tiles.append(("mid", 10, mid_tiles))
-    if mid_outer_tiles:
-        available_tiles.append(("mid_outer", 5, mid_outer_tiles))
-    if outer_tiles:
-        available_tiles.append(("outer", 1, outer_tiles))
+    available_tiles = placement_index.bands(chosen_quadrant)
 
     if not available_tiles:
-        if total_target_tiles == 0:
+        if placement_index.quadrant_total(chosen_quadrant) == 0:
             print("No available 4,4,4,6 tiles remain outside the exclusion zone.")
         else:
             print("All available tiles in the chosen quadrant have been settled already.")
@@ -137,5 +188,6 @@ def create_village(map_dict, owner, quadrant=None, rng_holder=None):
         owner=owner,
     )
     map_dict[selected_key] = new_village
+    placement_index.discard(selected_key)
 
     return selected_key
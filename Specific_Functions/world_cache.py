@@ -0,0 +1,94 @@
+"""On-disk cache of generated terrain keyed by (seed, radius, generator fingerprint).
+
+Terrain is stored as a single stacked ``int8`` ``.npy`` file and loaded with
+``mmap_mode='r'``, so repeated sweeps over the same seed and radius skip
+generation entirely. The fingerprint hashes the generator source and its
+lookup tables, so editing the generator invalidates old entries without a
+manual version bump.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import inspect
+import os
+import uuid
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+import Classes.world_map as world_map
+from Classes.world_map import WorldMap
+from Specific_Functions import map_creation as map_gen
+
+WORLD_CACHE_DIR = Path("simulation_logs") / "world_cache"
+_LAYERS = 4
+
+
+def _generator_fingerprint() -> str:
+    source = "\n".join(
+        [
+            str(map_gen.MAP_GENERATOR_VERSION),
+            inspect.getsource(map_gen.roll_terrain),
+            repr((world_map.TILE_TYPES, world_map.HAB_TYPES, world_map.OASIS_RESOURCES)),
+        ]
+    )
+    return hashlib.sha1(source.encode("utf-8")).hexdigest()[:12]
+
+
+GENERATOR_FINGERPRINT = _generator_fingerprint()
+
+
+def cache_path(seed: int, map_radius: int, cache_dir: Optional[Path] = None) -> Path:
+    """Location of the cache entry for a seed and radius under the current generator."""
+    cache_dir = Path(cache_dir) if cache_dir is not None else WORLD_CACHE_DIR
+    return cache_dir / f"world_{seed}_{map_radius}_{GENERATOR_FINGERPRINT}.npy"
+
+
+def _load(path: Path, map_radius: int) -> Optional[np.ndarray]:
+    side = 2 * map_radius + 1
+    try:
+        terrain = np.load(path, mmap_mode="r")
+    except (OSError, ValueError):
+        return None
+    if terrain.shape != (_LAYERS, side, side) or terrain.dtype != np.int8:
+        return None
+    return terrain
+
+
+def _store(path: Path, terrain: np.ndarray, seed: int, map_radius: int) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    #write beside the target and rename so concurrent runs never read a partial file;
+    #the name is unique per call, so threads of one process cannot share a temp file either
+    tmp_path = path.with_name(f"{path.stem}.{uuid.uuid4().hex}.tmp.npy")
+    try:
+        np.save(tmp_path, terrain)
+        os.replace(tmp_path, path)
+    except OSError:
+        #the cache is best effort: e.g. on Windows the target may be mapped by another reader
+        tmp_path.unlink(missing_ok=True)
+        return
+    #entries for the same seed/radius from older generators can never be hit again
+    for stale in path.parent.glob(f"world_{seed}_{map_radius}_*.npy"):
+        if stale != path and not stale.name.endswith(".tmp.npy"):
+            try:
+                stale.unlink(missing_ok=True)
+            except OSError:
+                #still memory-mapped elsewhere (Windows); a later store will retry
+                pass
+
+
+def cached_map_creation(map_radius: int, seed: Optional[int], cache_dir: Optional[Path] = None) -> WorldMap:
+    """Return the world for (seed, radius), generating and caching it on a miss."""
+    if seed is None:
+        return map_gen.map_creation(map_radius)
+    path = cache_path(seed, map_radius, cache_dir)
+    terrain = _load(path, map_radius) if path.exists() else None
+    if terrain is None:
+        terrain = np.stack(map_gen.roll_terrain(map_radius, seed))
+        _store(path, terrain, seed, map_radius)
+    return WorldMap(map_radius, *terrain)
+
+
+__all__ = ["WORLD_CACHE_DIR", "GENERATOR_FINGERPRINT", "cache_path", "cached_map_creation"]
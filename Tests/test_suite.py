@@ -10,22 +10,35 @@ if __package__ in (None, ""):
 
 import random
 import json
+import tempfile
+import pickle
+import weakref
+import gc
 from unittest import mock
 
 from master_controller.simulation_constraints import create_simulation_constraints
 from master_controller import game_rules
 from Specific_Functions.map_creation import map_creation, modify_base_map
+from Specific_Functions import village_creation
+from Specific_Functions import world_cache
 from Specific_Functions.populate_players import (
     populate_players,
     populate_players_with_villages,
 )
+from Classes import world_map
+from Classes import oasis
 from Classes.village import Village
 from Classes.AI_Classes.generic_running_mechanism import base_controller
 from Generic_Functions.generic_functions import sec_val
 from Base_Data import Fields_Data as f_data
 from Base_Data import Building_Data as b_data
+from Base_Data.compiled_tables import BUILDINGS, FIELDS
 from simulation_runner import game_state_progression as progress_state
 from simulation_runner import run_logger
+from simulation_runner import run_ids
+from simulation_runner import background_writer
+from simulation_runner.snapshot_store import IntervalAggregates, SnapshotStore
+from simulation_runner import periodic_monitor
 from simulation_runner import run_simulation as run_sim
 
 
@@ -90,6 +103,81 @@ def test_map_dimensions() -> Tuple[bool, str]:
     return True, "Tile count matches expected grid size."
 
 
+def test_map_generation_is_array_backed() -> Tuple[bool, str]:
+    """Generated maps should be reproducible per seed and hold no tile objects until settled."""
+    first = map_creation(40, seed=77)
+    second = map_creation(40, seed=77)
+    other = map_creation(40, seed=78)
+    if _summarise_map(first) != _summarise_map(second):
+        return False, "Explicit seeds do not reproduce the same map."
+    if (first.tile_type == other.tile_type).all():
+        return False, "Different seeds produced identical terrain."
+    #other has only had its arrays compared, so no tile should have been built yet
+    if other._tiles:
+        return False, f"Map generation materialised {len(other._tiles)} tile objects."
+
+    populate_players_with_villages(other, 2, rng_holder=random.Random(7))
+    if len(other._tiles) != 2 or len(other) != 81 * 81:
+        return False, "Only founded villages should be stored as tile objects."
+
+    rows, cols = (other.tile_type == world_map.TILE_OASIS).nonzero()
+    oasis_key = (int(rows[0]) - other.radius, int(cols[0]) - other.radius)
+    if other[oasis_key] is not other[oasis_key]:
+        return False, "Repeated reads of an unsettled tile returned different objects."
+    other[oasis_key].resources = ["clay"]
+    if other[oasis_key].resources != ["clay"]:
+        return False, "A change to a tile read from the map was lost on the next read."
+    return True, "Seeded terrain arrays reproduce and tiles are built lazily."
+
+
+def test_world_cache_round_trips_terrain() -> Tuple[bool, str]:
+    """Cached worlds should match fresh generation and drop entries from older generators."""
+    with tempfile.TemporaryDirectory() as cache_dir:
+        stale = Path(cache_dir) / "world_77_40_oldgenerator.npy"
+        stale.write_bytes(b"not a world")
+        fresh = world_cache.cached_map_creation(40, 77, cache_dir)
+        path = world_cache.cache_path(77, 40, cache_dir)
+        if not path.exists() or stale.exists():
+            return False, "Cache entry was not written or the stale entry survived."
+        cached = world_cache.cached_map_creation(40, 77, cache_dir)
+        if not isinstance(cached.tile_type, __import__("numpy").memmap):
+            return False, "Cache hit did not memory-map the terrain."
+        if _summarise_map(cached) != _summarise_map(map_creation(40, seed=77)) or _summarise_map(fresh) != _summarise_map(cached):
+            return False, "Cached terrain differs from fresh generation."
+        path.write_bytes(b"truncated")
+        if _summarise_map(world_cache.cached_map_creation(40, 77, cache_dir)) != _summarise_map(fresh):
+            return False, "Corrupt cache entry was not regenerated."
+
+    import threading
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        #threads of one process building the same world must not clobber each other's temp file
+        terrain = __import__("numpy").stack(world_cache.map_gen.roll_terrain(20, 5))
+        path = world_cache.cache_path(5, 20, cache_dir)
+        errors: List[BaseException] = []
+
+        def store():
+            try:
+                world_cache._store(path, terrain, 5, 20)
+            except Exception as exc:
+                errors.append(exc)
+
+        threads = [threading.Thread(target=store) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        leftovers = [entry.name for entry in Path(cache_dir).iterdir() if entry != path]
+        if errors or leftovers or not (__import__("numpy").load(path) == terrain).all():
+            return False, f"Concurrent stores failed: {errors} {leftovers}"
+        #a stale entry that cannot be removed (mapped elsewhere on Windows) is left for later
+        stale = Path(cache_dir) / "world_5_20_oldgenerator.npy"
+        stale.write_bytes(b"still mapped")
+        with mock.patch.object(Path, "unlink", side_effect=PermissionError("in use")):
+            world_cache._store(path, terrain, 5, 20)
+    return True, "World cache reproduces generated terrain and invalidates stale entries."
+
+
 def test_habitable_fields_match_blueprint() -> Tuple[bool, str]:
     """Check each habitable tile instantiates the expected field composition."""
     radius, _ = create_simulation_constraints(rng_seed=321, map_radius=2)
@@ -112,6 +200,30 @@ def test_habitable_fields_match_blueprint() -> Tuple[bool, str]:
     return True, "All habitable tiles expose field counts matching their blueprint."
 
 
+def test_habitable_tiles_share_field_templates() -> Tuple[bool, str]:
+    """Unsettled tiles should share read-only fields; founding a village copies them."""
+    world = _build_world(40, seed=515)
+    key = village_creation.placement_index_for(world).bands(("+", "+"))[0][2][0]
+    template = world[key].field_list_dict
+    if world[key].field_list_dict is not template:
+        return False, "Tiles with the same composition built separate field dicts."
+    try:
+        template["Wood1"].level = 3
+    except AttributeError:
+        pass
+    else:
+        return False, "Shared field template accepted a write."
+
+    village_creation.create_village(world, "p1", quadrant=("+", "+"), rng_holder=random.Random(3))
+    village_obj = next(tile for tile in world._tiles.values() if isinstance(tile, Village))
+    village_obj.stored = [1_000_000, 1_000_000, 1_000_000, 1_000_000]
+    village_obj.upgrade_field("Wood1")
+    village_obj.field_upgraded(next(iter(village_obj.currently_upgrading.values())))
+    if village_obj.fields["Wood1"].level != 1 or template["Wood1"].level != 0:
+        return False, "Village field upgrade leaked into the shared template."
+    return True, "Habitable tiles share immutable field templates until a village is founded."
+
+
 def test_oasis_storage_matches_resources() -> Tuple[bool, str]:
     """Ensure oasis storage values align with advertised resources."""
     radius, _ = create_simulation_constraints(rng_seed=555, map_radius=2)
@@ -180,6 +292,38 @@ def test_populate_players_with_villages_assigns_tiles() -> Tuple[bool, str]:
     return True, "populate_players_with_villages attaches one unique Village object per player."
 
 
+def test_placement_index_buckets_and_discards() -> Tuple[bool, str]:
+    """Placement index should bucket eligible tiles and drop them once settled."""
+    world = _build_world(80, seed=203)
+    index = village_creation.placement_index_for(world)
+    if world.placement_index is not index:
+        return False, "WorldMap did not keep its placement index."
+    expected = [
+        key for key in world.habitable_keys([4, 4, 4, 6])
+        if abs(key[0]) > 20 and abs(key[1]) > 20
+    ]
+    if len(index) != len(expected):
+        return False, f"Index holds {len(index)} tiles, expected {len(expected)}"
+
+    bands = index.bands(("+", "+"))
+    if [label for label, _, _ in bands] != ["inner", "mid_inner"]:
+        return False, f"Unexpected bands for a radius-80 map: {[label for label, _, _ in bands]}"
+    bucket = bands[0][2]
+    first, size = bucket[0], len(bucket)
+    index.discard(first)
+    if first in index or first in bucket or len(bucket) != size - 1:
+        return False, "Discarded tile is still indexed."
+    if any(index._positions[key][1] != pos for pos, key in enumerate(bucket)):
+        return False, "Bucket positions drifted after a swap-remove."
+
+    key = bucket[0]
+    populate_players_with_villages(world, 1, rng_holder=random.Random(1))
+    world[key] = world[key]
+    if key in index:
+        return False, "Assigning into the map did not remove the tile from the index."
+    return True, "Placement index buckets eligible tiles and removes settled ones."
+
+
 def test_populate_players_with_villages_handles_saturation() -> Tuple[bool, str]:
     """Verify the helper reports failure when no eligible tiles exist."""
     world = _build_world(20, seed=123)
@@ -258,8 +402,8 @@ def test_base_controller_triggers_field_upgrade() -> Tuple[bool, str]:
     payload = job.get("payload", {})
     if payload.get("field_id") != field_id:
         return False, f"Queued field mismatch: {payload}"
-    if job.get("time_remaining") != expected_wait:
-        return False, f"Job timer mismatch: expected {expected_wait}, saw {job.get('time_remaining')}"
+    if village_obj.job_time_remaining(job) != expected_wait or job.get("completes_at") != 10 + expected_wait:
+        return False, f"Job timer mismatch: expected {expected_wait}, saw {village_obj.job_time_remaining(job)}"
     for idx in range(4):
         if village_obj.stored[idx] != initial_stock[idx] - upgrade_cost[idx]:
             return False, "Upgrade cost was not deducted correctly."
@@ -281,6 +425,30 @@ def test_base_controller_triggers_field_upgrade() -> Tuple[bool, str]:
     return True, "Controller triggers field upgrade and schedules next wake correctly."
 
 
+def test_job_queue_uses_absolute_completion_times() -> Tuple[bool, str]:
+    """Queued jobs should complete by absolute time without rewriting timers."""
+    world = _build_world(40, seed=252)
+    players = populate_players_with_villages(world, 1, rng_holder=random.Random(34))
+    village_obj = next(iter(players.values())).villages[0]
+    village_obj.advance_clock(100)
+    long_job = village_obj._register_upgrade_job("field", {"field_id": "Wood1"}, 500)
+    short_job = village_obj._register_upgrade_job("field", {"field_id": "Clay1"}, 200)
+
+    if village_obj.next_upgrade_completion() != 200:
+        return False, f"Expected next completion in 200s, saw {village_obj.next_upgrade_completion()}"
+    village_obj.advance_clock(300)
+    due = village_obj.due_upgrade_jobs(300)
+    if due != [short_job] or long_job.get("completes_at") != 600:
+        return False, f"Unexpected completed jobs at t=300: {due}"
+    #a due job the caller does not complete must still be reported and still drive the wake-up
+    if village_obj.due_upgrade_jobs(300) != [short_job] or village_obj.next_upgrade_completion() != 0:
+        return False, "A due job that was not completed dropped out of the queue."
+    village_obj.remove_upgrade_job(short_job["id"])
+    if village_obj.next_upgrade_completion() != 300:
+        return False, f"Expected remaining job to finish in 300s, saw {village_obj.next_upgrade_completion()}"
+    return True, "Job queue completes jobs by absolute time."
+
+
 def test_culture_points_accumulate() -> Tuple[bool, str]:
     """Ensure culture points accumulate based on rate and elapsed time."""
     world = _build_world(40, seed=410)
@@ -308,14 +476,40 @@ def test_culture_points_accumulate() -> Tuple[bool, str]:
     return True, "Culture points accumulate according to rate and elapsed time."
 
 
+def test_idle_controller_wakes_when_affordable() -> Tuple[bool, str]:
+    """Idle controllers should sleep until the cheapest candidate is affordable."""
+    world = _build_world(40, seed=411)
+    players = populate_players_with_villages(world, 1, rng_holder=random.Random(46))
+    controller = next(iter(players.values()))
+    village_obj = controller.villages[0]
+
+    class IdleAI:
+        def derive_next_action(self):
+            return None
+
+    controller.ai_controller = IdleAI()
+    controller.next_action_due_at = 0
+    village_obj.stored = [0, 0, 0, 0]
+    if village_obj.time_until_affordable([10 ** 9, 0, 0, 0]) is not None:
+        return False, "A cost above the storage cap should never be affordable."
+
+    expected = village_obj.next_affordable_in()
+    if expected is None or expected >= 20000:
+        return False, f"Expected a candidate to unlock before the idle fallback, saw {expected}"
+    remaining = controller.will_i_act(current_time=0, global_last_active=0)
+    if remaining != expected:
+        return False, f"Controller slept {remaining}s instead of {expected}s"
+    if village_obj.possible_buildings() != {'buildings': [], 'fields': []}:
+        return False, "Nothing should be affordable before the scheduled wake-up."
+    village_obj.advance_clock(expected)
+    affordable = village_obj.possible_buildings()
+    if not (affordable['buildings'] or affordable['fields']):
+        return False, "No candidate became affordable at the scheduled wake-up."
+    return True, "Idle controllers wake exactly when an upgrade becomes affordable."
+
+
 def test_game_state_progression_tick_advances() -> Tuple[bool, str]:
     """Validate game_state_progression advances by the minimum scheduled delay."""
-    progress_state.game_counter = 0
-    progress_state.turn_counter = 0
-    progress_state.time_elapsed = 0
-    progress_state.time_will_elapse = 3
-    progress_state.global_last_active = 0
-
     class PassiveTile:
         type_square = "habitable"
         def next_update(self):
@@ -332,20 +526,201 @@ def test_game_state_progression_tick_advances() -> Tuple[bool, str]:
     map_dict = {"p": PassiveTile()}
     stub_player = StubController()
     player_dict = {"player": stub_player}
+    state = progress_state.GameState(map_dict, player_dict)
+    state.time_will_elapse = 3
 
-    progress_state.simulate_time(map_dict, player_dict)
+    state.simulate_time()
 
-    if progress_state.game_counter != 3:
-        return False, f"Game counter expected 3, found {progress_state.game_counter}"
-    if progress_state.time_will_elapse != 5:
-        return False, f"time_will_elapse expected 5, found {progress_state.time_will_elapse}"
-    if progress_state.turn_counter != 1:
-        return False, f"turn_counter expected 1, found {progress_state.turn_counter}"
+    if state.game_counter != 3:
+        return False, f"Game counter expected 3, found {state.game_counter}"
+    if state.time_will_elapse != 5:
+        return False, f"time_will_elapse expected 5, found {state.time_will_elapse}"
+    if state.turn_counter != 1:
+        return False, f"turn_counter expected 1, found {state.turn_counter}"
     if stub_player.calls != [(3, 0)]:
         return False, f"Player was not called with expected timestamps: {stub_player.calls}"
     return True, "Game state progression advances using the minimum scheduled delay."
 
 
+def test_scheduler_wakes_only_due_controllers() -> Tuple[bool, str]:
+    """Controllers that are not yet due should be skipped by the event heap."""
+    class StubController:
+        def __init__(self, due_at, wait):
+            self.next_action_due_at = due_at
+            self.wait = wait
+            self.calls: List[int] = []
+        def will_i_act(self, current_time, global_last_active):
+            self.calls.append(current_time)
+            self.next_action_due_at = current_time + self.wait
+            return self.wait
+
+    early = StubController(0, 40)
+    late = StubController(100, 40)
+    state = progress_state.GameState({}, {"early": early, "late": late})
+
+    state.simulate_time()
+    state.simulate_time()
+
+    if early.calls != [0, 40]:
+        return False, f"Due controller woke at unexpected times: {early.calls}"
+    if late.calls:
+        return False, f"Controller woke before its due time: {late.calls}"
+    if state.time_will_elapse != 40:
+        return False, f"Expected next delay of 40, found {state.time_will_elapse}"
+    return True, "Event heap wakes only controllers whose due time has arrived."
+
+
+def test_snapshots_do_not_drive_scheduler() -> Tuple[bool, str]:
+    """Snapshot boundaries should be captured from accrued state without extra ticks."""
+    class StubVillage:
+        location = (0, 0)
+        population = 2
+        def __init__(self):
+            self.stock = 100.0
+            self.synced = 0
+        def resources_at(self, game_time):
+            return [0.0, 0.0, 0.0, self.stock + (game_time - self.synced) * 0.5]
+        def culture_total_at(self, game_time):
+            return float(game_time)
+        def yield_calc(self):
+            return [0.0, 0.0, 0.0, 0.5]
+
+    class StubController:
+        ai_label = "Stub"
+        name = "stub"
+        def __init__(self):
+            self.villages = [StubVillage()]
+            self.next_action_due_at = 0
+        def will_i_act(self, current_time, global_last_active):
+            #spend everything on each wake so a late read would show the drop
+            village = self.villages[0]
+            village.stock = 0.0
+            village.synced = current_time
+            self.next_action_due_at = current_time + 2000
+            return 2000
+
+    state = progress_state.GameState({}, {"stub": StubController()})
+    state.monitor.reset(interval=900)
+    ticks = []
+    for _ in range(3):
+        state.simulate_time()
+        ticks.append(state.game_counter)
+    if ticks != [0, 2000, 4000]:
+        return False, f"Snapshot boundaries forced extra ticks: {ticks}"
+    stocks = {row["time"]: row["crop_stock"] for row in state.monitor.get_snapshots()}
+    expected = {900: 450.0, 1800: 900.0, 2700: 350.0, 3600: 800.0}
+    if stocks != expected:
+        return False, f"Boundary snapshots were not read from the pre-tick state: {stocks}"
+    return True, "Snapshots are taken at their boundaries without waking the scheduler."
+
+
+def test_game_states_are_isolated() -> Tuple[bool, str]:
+    """Two kernels stepped alternately should keep separate clocks and logs."""
+    first_players = populate_players_with_villages(_build_world(40, seed=301), 1, rng_holder=random.Random(3))
+    second_players = populate_players_with_villages(_build_world(40, seed=302), 2, rng_holder=random.Random(4))
+    first = progress_state.GameState({}, first_players)
+    second = progress_state.GameState({}, second_players)
+    for _ in range(3):
+        first.simulate_time()
+        second.simulate_time()
+        second.simulate_time()
+
+    if first.turn_counter != 3 or second.turn_counter != 6:
+        return False, f"Turn counters leaked between kernels: {first.turn_counter}, {second.turn_counter}"
+    first_players_logged = {event.get("player") for event in first.logger.events if event.get("player")}
+    second_players_logged = {event.get("player") for event in second.logger.events if event.get("player")}
+    if first_players_logged != set(first_players) or second_players_logged != set(second_players):
+        return False, "Controller events were written to another kernel's logger."
+    return True, "Interleaved kernels keep independent clocks and event logs."
+
+
+def test_interleaved_runs_keep_their_own_rng() -> Tuple[bool, str]:
+    """AI decisions should come from the run's RNG, so interleaving runs does not change them."""
+    def build_state(seed):
+        world = _build_world(40, seed=seed)
+        players = populate_players_with_villages(world, 3, rng_holder=random.Random(seed))
+        return progress_state.GameState(world, players, rng=random.Random(seed))
+
+    def decisions(state):
+        return [(event.get("player"), event.get("target")) for event in state.logger.events if event.get("event") == "action"]
+
+    solo = build_state(404)
+    for _ in range(40):
+        solo.simulate_time()
+    first, second = build_state(404), build_state(405)
+    for _ in range(40):
+        first.simulate_time()
+        random.random()
+        second.simulate_time()
+    if not decisions(solo) or decisions(solo) != decisions(first):
+        return False, "Interleaving another run or drawing from the global random changed AI choices."
+    return True, "Each run draws AI choices from its own seeded RNG."
+
+
+def test_controllers_pickle_for_process_pools() -> Tuple[bool, str]:
+    """Controllers, villages and maps should pickle before and after a kernel attaches its logger."""
+    world = _build_world(40, seed=303)
+    players = populate_players_with_villages(world, 2, rng_holder=random.Random(6))
+    try:
+        pickle.loads(pickle.dumps((world, players)))
+        state = progress_state.GameState(world, players)
+        state.simulate_time()
+        _, restored = pickle.loads(pickle.dumps((world, players)))
+    except Exception as exc:  # noqa: BLE001 - report any pickling failure
+        return False, f"Simulation objects failed to pickle: {exc!r}"
+    controller = next(iter(restored.values()))
+    if controller.run_logger is not run_logger or next(iter(players.values())).run_logger is not state.logger:
+        return False, "Attached loggers should stay with their kernel and not travel with the pickle."
+    return True, "Controllers and worlds pickle without the run logger."
+
+
+def test_passive_registry_tracks_pending_tiles() -> Tuple[bool, str]:
+    """Only tiles with a pending event should be visited by check_passive."""
+    world = _build_world(3, seed=42)
+    if world.active_passives:
+        return False, f"Inert tiles joined the passive registry: {list(world.active_passives)}"
+
+    class RegeneratingTile:
+        type_square = "oasis"
+        def __init__(self):
+            self.pending = [30, 60]
+        def next_update(self):
+            return self.pending.pop() if self.pending else None
+
+    world[(0, 0)] = RegeneratingTile()
+    world.refresh_passive((0, 0))
+    if (0, 0) not in world.active_passives:
+        return False, "Tile with a pending event did not sign up."
+    state = progress_state.GameState(world, {})
+    first = state.check_passive()
+    second = state.check_passive()
+    if first != [30] or second != []:
+        return False, f"Unexpected passive candidates: {first}, {second}"
+    if world.active_passives:
+        return False, "Tile stayed registered after its event cleared."
+    return True, "Passive registry holds only tiles with pending events."
+
+
+def test_generated_map_registers_passive_terrain() -> Tuple[bool, str]:
+    """Lazily built terrain should reach check_passive once its tiles report pending work."""
+    world = map_creation(12, seed=61)
+    passive_count = int(((world.tile_type == world_map.TILE_OASIS) | (world.tile_type == world_map.TILE_HABITABLE)).sum())
+    if len(world.active_passives) != passive_count:
+        return False, f"Generated map registered {len(world.active_passives)} of {passive_count} passive tiles."
+    oasis_count = int((world.tile_type == world_map.TILE_OASIS).sum())
+    with mock.patch.object(oasis.Oasis, "next_update", lambda self: 45):
+        state = progress_state.GameState(modify_base_map(world), {})
+        candidates = state.check_passive()
+    if candidates != [45] * oasis_count or len(world.active_passives) != oasis_count:
+        return False, f"Expected {oasis_count} oasis candidates, found {len(candidates)}."
+    if len(world._tiles) != oasis_count:
+        return False, f"Probing kept {len(world._tiles)} tile objects instead of the pending oases."
+    state.check_passive()
+    if world.active_passives:
+        return False, "Oases stayed registered once they had nothing pending."
+    return True, "Generated terrain signs up for passive checks and drops inert tiles."
+
+
 def test_logger_records_village_metrics() -> Tuple[bool, str]:
     """Ensure logger attaches population, culture, and yield metrics to events."""
     run_logger.reset()
@@ -396,6 +771,328 @@ def test_logger_records_village_metrics() -> Tuple[bool, str]:
     return True, "Logger captures population, culture, and yield metrics on events."
 
 
+def test_run_logger_streams_jsonl() -> Tuple[bool, str]:
+    """Events should be written to disk as they are logged rather than held in memory."""
+    with tempfile.TemporaryDirectory() as log_dir:
+        logger = run_logger.RunLogger(log_dir=Path(log_dir), scoreboard_dir=Path(log_dir))
+        logger.start_run({"map_radius": 1, "num_players": 1})
+        for turn in range(5):
+            logger.log_tick(
+                turn=turn,
+                game_time=turn * 10,
+                elapsed=10,
+                scheduled_delay=10,
+                passive_candidates=[],
+                player_candidates=[10],
+            )
+        if logger.events:
+            return False, "Streaming logger kept events in memory without retain_events."
+        mid_run = [event["event"] for event in logger.get_events()]
+        if mid_run != ["run_started"] + ["tick"] * 5:
+            return False, f"Mid-run event stream did not match logged events: {mid_run}"
+        payload = logger.finalise_run({"ticks": 5})
+        log_path = Path(payload["metadata"]["log_path"])
+        lines = log_path.read_text(encoding="utf-8").splitlines()
+        if len(lines) != 7 or json.loads(lines[-1])["event"] != "run_summary":
+            return False, f"Log file does not hold one JSON object per event: {len(lines)} lines."
+        if len(payload["events"]) != 7 or list(run_logger.read_events(log_path)) != list(payload["events"]):
+            return False, "Returned event stream does not match the file contents."
+
+        retaining = run_logger.RunLogger(log_dir=Path(log_dir), scoreboard_dir=Path(log_dir), retain_events=True)
+        retaining.start_run({"map_radius": 1})
+        if len(retaining.events) != 1 or payload["metadata"]["run_id"] == retaining.metadata["run_id"]:
+            return False, "Retaining logger did not keep events or reused a run id."
+        retaining.reset()
+    return True, "Run logger streams JSON Lines and reads them back lazily."
+
+
+def test_run_logger_verbosity_levels() -> Tuple[bool, str]:
+    """Event types can be switched off or sampled without touching the rest of the log."""
+    with tempfile.TemporaryDirectory() as log_dir:
+        logger = run_logger.RunLogger(log_dir=Path(log_dir), scoreboard_dir=Path(log_dir), verbosity={"action": "off"})
+        logger.start_run({"map_radius": 1, "log_verbosity": {"tick": 3, "run_started": "off"}})
+        for turn in range(7):
+            logger.log_tick(
+                turn=turn,
+                game_time=turn,
+                elapsed=1,
+                scheduled_delay=1,
+                passive_candidates=[],
+                player_candidates=[],
+            )
+            logger.log_action(player="Alpha", village_location=(0, 0), action_type="idle", target=None, wait_time=None)
+        logger.log_completion(player="Alpha", village_location=(0, 0), job_type="field", target="Wood1")
+        kept = [(event["event"], event.get("turn")) for event in logger.get_events()]
+        logger.reset()
+    expected = [("run_started", None), ("tick", 0), ("tick", 3), ("tick", 6), ("completion", None)]
+    if kept != expected:
+        return False, f"Verbosity filtering kept {kept}, expected {expected}."
+    try:
+        run_logger.RunLogger(verbosity={"tick": 0})
+    except ValueError:
+        pass
+    else:
+        return False, "A zero sample interval was accepted."
+    return True, "Per-type verbosity drops, samples and keeps events as configured."
+
+
+def test_run_logger_live_scoreboard() -> Tuple[bool, str]:
+    """The scoreboard and settlement tally should be current mid-run, even for filtered events."""
+    with tempfile.TemporaryDirectory() as log_dir:
+        logger = run_logger.RunLogger(log_dir=Path(log_dir), scoreboard_dir=Path(log_dir))
+        logger.start_run({"settle_goal": 2, "log_verbosity": {"action": "off", "completion": 2}})
+        for _ in range(3):
+            logger.log_action(player="Alpha", village_location=(0, 0), action_type="idle", target=None, wait_time=None, population=5)
+        logger.log_completion(player="Beta", village_location=(1, 1), job_type="settle", target="settle", game_time=50, settle_points=1)
+        logger.log_completion(player="Beta", village_location=(1, 1), job_type="settle", target="settle", game_time=90, settle_points=2, population=8)
+        mid_run = {row["player"]: row for row in logger.scoreboard()}
+        if logger.total_settlements != 2 or logger.settle_goal_reached_time != 90:
+            return False, f"Settlement tally is stale: {logger.total_settlements} at {logger.settle_goal_reached_time}."
+        if mid_run["Alpha"]["actions"] != 3 or mid_run["Beta"]["completions"] != 2:
+            return False, "Filtered events were not counted on the live scoreboard."
+        if [row["player"] for row in logger.scoreboard()] != ["Beta", "Alpha"]:
+            return False, "Live scoreboard is not ordered by settle points."
+        payload = logger.finalise_run({})
+        summary = next(event for event in payload["events"] if event["event"] == "run_summary")
+    if summary["total_settlements"] != 2 or summary["settle_points"] != {"Beta": 2}:
+        return False, f"Run summary disagrees with the live tally: {summary}"
+    if payload["scoreboard"]["players"][0]["population"] != 8:
+        return False, "Finalised scoreboard lost the latest player stats."
+    return True, "Scoreboard and settlement tally update as events are logged."
+
+
+def test_run_logger_compressed_output() -> Tuple[bool, str]:
+    """gzip and lzma logs should read back exactly like plain ones, including legacy whole-file logs."""
+    with tempfile.TemporaryDirectory() as log_dir:
+        results = {}
+        for compression in (None, "gzip", "lzma"):
+            logger = run_logger.RunLogger(log_dir=Path(log_dir), scoreboard_dir=Path(log_dir))
+            logger.start_run({"run_id": f"c{compression}", "log_compression": compression})
+            for turn in range(50):
+                logger.log_action(player="Alpha", village_location=(0, 0), action_type="idle", target=None, wait_time=turn)
+            if compression == "gzip" and len(list(logger.get_events())) != 51:
+                return False, "Mid-run read of a gzip log missed buffered events."
+            payload = logger.finalise_run({})
+            events = list(run_logger.read_events(Path(payload["metadata"]["log_path"])))
+            scoreboard = run_logger.read_scoreboard(Path(payload["metadata"]["scoreboard_path"]))
+            #run_started echoes the per-run metadata, which differs by design
+            results[compression] = (events[1:], scoreboard["players"])
+        if results["gzip"] != results[None] or results["lzma"] != results[None]:
+            return False, "Compressed logs did not read back identically to the plain log."
+        if not payload["metadata"]["log_path"].endswith(".jsonl.xz"):
+            return False, f"Unexpected compressed log name {payload['metadata']['log_path']}"
+
+        legacy_path = Path(log_dir) / "run_legacy.json"
+        legacy_path.write_text(json.dumps({"metadata": {}, "events": events}, indent=2), encoding="utf-8")
+        if list(run_logger.read_events(legacy_path)) != events:
+            return False, "Legacy whole-file run log was not readable."
+    return True, "Compressed and legacy logs read back transparently."
+
+
+def test_run_ids_unique_under_concurrency() -> Tuple[bool, str]:
+    """Parallel allocations must never hand out the same run id, even with a stale hint."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    with tempfile.TemporaryDirectory() as registry:
+        registry_dir = Path(registry)
+        (registry_dir / "run_00007.json").write_text("{}", encoding="utf-8")
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            first = list(pool.map(lambda _: run_ids.allocate_run_id(registry_dir), range(40)))
+        #a hint left behind by a slower worker points at ids that are already reserved
+        (registry_dir / "run_ids" / "next").write_text("9", encoding="utf-8")
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            second = list(pool.map(lambda _: run_ids.allocate_run_id(registry_dir), range(40)))
+        logger = run_logger.RunLogger(log_dir=registry_dir, scoreboard_dir=registry_dir)
+        logger.start_run({})
+        logged_id = logger.metadata["run_id"]
+        logger.reset()
+    allocated = first + second + [logged_id]
+    if len(set(allocated)) != len(allocated):
+        return False, "Duplicate run ids were allocated."
+    if min(first) != "00008":
+        return False, f"Allocation did not continue after existing runs: {min(first)}"
+    if logged_id != "00088":
+        return False, f"Run logger did not take the next registry id: {logged_id}"
+    return True, "Run ids are unique across concurrent allocations."
+
+
+def test_background_writer_orders_and_reports() -> Tuple[bool, str]:
+    """Queued writes run in order off-thread; failures surface on flush."""
+    import threading
+
+    writer = background_writer.BackgroundWriter(max_pending=1)
+    gate = threading.Event()
+    order: List[int] = []
+    running = threading.Event()
+    #one job holds the worker and a second fills the only queue slot, so a third must wait
+    writer.submit(lambda: running.set() or gate.wait())
+    running.wait()
+    writer.submit(order.append, 1)
+    blocked = threading.Thread(target=writer.submit, args=(order.append, 2))
+    blocked.start()
+    blocked.join(timeout=0.2)
+    still_blocked = blocked.is_alive()
+    gate.set()
+    blocked.join()
+    if not still_blocked:
+        writer.close()
+        return False, "Submit did not block while the bounded queue was full."
+    failing = writer.submit(json.loads, "{not json")
+    try:
+        writer.flush()
+    except background_writer.BackgroundWriteError as exc:
+        if len(exc.errors) != 1 or failing.exception() is None:
+            return False, f"Unexpected error report: {exc.errors}"
+    else:
+        return False, "Failed background job was not reported on flush."
+
+    with tempfile.TemporaryDirectory() as log_dir:
+        logger = run_logger.RunLogger(log_dir=Path(log_dir), scoreboard_dir=Path(log_dir), writer=writer)
+        logger.start_run({})
+        logger.log_action(player="Alpha", village_location=(0, 0), action_type="idle", target=None, wait_time=None)
+        payload = logger.finalise_run({})
+        writer.close()
+        players = run_logger.read_scoreboard(Path(payload["metadata"]["scoreboard_path"]))["players"]
+    if order != [1, 2] or [entry["player"] for entry in players] != ["Alpha"]:
+        return False, f"Background jobs ran out of order or were lost: {order}, {players}"
+
+    #a closed writer must not be kept alive by its exit hook
+    short_lived = background_writer.BackgroundWriter()
+    short_lived.submit(order.append, 3)
+    short_lived.close()
+    short_lived_ref = weakref.ref(short_lived)
+    del short_lived
+    gc.collect()
+    if short_lived_ref() is not None:
+        return False, "A closed writer is still referenced after close()."
+    return True, "Background writer preserves order, applies backpressure and reports failures."
+
+
+def test_background_export_failure_is_skipped() -> Tuple[bool, str]:
+    """A failed background export should reach its handler instead of failing the writer's flush."""
+    monitor = periodic_monitor.PeriodicMonitor()
+    monitor.reset(variant="primary")
+    monitor.store.append(
+        900, "Amy", "Balanced", (1, 1), "primary",
+        wood_yield=1.0, clay_yield=0.0, iron_yield=0.0, crop_yield=0.0, crop_stock=0.0,
+        population=3, total_yield=0.0, culture_total=0.0, culture_rate=0.0, settlers_built=0, settle_points=0,
+    )
+    writer = background_writer.BackgroundWriter()
+    failures: List[BaseException] = []
+    with tempfile.TemporaryDirectory() as output_dir:
+        #a file where the run directory should go makes the job fail on the writer thread
+        (Path(output_dir) / "run_x_primary").write_text("", encoding="utf-8")
+        future = monitor.export_results("x", "primary", Path(output_dir), writer=writer, on_error=failures.append)
+        try:
+            writer.flush()
+        except background_writer.BackgroundWriteError as exc:
+            writer.close()
+            return False, f"Handled export failure was raised from flush: {exc}"
+        healthy = monitor.export_results("y", "primary", Path(output_dir), writer=writer, on_error=failures.append)
+        writer.close()
+        charts = sorted(path.name for path in (Path(output_dir) / "run_y_primary").glob("*.png"))
+    if len(failures) != 1 or future.exception() is None or healthy.exception() is not None:
+        return False, f"Unexpected export outcomes: {failures}"
+    if len(charts) != len(periodic_monitor.EXPORT_METRICS):
+        return False, f"Charts were not rendered off the main thread: {charts}"
+    return True, "Background export failures are reported per run and skipped."
+
+
+def test_snapshot_store_is_columnar() -> Tuple[bool, str]:
+    """Snapshot rows live in growable NumPy columns that back the export frame directly."""
+    import numpy as np
+
+    store = SnapshotStore({"rng_seed": 5}, capacity=2)
+    metrics = dict(
+        wood_yield=1.0, clay_yield=2.0, iron_yield=3.0, crop_yield=4.0, crop_stock=800,
+        population=2, total_yield=10.0, culture_total=0.5, culture_rate=1.0, settlers_built=0, settle_points=0,
+    )
+    for game_time in (0, 900, 900, 1800):
+        for player, location in (("Zed", (5, -3)), ("Amy", (-7, 9))):
+            store.append(game_time, player, "Balanced", location, "primary", **metrics)
+    if len(store) != 6:
+        return False, f"Expected duplicate captures to be dropped, found {len(store)} rows."
+    frame = store.to_frame()
+    if not np.shares_memory(frame["wood_yield"].to_numpy(), store.columns()["wood_yield"]):
+        return False, "Export frame copied the numeric columns."
+    if sorted(frame["player"].cat.categories) != list(frame["player"].cat.categories):
+        return False, "Player categories are not in value order."
+    records = store.records()
+    if records[1]["village_location"] != (-7, 9) or records[1]["rng_seed"] != 5 or records[-1]["minutes"] != 30.0:
+        return False, f"Materialised record is wrong: {records[1]}"
+    if list(frame.columns)[:3] != ["time", "minutes", "player"] or frame["player"].tolist()[:2] != ["Zed", "Amy"]:
+        return False, "Frame columns or labels are out of order."
+    return True, "Snapshot store keeps interned columns and exports without copying metrics."
+
+
+def test_snapshot_aggregation_long_form() -> Tuple[bool, str]:
+    """Aggregation should emit one best/worst/average row per group and metric, in metric order."""
+    store = SnapshotStore()
+    base = dict(
+        wood_yield=10.0, clay_yield=0.0, iron_yield=0.0, crop_yield=0.0, crop_stock=0.0,
+        population=3, total_yield=0.0, culture_total=0.0, culture_rate=0.0, settlers_built=0, settle_points=0,
+    )
+    store.append(900, "Amy", "Balanced", (1, 1), "primary", **base)
+    store.append(900, "Bob", "Balanced", (2, 2), "primary", **{**base, "wood_yield": 30.0, "population": 8})
+    store.append(900, "Cat", "Aggressive", (3, 3), "primary", **base)
+    aggregated = periodic_monitor.aggregate_snapshots(store.to_frame())
+    metrics = periodic_monitor.EXPORT_METRICS
+    if len(aggregated) != 2 * len(metrics) or list(aggregated["metric"][: len(metrics)]) != metrics:
+        return False, f"Unexpected long-form layout: {len(aggregated)} rows."
+    if list(aggregated.columns) != ["run_variant", "ai_label", "time", "minutes", "metric", "best", "worst", "average"]:
+        return False, f"Unexpected aggregate columns: {list(aggregated.columns)}"
+    wood = aggregated[(aggregated["ai_label"] == "Balanced") & (aggregated["metric"] == "wood_yield")].iloc[0]
+    population = aggregated[(aggregated["ai_label"] == "Balanced") & (aggregated["metric"] == "population")].iloc[0]
+    if (wood["best"], wood["worst"], wood["average"], wood["minutes"]) != (30.0, 10.0, 20.0, 15.0) or population["average"] != 5.5:
+        return False, "Best/worst/average values were not aggregated correctly."
+    return True, "Snapshot aggregation builds the long table without per-row loops."
+
+
+def test_snapshot_schedule_downsamples() -> Tuple[bool, str]:
+    """A resolution schedule should coarsen snapshots and keep segment ends as boundaries."""
+    monitor = periodic_monitor.PeriodicMonitor()
+    monitor.reset(schedule=((3600, 900), (7200, 2400), (None, 3600)))
+    due = [monitor.next_snapshot_due]
+    for _ in range(7):
+        monitor.maybe_capture(due[-1], {})
+        due.append(monitor.next_snapshot_due)
+    if due != [900, 1800, 2700, 3600, 6000, 7200, 10800, 14400]:
+        return False, f"Unexpected snapshot boundaries: {due}"
+    if periodic_monitor.describe_schedule(monitor.schedule) != "every 15 min to 1 h, 40 min to 2 h, then 60 min":
+        return False, f"Unexpected schedule description: {periodic_monitor.describe_schedule(monitor.schedule)}"
+    if periodic_monitor.describe_schedule(periodic_monitor.normalise_schedule(None)) != "per 15-minute interval":
+        return False, "The uniform schedule changed its chart wording."
+    try:
+        periodic_monitor.normalise_schedule(((7200, 900), (3600, 1800)))
+    except ValueError:
+        return True, "Snapshot schedules downsample long runs at the configured boundaries."
+    return False, "A schedule with decreasing segment ends was accepted."
+
+
+def test_interval_aggregates_match_raw_export() -> Tuple[bool, str]:
+    """Aggregate-only capture should yield the same aggregated table as aggregating the raw rows."""
+    metrics = periodic_monitor.EXPORT_METRICS
+    store = SnapshotStore()
+    folded = IntervalAggregates(metrics)
+    base = dict(
+        wood_yield=0.1, clay_yield=0.0, iron_yield=0.0, crop_yield=0.0, crop_stock=0.0,
+        population=3, total_yield=0.0, culture_total=0.0, culture_rate=0.0, settlers_built=0, settle_points=0,
+    )
+    for time in (900, 1800):
+        for index, label in enumerate(("Balanced", "Aggressive", "Balanced", None, "Balanced")):
+            values = {**base, "wood_yield": 0.1 * (index + 1) + time, "population": index + time}
+            for target in (store, folded):
+                target.append(time, f"P{index}", label, (index, 0), "primary", **values)
+                target.append(time, f"P{index}", label, (index, 0), "primary", **values)
+    expected = periodic_monitor.aggregate_snapshots(store.to_frame())
+    actual = folded.aggregate_frame()
+    if len(folded) != len(store) or folded.records():
+        return False, "Aggregate-only capture should count rows without retaining them."
+    if expected.to_csv(index=False) != actual.to_csv(index=False):
+        return False, "Streaming aggregates differ from the DataFrame aggregation."
+    return True, "Aggregate-only monitoring reproduces the aggregated export."
+
+
 def test_run_logger_generates_scoreboard() -> Tuple[bool, str]:
     """Ensure scoreboard data is written as a separate artefact."""
     run_logger.reset()
@@ -533,14 +1230,14 @@ def test_simulation_stops_when_settlement_goal_met() -> Tuple[bool, str]:
     run_logger.reset()
     call_count = {"value": 0}
 
-    def fake_simulate(map_dict, player_dict):
+    def fake_simulate(state):
         call_count["value"] += 1
-        progress_state.turn_counter += 1
-        progress_state.game_counter += 60
-        progress_state.time_elapsed = 60
-        progress_state.time_will_elapse = 0
-        progress_state.global_last_active = progress_state.game_counter
-        players_list = list(player_dict.values())
+        state.turn_counter += 1
+        state.game_counter += 60
+        state.time_elapsed = 60
+        state.time_will_elapse = 0
+        state.global_last_active = state.game_counter
+        players_list = list(state.player_dict.values())
         if not players_list:
             return
         goal = game_rules.target_settles(len(players_list))
@@ -548,7 +1245,10 @@ def test_simulation_stops_when_settlement_goal_met() -> Tuple[bool, str]:
         for other in players_list[1:]:
             other.settle_points = 0
 
-    with mock.patch("simulation_runner.run_simulation.progress_state.simulate_time", side_effect=fake_simulate):
+    #keep the terrain cache out of the working tree
+    with tempfile.TemporaryDirectory() as cache_dir, mock.patch.object(
+        world_cache, "WORLD_CACHE_DIR", Path(cache_dir)
+    ), mock.patch.object(progress_state.GameState, "simulate_time", autospec=True, side_effect=fake_simulate):
         log_output = run_sim._execute_simulation(
             num_ticks=10,
             num_players=1,
@@ -611,6 +1311,31 @@ def test_crop_yield_uses_population_consumption() -> Tuple[bool, str]:
     return True, "Crop yield subtracts population usage exactly once."
 
 
+def test_yield_cache_invalidated_on_completion() -> Tuple[bool, str]:
+    """Cached yields should be reused until a field upgrade or population change."""
+    world = _build_world(40, seed=514)
+    players = populate_players_with_villages(world, 1, rng_holder=random.Random(78))
+    village_obj = next(iter(players.values())).villages[0]
+    village_obj.stored = [1_000_000, 1_000_000, 1_000_000, 1_000_000]
+
+    before = village_obj.yield_calc()
+    with mock.patch.object(Village, "_calculate_field_yields", side_effect=AssertionError("recomputed")):
+        if village_obj.yield_calc() != before:
+            return False, "Repeated yield reads returned different values."
+
+    village_obj.upgrade_field("Wood1")
+    job = next(iter(village_obj.currently_upgrading.values()))
+    village_obj.field_upgraded(job)
+    after = village_obj.yield_calc()
+    if not after[0] > before[0]:
+        return False, f"Wood yield did not refresh after the field upgrade: {before[0]} -> {after[0]}"
+
+    village_obj.population += 36
+    if abs((after[3] - village_obj.yield_calc()[3]) * 3600 - 36) > 1e-6:
+        return False, "Crop yield did not refresh after a population change."
+    return True, "Yield vector is cached and refreshed on completions and population changes."
+
+
 def test_crop_storage_clamped_at_zero() -> Tuple[bool, str]:
     """Ensure storage never dips below zero even if crop income is negative."""
     world = _build_world(40, seed=612)
@@ -640,6 +1365,52 @@ def test_crop_storage_clamped_at_zero() -> Tuple[bool, str]:
     return True, "Negative crop flow is clamped at zero storage."
 
 
+def test_village_resources_accrue_lazily() -> Tuple[bool, str]:
+    """Stored resources should be computed in closed form from the last sync."""
+    world = _build_world(40, seed=613)
+    players = populate_players_with_villages(world, 1, rng_holder=random.Random(23))
+    village_obj = next(iter(players.values())).villages[0]
+    village_obj.stored = [0, 0, 0, 0]
+    rates = village_obj.yield_calc()
+
+    village_obj.advance_clock(600)
+    expected = [min(cap, max(0, rate * 600)) for rate, cap in zip(rates, village_obj.storage_cap)]
+    if any(abs(a - b) > 1e-9 for a, b in zip(village_obj.stored, expected)):
+        return False, f"Expected {expected} after 600s, saw {village_obj.stored}"
+    far_future = village_obj.resources_at(10**8)
+    for idx, rate in enumerate(rates):
+        bound = village_obj.storage_cap[idx] if rate > 0 else 0
+        if far_future[idx] != bound:
+            return False, f"Resource {idx} was not clamped to {bound}: {far_future[idx]}"
+    return True, "Resources accrue in closed form and respect caps and the zero floor."
+
+
+def test_compiled_tables_match_source_data() -> Tuple[bool, str]:
+    """Compiled tables should normalise building and field entries to upgrade-from-level records."""
+    warehouse = BUILDINGS.record("warehouse", 0)
+    if warehouse.upgrade_cost != tuple(b_data.building_dict["warehouse"][1][0]):
+        return False, f"Warehouse level 0 should be priced by the level 1 entry, saw {warehouse.upgrade_cost}"
+    if warehouse.upgrade_seconds != sec_val(b_data.building_dict["warehouse"][1][3]):
+        return False, "Warehouse build time was not converted to seconds."
+    top = BUILDINGS.record("warehouse", 20)
+    if top.upgradeable or top.value != b_data.building_dict["warehouse"][20][4]:
+        return False, "Top warehouse level should be terminal and keep its storage value."
+
+    wood = FIELDS.record("Wood", 3)
+    source = f_data.field_dict["Wood"]
+    if wood.upgrade_cost != tuple(source[3][0]) or wood.pop_delta != source[4][2] - source[3][2]:
+        return False, f"Wood level 3 record does not match source data: {wood}"
+    if FIELDS.record("Wood", 17).upgradeable:
+        return False, "Fields at their last level must not be upgradeable."
+
+    row = BUILDINGS.ids["warehouse"]
+    if BUILDINGS.upgrade_cost[row, 0].tolist() != list(warehouse.upgrade_cost) or BUILDINGS.upgrade_cost.flags.writeable:
+        return False, "Array view should mirror the records and be read-only."
+    if BUILDINGS.record("no_such_building", 1).exists:
+        return False, "Unknown buildings should return an empty record."
+    return True, "Compiled tables mirror the source data in both layouts."
+
+
 def test_main_building_speed_modifier_applies() -> Tuple[bool, str]:
     """Verify upgrade durations scale with the main building speed modifier."""
     world = _build_world(40, seed=712)
@@ -701,6 +1472,81 @@ def test_building_upgrade_handles_max_level() -> Tuple[bool, str]:
     return True, "Terminal building upgrades complete cleanly and mark the job finished."
 
 
+def test_new_builds_offered_once_per_type() -> Tuple[bool, str]:
+    """New-build candidates should be slot-agnostic and placed on upgrade."""
+    world = _build_world(40, seed=914)
+    players = populate_players_with_villages(world, 1, rng_holder=random.Random(13))
+    village_obj = next(iter(players.values())).villages[0]
+    village_obj.stored = [1_000_000, 1_000_000, 1_000_000, 1_000_000]
+
+    new_builds = [item for item in village_obj.possible_buildings()["buildings"] if item.get("new_build")]
+    names = [item["name"] for item in new_builds]
+    if not names or len(names) != len(set(names)):
+        return False, f"Expected one candidate per building type, saw {names}"
+    if any(item["slot"] is not None for item in new_builds):
+        return False, "New-build candidates should not carry a slot."
+
+    first_empty = next(slot for slot, value in village_obj.buildings.items() if not value)
+    village_obj.upgrade_building([None, names[0]])
+    if not village_obj.buildings[first_empty] or village_obj.buildings[first_empty][0] != names[0]:
+        return False, f"New build was not placed in the first empty slot {first_empty}."
+    if any(item["name"] == names[0] for item in village_obj.possible_buildings()["buildings"] if item.get("new_build")):
+        return False, "Placed building type is still offered as a new build."
+    return True, "New builds are offered once per type and slotted on upgrade."
+
+
+def test_village_views_write_through_to_arrays() -> Tuple[bool, str]:
+    """Compact villages should keep the dict/list/Field attribute API as write-through views."""
+    world = _build_world(40, seed=915)
+    players = populate_players_with_villages(world, 1, rng_holder=random.Random(14))
+    village_obj = next(iter(players.values())).villages[0]
+    if hasattr(village_obj, "__dict__"):
+        return False, "Village should use __slots__ rather than a per-instance dict."
+
+    village_obj.buildings[5] = ["warehouse", 3, True]
+    if village_obj.buildings[5] != ["warehouse", 3, True] or village_obj._slot_level[5] != 3:
+        return False, f"Slot assignment did not reach the arrays: {village_obj.buildings[5]}"
+    village_obj.buildings[5][1] = 4
+    if village_obj.buildings[5][1] != 4:
+        return False, "Slot view item assignment was not persisted."
+    village_obj.buildings[5] = ''
+    if village_obj.buildings[5] != '' or village_obj._slot_building[5] != -1:
+        return False, "Clearing a slot did not reset its arrays."
+
+    field = village_obj.fields["Wood1"]
+    field.level = 2
+    expected = FIELDS.record("Wood", 2)
+    if village_obj.fields["Wood1"].level != 2 or field.upgrade_cost != expected.upgrade_cost or field.pop != expected.pop:
+        return False, "Field view did not derive its data from the stored level."
+    return True, "Building and field views write through to the compact arrays."
+
+
+def test_village_view_writes_refresh_yields() -> Tuple[bool, str]:
+    """Writes through the attribute views should reach a warm yield cache and the storage caps."""
+    world = _build_world(40, seed=916)
+    players = populate_players_with_villages(world, 1, rng_holder=random.Random(15))
+    village_obj = next(iter(players.values())).villages[0]
+
+    before = village_obj.yield_calc()
+    wood_ids = [field_id for field_id in village_obj.fields if village_obj.fields[field_id].type_field == "Wood"]
+    for field_id in wood_ids:
+        village_obj.fields[field_id].field_yield = 0
+    if village_obj.yield_calc()[0] != 0 or before[0] == 0:
+        return False, f"Zeroed wood fields left a stale yield: {village_obj.yield_calc()[0]}"
+
+    village_obj.yield_calc()
+    village_obj.fields[wood_ids[0]].field_yield = 360
+    with_field = village_obj.yield_calc()[0]
+    village_obj.buildings[5] = ["sawmill", 5, True]
+    if not village_obj.yield_calc()[0] > with_field:
+        return False, "Placing a sawmill through the slot view did not raise the wood yield."
+
+    village_obj.buildings[6] = ["warehouse", 10, True]
+    if village_obj.storage_cap[0] != BUILDINGS.record("warehouse", 10).value:
+        return False, f"Warehouse written through the slot view left the cap at {village_obj.storage_cap[0]}."
+    return True, "View writes settle accrual, refresh yields and recalculate storage."
+
+
 def test_storage_building_updates_capacity() -> Tuple[bool, str]:
     """Warehouse/granary upgrades should refresh the village storage caps."""
     world = _build_world(40, seed=110)
@@ -733,25 +1579,55 @@ def test_storage_building_updates_capacity() -> Tuple[bool, str]:
 TESTS = [
     ("Map determinism with seeded RNG", test_map_determinism),
     ("Map dimensions respect radius", test_map_dimensions),
+    ("Map generation is array backed", test_map_generation_is_array_backed),
+    ("World cache round trips terrain", test_world_cache_round_trips_terrain),
     ("Habitable field composition", test_habitable_fields_match_blueprint),
+    ("Habitable field templates shared", test_habitable_tiles_share_field_templates),
     ("Oasis storage consistency", test_oasis_storage_matches_resources),
     ("populate_players basic behaviour", test_populate_players_basic),
     ("populate_players_with_villages assignment", test_populate_players_with_villages_assigns_tiles),
+    ("placement index buckets and discards", test_placement_index_buckets_and_discards),
     ("populate_players_with_villages saturation handling", test_populate_players_with_villages_handles_saturation),
     ("populate_players_with_villages returns controllers", test_populate_players_with_villages_returns_controllers),
     ("base_controller countdown without action", test_base_controller_countdown_no_action),
     ("base_controller triggers field upgrade", test_base_controller_triggers_field_upgrade),
+    ("job queue uses absolute completion times", test_job_queue_uses_absolute_completion_times),
     ("culture points accumulate", test_culture_points_accumulate),
+    ("idle controller wakes when affordable", test_idle_controller_wakes_when_affordable),
     ("game_state_progression tick advances", test_game_state_progression_tick_advances),
+    ("scheduler wakes only due controllers", test_scheduler_wakes_only_due_controllers),
+    ("passive registry tracks pending tiles", test_passive_registry_tracks_pending_tiles),
+    ("generated map registers passive terrain", test_generated_map_registers_passive_terrain),
+    ("snapshots do not drive scheduler", test_snapshots_do_not_drive_scheduler),
+    ("game states are isolated", test_game_states_are_isolated),
+    ("controllers pickle for process pools", test_controllers_pickle_for_process_pools),
+    ("interleaved runs keep their own rng", test_interleaved_runs_keep_their_own_rng),
     ("run_logger captures village metrics", test_logger_records_village_metrics),
+    ("run_logger streams JSONL", test_run_logger_streams_jsonl),
+    ("run_logger verbosity levels", test_run_logger_verbosity_levels),
+    ("run_logger live scoreboard", test_run_logger_live_scoreboard),
+    ("run_logger compressed output", test_run_logger_compressed_output),
+    ("run ids unique under concurrency", test_run_ids_unique_under_concurrency),
+    ("background writer", test_background_writer_orders_and_reports),
+    ("background export failure is skipped", test_background_export_failure_is_skipped),
+    ("snapshot store columnar", test_snapshot_store_is_columnar),
+    ("snapshot aggregation long form", test_snapshot_aggregation_long_form),
+    ("snapshot schedule downsamples", test_snapshot_schedule_downsamples),
+    ("interval aggregates match raw export", test_interval_aggregates_match_raw_export),
     ("run_logger generates scoreboard", test_run_logger_generates_scoreboard),
     ("Settler training increments counter", test_settler_training_increments_counter),
     ("Settlement completion awards points", test_settle_job_consumes_settlers_and_awards_points),
     ("Simulation stops when settlement goal met", test_simulation_stops_when_settlement_goal_met),
     ("crop yield subtracts population usage", test_crop_yield_uses_population_consumption),
+    ("yield cache invalidated on completion", test_yield_cache_invalidated_on_completion),
     ("crop storage never negative", test_crop_storage_clamped_at_zero),
+    ("village resources accrue lazily", test_village_resources_accrue_lazily),
+    ("compiled tables match source data", test_compiled_tables_match_source_data),
     ("main building speed modifier applies", test_main_building_speed_modifier_applies),
     ("building upgrade handles max level", test_building_upgrade_handles_max_level),
+    ("new builds offered once per type", test_new_builds_offered_once_per_type),
+    ("village views write through to arrays", test_village_views_write_through_to_arrays),
+    ("village view writes refresh yields", test_village_view_writes_refresh_yields),
     ("storage building updates capacity", test_storage_building_updates_capacity),
 ]
 
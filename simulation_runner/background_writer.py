@@ -0,0 +1,148 @@
+"""Background thread for run artefacts (scoreboards, monitoring CSVs and charts).
+
+Jobs are queued on a bounded queue and executed in submission order by a
+single worker thread, so the simulation thread only blocks when the writer
+has fallen ``max_pending`` jobs behind. Every job returns a
+``concurrent.futures.Future``; failures are also collected on the writer
+and raised from ``flush()`` unless the job was queued with its own
+``on_error`` handler (``submit_handled``), and anything still queued when the
+interpreter exits is drained by an ``atexit`` hook that reports failures
+on stderr.
+"""
+
+from __future__ import annotations
+
+import atexit
+import queue
+import sys
+import threading
+import traceback
+from concurrent.futures import Future
+from typing import Any, Callable, List, Optional, Tuple
+
+DEFAULT_MAX_PENDING = 8
+
+
+class BackgroundWriteError(RuntimeError):
+    """One or more background write jobs failed."""
+
+    def __init__(self, errors: List[Tuple[str, BaseException]]) -> None:
+        self.errors = errors
+        details = "; ".join(f"{label}: {exc!r}" for label, exc in errors)
+        super().__init__(f"{len(errors)} background write job(s) failed - {details}")
+
+
+class BackgroundWriter:
+    """Single worker thread draining a bounded queue of write jobs."""
+
+    def __init__(self, max_pending: int = DEFAULT_MAX_PENDING, name: str = "simulation-writer") -> None:
+        self._queue: "queue.Queue[Optional[tuple]]" = queue.Queue(maxsize=max(1, int(max_pending)))
+        self._name = name
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._errors: List[Tuple[str, BaseException]] = []
+        self._closed = False
+        atexit.register(self._drain_at_exit)
+
+    def _ensure_thread(self) -> None:
+        with self._lock:
+            if self._thread is None:
+                # daemon so a forgotten writer cannot hang shutdown; the atexit hook drains it first
+                self._thread = threading.Thread(target=self._run, name=self._name, daemon=True)
+                self._thread.start()
+
+    def submit(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+        """Queue ``fn(*args, **kwargs)``; blocks while the queue is full."""
+        if self._closed:
+            raise RuntimeError("background writer has been closed")
+        return self._enqueue(None, fn, args, kwargs)
+
+    def submit_handled(self, on_error: Callable[[BaseException], Any], fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+        """Queue ``fn`` like ``submit``, but pass a failure to ``on_error`` instead of raising it from ``flush()``."""
+        if self._closed:
+            raise RuntimeError("background writer has been closed")
+        return self._enqueue(on_error, fn, args, kwargs)
+
+    def _enqueue(self, on_error: Optional[Callable[[BaseException], Any]], fn: Callable[..., Any], args: tuple, kwargs: dict) -> Future:
+        self._ensure_thread()
+        future: Future = Future()
+        self._queue.put((future, on_error, fn, args, kwargs))
+        return future
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                future, on_error, fn, args, kwargs = item
+                if not future.set_running_or_notify_cancel():
+                    continue
+                try:
+                    result = fn(*args, **kwargs)
+                except BaseException as exc:
+                    self._report(on_error, fn, exc)
+                    future.set_exception(exc)
+                else:
+                    future.set_result(result)
+            finally:
+                self._queue.task_done()
+
+    def _report(self, on_error: Optional[Callable[[BaseException], Any]], fn: Callable[..., Any], exc: BaseException) -> None:
+        label = getattr(fn, "__qualname__", repr(fn))
+        if on_error is None:
+            self._errors.append((label, exc))
+            return
+        try:
+            on_error(exc)
+        except BaseException as handler_exc:
+            #a broken handler must not hide the failure
+            self._errors.append((label, handler_exc))
+
+    def pending(self) -> int:
+        """Jobs queued or running that have not finished yet."""
+        return self._queue.unfinished_tasks
+
+    def flush(self) -> None:
+        """Wait for every submitted job, then raise if any of them failed."""
+        if self._thread is not None:
+            self._queue.join()
+        if self._errors:
+            errors, self._errors = self._errors, []
+            raise BackgroundWriteError(errors)
+
+    def close(self) -> None:
+        """Flush outstanding jobs and stop the worker thread."""
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self.flush()
+        finally:
+            if self._thread is not None:
+                self._queue.put(None)
+                self._thread.join()
+            #nothing left to drain; release the hook (and with it this writer and its queue)
+            atexit.unregister(self._drain_at_exit)
+
+    def _drain_at_exit(self) -> None:
+        try:
+            self.close()
+        except BackgroundWriteError as exc:
+            print(f"[background_writer] {exc}", file=sys.stderr)
+            for _, error in exc.errors:
+                traceback.print_exception(type(error), error, error.__traceback__, file=sys.stderr)
+
+
+_default_writer: Optional[BackgroundWriter] = None
+
+
+def default_writer() -> BackgroundWriter:
+    """Process-wide writer shared by the simulation runner."""
+    global _default_writer
+    if _default_writer is None or _default_writer._closed:
+        _default_writer = BackgroundWriter()
+    return _default_writer
+
+
+__all__ = ["DEFAULT_MAX_PENDING", "BackgroundWriteError", "BackgroundWriter", "default_writer"]
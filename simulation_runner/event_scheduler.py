@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import heapq
+from typing import Dict, List, Optional, Tuple
+
+
+class EventScheduler:
+    """Min-heap of (due_time, order, actor_key) entries driving the tick loop.
+
+    Only actors whose wake-up time has arrived are popped, so a tick costs
+    O(k log n) for the k actors that act instead of a scan over every
+    controller.  Ties are broken by the actor's position in the source
+    dictionary so wake order matches the legacy full scan exactly.
+    """
+
+    def __init__(self) -> None:
+        self._heap: List[Tuple[float, int, object]] = []
+        self._order: Dict[object, int] = {}
+        self._polled: List[object] = []
+        self._source: Optional[Dict[object, object]] = None
+
+    def reset(self) -> None:
+        """Drop every queued entry so the scheduler can be rebound."""
+        self._heap = []
+        self._order = {}
+        self._polled = []
+        self._source = None
+
+    def bind(self, actor_dict: Dict[object, object]) -> None:
+        """Seed the heap from ``actor_dict`` unless it is already being tracked."""
+        if actor_dict is self._source and len(self._order) == len(actor_dict):
+            return
+        self.reset()
+        self._source = actor_dict
+        for index, (key, actor) in enumerate(actor_dict.items()):
+            self._order[key] = index
+            due = getattr(actor, "next_action_due_at", 0)
+            self._heap.append((due, index, key))
+        heapq.heapify(self._heap)
+
+    def schedule(self, key: object, due_time: float) -> None:
+        """Queue ``key`` to be woken once the clock reaches ``due_time``."""
+        heapq.heappush(self._heap, (due_time, self._order[key], key))
+
+    def poll(self, key: object) -> None:
+        """Wake ``key`` on every tick without letting it drive the clock."""
+        self._polled.append(key)
+
+    def pop_due(self, current_time: float) -> List[object]:
+        """Remove and return every actor due at ``current_time`` in dictionary order."""
+        due: List[Tuple[int, object]] = []
+        heap = self._heap
+        while heap and heap[0][0] <= current_time:
+            _, index, key = heapq.heappop(heap)
+            due.append((index, key))
+        if self._polled:
+            due.extend((self._order[key], key) for key in self._polled)
+            self._polled = []
+        due.sort(key=lambda item: item[0])
+        return [key for _, key in due]
+
+    def next_due(self) -> Optional[float]:
+        """Return the earliest queued wake-up time, or ``None`` when idle."""
+        if not self._heap:
+            return None
+        return self._heap[0][0]
@@ -1,108 +1,134 @@
-
-
-#master counter, represents seconds since simulation instantiation
-game_counter = 0
-#number of times the global controller triggered
-turn_counter = 0
-
-#duration since last active review of game counter
-time_elapsed = 0
-
-#the duration that will elapse before the next update
-time_will_elapse = 0
-
-#this is a global version of when we were last awake
-global_last_active = 0
+import random
 
 from simulation_runner import run_logger
 from simulation_runner import periodic_monitor
-
-def set_time_elapsed():
-    global time_elapsed
-    global time_will_elapse
-    global global_last_active
-    # [ISS-016] these assignments mutate shared globals each tick; refactor into a kernel with immutable snapshots.
-    time_elapsed = time_will_elapse
-    global_last_active = game_counter
-    # [ISS-016] placeholder sentinel; remove once scheduler manages delays explicitly.
-    time_will_elapse = "I'm a string because I should never remain one"
-
-def check_passive(map_dict):
-
-    #blank list to populate with upcoming actions
-    next_action_list = []
-    for key in map_dict:
-        holdval = map_dict[key]
-        if holdval.type_square in ('habitable', 'oasis'):
-            holder = holdval.next_update()
-            # [ISS-017] clarify next_update contract (should return numeric or None, not True/False).
-            if holder is None or holder is True:
+from simulation_runner.event_scheduler import EventScheduler
+
+
+class GameState:
+    """Kernel for a single simulation run.
+
+    Owns the clock, the map, the controllers, the periodic monitor, the
+    run logger and the run's RNG, so several simulations can live in one
+    interpreter without sharing module-level state (ISS-018).
+    """
+
+    def __init__(self, map_dict=None, player_dict=None, monitor=None, logger=None, rng=None):
+        self.map_dict = map_dict if map_dict is not None else {}
+        self.player_dict = player_dict if player_dict is not None else {}
+        self.monitor = monitor if monitor is not None else periodic_monitor.PeriodicMonitor()
+        self.logger = logger if logger is not None else run_logger.RunLogger()
+        #per-run random state; controllers still on the global random draw their own stream from it
+        self.rng = rng if rng is not None else random.Random()
+
+        #master counter, represents seconds since simulation instantiation
+        self.game_counter = 0
+        #number of times the global controller triggered
+        self.turn_counter = 0
+        #duration since last active review of game counter
+        self.time_elapsed = 0
+        #the duration that will elapse before the next update
+        self.time_will_elapse = 0
+        #when the kernel was last awake
+        self.global_last_active = 0
+
+        #heap of controller wake-ups keyed on next_action_due_at
+        self.scheduler = EventScheduler()
+        self.attach_controllers()
+
+    def attach_controllers(self):
+        """Point every controller at this run's logger and RNG instead of the module defaults."""
+        for controller in self.player_dict.values():
+            if hasattr(controller, "run_logger"):
+                controller.run_logger = self.logger
+            if getattr(controller, "rng_holder", None) is random:
+                controller.rng_holder = random.Random(self.rng.getrandbits(64))
+
+    def set_time_elapsed(self):
+        self.time_elapsed = self.time_will_elapse
+        self.global_last_active = self.game_counter
+        # [ISS-016] placeholder sentinel; remove once scheduler manages delays explicitly.
+        self.time_will_elapse = "I'm a string because I should never remain one"
+
+    def check_passive(self):
+
+        #blank list to populate with upcoming actions
+        next_action_list = []
+        map_dict = self.map_dict
+        if hasattr(map_dict, 'active_passives'):
+            #only tiles that signed up with a pending event are visited
+            for key in list(map_dict.active_passives):
+                holder = map_dict.refresh_passive(key)
+                if holder is None:
+                    continue
+                next_action_list.append(holder)
+            return next_action_list
+        for key in map_dict:
+            holdval = map_dict[key]
+            if holdval.type_square in ('habitable', 'oasis'):
+                holder = holdval.next_update()
+                # [ISS-017] clarify next_update contract (should return numeric or None, not True/False).
+                if holder is None or holder is True:
+                    continue
+                next_action_list.append(holder)
+        return next_action_list
+
+    def check_players(self):
+
+        #blank list to populate with upcoming actions
+        next_action_list = []
+        player_dict = self.player_dict
+
+        #only controllers whose wake-up time has arrived are visited
+        self.scheduler.bind(player_dict)
+        for key in self.scheduler.pop_due(self.game_counter):
+            active_player = player_dict.get(key)
+            if active_player is None:
                 continue
-            next_action_list.append(holder)
-    return next_action_list
-
-def check_players(player_dict):
-
-    #blank list to populate with upcoming actions
-    next_action_list = []
-
-    # [ISS-018] globals couple scheduler to module state; replace with an injected GameState.
-    global game_counter
-    global global_last_active
-
-    for key in player_dict:
-        active_player = player_dict[key]
-        wait_time = active_player.will_i_act(game_counter, global_last_active)
-        if wait_time is None:
-            continue
-        next_action_list.append(wait_time)
-
-    return next_action_list
-
-def simulate_time(map_dict, player_dict):
-
-    # [ISS-018] globals to be phased out once kernel encapsulation lands.
-    global game_counter
-    global time_will_elapse
-    global turn_counter
-
-    set_time_elapsed()
-    game_counter = game_counter + time_elapsed
-    # [ISS-020] add heartbeat / logging once scheduler formalised.
-    passive_actions = check_passive(map_dict)
-    player_actions = check_players(player_dict)
-    periodic_monitor.maybe_capture(game_counter, player_dict)
-    all_actions = passive_actions + player_actions
-
-    numeric_actions = [val for val in all_actions if isinstance(val, (int, float))]
-    monitor_wait = periodic_monitor.seconds_until_next_snapshot(game_counter)
-    if monitor_wait is not None and monitor_wait > 0:
-        numeric_actions.append(monitor_wait)
-    if numeric_actions:
-        min_elapsed = min(numeric_actions)
-    elif len(all_actions) > 0:
-        # fallback when only sentinels remain; move to heartbeat once scheduler refactored.
-        min_elapsed = 1
-    else:
-        # [ISS-019] temporal fallback hides stalled sims; replace with heartbeat event or explicit guard.
-        min_elapsed = 1
-
-    run_logger.log_tick(
-        turn=turn_counter,
-        game_time=game_counter,
-        elapsed=time_elapsed,
-        scheduled_delay=min_elapsed,
-        passive_candidates=passive_actions,
-        player_candidates=player_actions,
-    )
-
-    time_will_elapse = min_elapsed
-    # [ISS-020] enrich metrics/logging once kernel endorses tick summaries.
-    turn_counter += 1
-
-
-
-
-
-
-
+            wait_time = active_player.will_i_act(self.game_counter, self.global_last_active)
+            if wait_time is None:
+                self.scheduler.poll(key)
+                continue
+            self.scheduler.schedule(key, self.game_counter + wait_time)
+            next_action_list.append(wait_time)
+
+        return next_action_list
+
+    def simulate_time(self):
+
+        self.set_time_elapsed()
+        self.game_counter = self.game_counter + self.time_elapsed
+        # [ISS-020] add heartbeat / logging once scheduler formalised.
+        #snapshot boundaries passed since the last tick are read from the pre-tick state, which is
+        #what the villages held at that time; snapshots never drive the clock
+        self.monitor.maybe_capture(self.game_counter, self.player_dict, include_current=False)
+        passive_actions = self.check_passive()
+        player_actions = self.check_players()
+        self.monitor.maybe_capture(self.game_counter, self.player_dict)
+        all_actions = passive_actions + player_actions
+
+        numeric_actions = [val for val in passive_actions if isinstance(val, (int, float))]
+        next_player_due = self.scheduler.next_due()
+        if next_player_due is not None:
+            numeric_actions.append(next_player_due - self.game_counter)
+        if numeric_actions:
+            min_elapsed = min(numeric_actions)
+        elif len(all_actions) > 0:
+            # fallback when only sentinels remain; move to heartbeat once scheduler refactored.
+            min_elapsed = 1
+        else:
+            # [ISS-019] temporal fallback hides stalled sims; replace with heartbeat event or explicit guard.
+            min_elapsed = 1
+
+        self.logger.log_tick(
+            turn=self.turn_counter,
+            game_time=self.game_counter,
+            elapsed=self.time_elapsed,
+            scheduled_delay=min_elapsed,
+            passive_candidates=passive_actions,
+            player_candidates=player_actions,
+        )
+
+        self.time_will_elapse = min_elapsed
+        # [ISS-020] enrich metrics/logging once kernel endorses tick summaries.
+        self.turn_counter += 1
@@ -1,27 +1,53 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Set, Tuple
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from simulation_runner.background_writer import BackgroundWriter
+from simulation_runner.run_ids import allocate_run_id
+from simulation_runner.snapshot_store import IntervalAggregates, SnapshotStore
 
 SNAPSHOT_INTERVAL_DEFAULT = 900  # seconds
 
-_snapshots: List[Dict[str, object]] = []
-_snapshot_interval: int = SNAPSHOT_INTERVAL_DEFAULT
-_next_snapshot_due: Optional[int] = None
-_current_variant: Optional[str] = None
-_current_metadata: Dict[str, object] = {}
-_snapshot_keys: Set[Tuple[object, object, object]] = set()
+#(until, interval) segments in seconds: snapshot every `interval` up to `until`; the last
+#segment's `until` may be None (and past a finite one the last interval carries on)
+SnapshotSchedule = Sequence[Tuple[Optional[int], int]]
+#15 minutes for the first day, hourly to the end of the first week, then every 6 hours
+LONG_RUN_SCHEDULE: Tuple[Tuple[Optional[int], int], ...] = ((86400, 900), (7 * 86400, 3600), (None, 6 * 3600))
+
+
+def normalise_schedule(schedule: Optional[SnapshotSchedule], interval: int = SNAPSHOT_INTERVAL_DEFAULT) -> Tuple[Tuple[Optional[int], int], ...]:
+    """Validate a resolution schedule; ``None`` means a uniform ``interval``."""
+    if schedule is None:
+        return ((None, max(1, int(interval))),)
+    segments: List[Tuple[Optional[int], int]] = []
+    previous_until = 0
+    for index, (until, step) in enumerate(schedule):
+        step = int(step)
+        if step <= 0:
+            raise ValueError(f"snapshot interval must be positive, got {step}")
+        if until is None:
+            if index != len(schedule) - 1:
+                raise ValueError("only the last schedule segment may be open-ended")
+        else:
+            until = int(until)
+            if until <= previous_until:
+                raise ValueError(f"schedule segments must end in increasing order, got {until} after {previous_until}")
+            previous_until = until
+        segments.append((until, step))
+    if not segments:
+        raise ValueError("snapshot schedule needs at least one segment")
+    return tuple(segments)
 
 
-def reset(interval: int = SNAPSHOT_INTERVAL_DEFAULT, variant: Optional[str] = None, metadata: Optional[Dict[str, object]] = None) -> None:
-    """Prepare snapshot storage for a new simulation run."""
-    global _snapshots, _snapshot_interval, _next_snapshot_due, _current_variant, _current_metadata, _snapshot_keys
-    _snapshots = []
-    _snapshot_interval = max(1, int(interval))
-    _next_snapshot_due = _snapshot_interval
-    _current_variant = variant
-    _current_metadata = metadata or {}
-    _snapshot_keys.clear()
+def describe_schedule(schedule: Sequence[Tuple[Optional[int], int]]) -> str:
+    """Short human-readable resolution used in chart titles."""
+    if len(schedule) == 1:
+        return f"per {schedule[0][1] / 60:g}-minute interval"
+    parts = [f"{step / 60:g} min to {until / 3600:g} h" for until, step in schedule if until is not None]
+    return "every " + ", ".join(parts) + f", then {schedule[-1][1] / 60:g} min"
 
 
 def _iter_villages(player_dict: Dict[str, object]):
@@ -34,173 +60,70 @@ def _iter_villages(player_dict: Dict[str, object]):
             yield controller, player_name, ai_label, village
 
 
-def _serialise_village_record(player_name: str, ai_label: str, village, game_time: int, controller: Optional[object] = None) -> Dict[str, object]:
-    """Convert a single village state into a snapshot record."""
-    stored = list(getattr(village, "stored", [0, 0, 0, 0]))
-    location = getattr(village, "location", None)
-    population = getattr(village, "population", 0)
-    culture_total = getattr(village, "culture_points_total", 0.0)
-    culture_rate = getattr(village, "culture_points_rate", 0.0)
-    total_yield = getattr(village, "total_yield", 0.0)
-    try:
-        yield_values = list(village.yield_calc())
-    except Exception:  # pragma: no cover - defensive; yield_calc should not raise.
-        yield_values = [0.0, 0.0, 0.0, 0.0]
-    # convert per-second yield to per-hour for readability
-    wood_yield = yield_values[0] * 3600 if len(yield_values) > 0 else 0.0
-    clay_yield = yield_values[1] * 3600 if len(yield_values) > 1 else 0.0
-    iron_yield = yield_values[2] * 3600 if len(yield_values) > 2 else 0.0
-    crop_yield = yield_values[3] * 3600 if len(yield_values) > 3 else 0.0
-    crop_stock = stored[3] if len(stored) > 3 else 0.0
-    controller_ref = controller or getattr(village, "owner", None)
-    settlers_built = getattr(controller_ref, "settlers_built", 0)
-    settle_points = getattr(controller_ref, "settle_points", 0)
-    return {
-        "time": int(game_time),
-        "minutes": game_time / 60.0,
-        "player": player_name,
-        "ai_label": ai_label,
-        "village_location": location,
-        "wood_yield": wood_yield,
-        "clay_yield": clay_yield,
-        "iron_yield": iron_yield,
-        "crop_yield": crop_yield,
-        "crop_stock": crop_stock,
-        "population": population,
-        "total_yield": total_yield,
-        "culture_total": culture_total,
-        "culture_rate": culture_rate,
-        "settlers_built": settlers_built,
-        "settle_points": settle_points,
-        "run_variant": _current_variant,
-        **_current_metadata,
-    }
-
-
-def capture_snapshot(game_time: int, player_dict: Dict[str, object]) -> None:
-    """Persist the current village state for every controller."""
-    for controller, player_name, ai_label, village in _iter_villages(player_dict):
-        location = getattr(village, "location", None)
-        key = (game_time, player_name, location)
-        if key in _snapshot_keys:
-            continue
-        _snapshot_keys.add(key)
-        _snapshots.append(_serialise_village_record(player_name, ai_label, village, game_time, controller))
-
-
-def capture_initial(game_time: int, player_dict: Dict[str, object]) -> None:
-    """Take an initial snapshot before the first tick."""
-    capture_snapshot(game_time, player_dict)
-
-
-def maybe_capture(game_time: int, player_dict: Dict[str, object]) -> None:
-    """Record snapshots whenever the scheduled boundary has been reached."""
-    global _next_snapshot_due
-    if _next_snapshot_due is None:
-        return
-    while game_time >= _next_snapshot_due:
-        capture_snapshot(_next_snapshot_due, player_dict)
-        _next_snapshot_due += _snapshot_interval
-
+EXPORT_METRICS: List[str] = [
+    "wood_yield",
+    "clay_yield",
+    "iron_yield",
+    "crop_yield",
+    "crop_stock",
+    "total_yield",
+    "population",
+    "culture_total",
+    "culture_rate",
+    "settlers_built",
+    "settle_points",
+]
+
+
+def aggregate_snapshots(df, metrics: Optional[List[str]] = None):
+    """Long table of best/worst/average per (run_variant, ai_label, time, metric).
+
+    Rows are ordered by group, then by metric in ``metrics`` order.
+    """
+    if metrics is None:
+        metrics = EXPORT_METRICS
+    keys = ["run_variant", "ai_label", "time"]
+    stats = df.groupby(keys, observed=True)[metrics].agg(["max", "min", "mean"])
+    #(metric, stat) columns -> one row per (group, metric): each stat block is a groups x metrics
+    #array, so its row-major ravel lines up with the group keys repeated once per metric.
+    #Built from plain arrays rather than DataFrame.stack, whose signature differs across pandas versions.
+    groups = stats.index.to_frame(index=False)
+    aggregated = groups.loc[groups.index.repeat(len(metrics))].reset_index(drop=True)
+    aggregated.insert(keys.index("time") + 1, "minutes", aggregated["time"] / 60.0)
+    aggregated["metric"] = np.tile(np.asarray(metrics, dtype=object), len(groups))
+    for column, stat in (("best", "max"), ("worst", "min"), ("average", "mean")):
+        aggregated[column] = stats.xs(stat, axis=1, level=1)[metrics].to_numpy(dtype=np.float64).ravel()
+    return aggregated
+
+
+def _write_exports(df, run_dir: Path, aggregated=None, resolution: str = "per 15-minute interval"):
+    """Write one run's snapshot CSV (if raw rows were kept), aggregate CSV and charts into ``run_dir``.
+
+    Charts plot against the ``minutes`` column, so a non-uniform snapshot
+    schedule just gives unevenly spaced points; ``resolution`` names it in the titles.
+    """
+    metrics = EXPORT_METRICS
+    if aggregated is None:
+        aggregated = aggregate_snapshots(df, metrics)
 
-def final_capture(game_time: int, player_dict: Dict[str, object]) -> None:
-    """Force a final snapshot regardless of schedule."""
-    capture_snapshot(game_time, player_dict)
-
-
-def seconds_until_next_snapshot(game_time: int) -> Optional[int]:
-    """Return seconds remaining until the next scheduled snapshot."""
-    if _next_snapshot_due is None:
-        return None
-    delta = _next_snapshot_due - game_time
-    if delta <= 0:
-        return 0
-    return delta
-
-
-def get_snapshots() -> List[Dict[str, object]]:
-    """Expose a shallow copy of the collected records."""
-    return list(_snapshots)
-
-
-def export_results(run_id: str, output_label: str, output_dir: Optional[Path] = None):
-    """Write snapshot and aggregate data frames to disk and emit charts."""
-    if not _snapshots:
-        return None, None
-
-    try:
-        import pandas as pd  # type: ignore
-    except ImportError:  # pragma: no cover - optional dependency
-        raise RuntimeError("pandas is required to export monitoring snapshots.") from None
-
-    df = pd.DataFrame(_snapshots)
-
-    metrics = [
-        "wood_yield",
-        "clay_yield",
-        "iron_yield",
-        "crop_yield",
-        "crop_stock",
-        "total_yield",
-        "population",
-        "culture_total",
-        "culture_rate",
-        "settlers_built",
-        "settle_points",
-    ]
-    grouped = (
-        df.groupby(["run_variant", "ai_label", "time"])[metrics]
-        .agg(["max", "min", "mean"])
-        .reset_index()
-    )
-    flat_columns: List[str] = []
-    for col in grouped.columns:
-        if isinstance(col, tuple):
-            pieces = [str(part) for part in col if part]
-            flat_columns.append("_".join(pieces))
-        else:
-            flat_columns.append(str(col))
-    grouped.columns = flat_columns
-
-    reshaped_rows = []
-    for _, row in grouped.iterrows():
-        run_variant = row["run_variant"]
-        ai_label = row["ai_label"]
-        time_value = row["time"]
-        for metric in metrics:
-            reshaped_rows.append(
-                {
-                    "run_variant": run_variant,
-                    "ai_label": ai_label,
-                    "time": time_value,
-                    "minutes": time_value / 60.0,
-                    "metric": metric,
-                    "best": row[f"{metric}_max"],
-                    "worst": row[f"{metric}_min"],
-                    "average": row[f"{metric}_mean"],
-                }
-            )
-    aggregated = pd.DataFrame(reshaped_rows)
-
-    if output_dir is None:
-        output_dir = Path("simulation_logs") / "monitoring"
-    output_dir.mkdir(parents=True, exist_ok=True)
-    run_dir = output_dir / f"run_{run_id}_{output_label}"
     run_dir.mkdir(parents=True, exist_ok=True)
 
-    df.to_csv(run_dir / "snapshots.csv", index=False)
+    if df is not None:
+        df.to_csv(run_dir / "snapshots.csv", index=False)
     aggregated.to_csv(run_dir / "aggregated.csv", index=False)
 
     try:
-        import matplotlib.pyplot as plt  # type: ignore
+        #Figure objects render through Agg without pyplot's global state, which is not
+        #safe off the main thread (exports usually run on the background writer)
+        from matplotlib.figure import Figure  # type: ignore
 
-        plt.switch_backend("Agg")
         for metric in metrics:
             metric_df = aggregated[aggregated["metric"] == metric]
             if metric_df.empty:
                 continue
-            fig, ax = plt.subplots(figsize=(10, 6))
-            for ai_label, series in metric_df.groupby("ai_label"):
+            fig = Figure(figsize=(10, 6))
+            ax = fig.subplots()
+            for ai_label, series in metric_df.groupby("ai_label", observed=True):
                 series = series.sort_values("minutes")
                 ax.plot(series["minutes"], series["average"], label=f"{ai_label} avg")
                 ax.fill_between(
@@ -210,15 +133,269 @@ def export_results(run_id: str, output_label: str, output_dir: Optional[Path] =
                     alpha=0.15,
                     label=f"{ai_label} range"
                 )
-            ax.set_title(f"{metric.replace('_', ' ').title()} per 15-minute interval")
+            ax.set_title(f"{metric.replace('_', ' ').title()} {resolution}")
             ax.set_xlabel("Time (minutes)")
             ax.set_ylabel(metric.replace("_", " ").title())
             ax.legend(loc="upper left", fontsize="small", ncol=2)
             ax.grid(True, linestyle="--", linewidth=0.5, alpha=0.5)
             fig.tight_layout()
             fig.savefig(run_dir / f"{metric}_trend.png")
-            plt.close(fig)
     except ImportError:  # pragma: no cover - optional plotting
         pass
 
     return df, aggregated
+
+
+class PeriodicMonitor:
+    """Snapshot store for a single simulation run.
+
+    Each ``GameState`` owns one instance; the module-level helpers below
+    delegate to a default instance for single-run callers.
+
+    With ``aggregate_only`` the monitor keeps only running best/worst/mean
+    per (ai_label, interval) rather than every village row; the export then
+    writes the same aggregated CSV and charts but no snapshots.csv.
+
+    A ``schedule`` of (until, interval) segments, e.g. ``LONG_RUN_SCHEDULE``,
+    replaces the uniform ``interval`` so long runs are sampled more coarsely
+    as they go on.
+    """
+
+    def __init__(
+        self,
+        interval: int = SNAPSHOT_INTERVAL_DEFAULT,
+        variant: Optional[str] = None,
+        metadata: Optional[Dict[str, object]] = None,
+        aggregate_only: bool = False,
+        schedule: Optional[SnapshotSchedule] = None,
+    ) -> None:
+        self.schedule = normalise_schedule(schedule, interval)
+        self.interval: int = self.schedule[0][1]
+        self.next_snapshot_due: Optional[int] = None
+        self.variant: Optional[str] = variant
+        self.metadata: Dict[str, object] = metadata or {}
+        self.aggregate_only = aggregate_only
+        self.store = self._new_store()
+
+    def _new_store(self) -> Union[SnapshotStore, IntervalAggregates]:
+        if self.aggregate_only:
+            return IntervalAggregates(EXPORT_METRICS)
+        return SnapshotStore(self.metadata)
+
+    def reset(
+        self,
+        interval: int = SNAPSHOT_INTERVAL_DEFAULT,
+        variant: Optional[str] = None,
+        metadata: Optional[Dict[str, object]] = None,
+        aggregate_only: Optional[bool] = None,
+        schedule: Optional[SnapshotSchedule] = None,
+    ) -> None:
+        """Prepare snapshot storage for a new simulation run (``aggregate_only=None`` keeps the mode)."""
+        self.schedule = normalise_schedule(schedule, interval)
+        self.interval = self.schedule[0][1]
+        self.next_snapshot_due = self._boundary_after(0)
+        self.variant = variant
+        self.metadata = metadata or {}
+        if aggregate_only is not None:
+            self.aggregate_only = aggregate_only
+        #a fresh store rather than clearing, since an export may still hold views of the old one
+        self.store = self._new_store()
+
+    def _boundary_after(self, boundary: int) -> int:
+        """Next snapshot time after ``boundary``; segment ends are always boundaries."""
+        for until, step in self.schedule:
+            if until is None or boundary < until:
+                following = boundary + step
+                return following if until is None else min(following, until)
+        return boundary + self.schedule[-1][1]
+
+    def _record_village(self, player_name: str, ai_label: str, village, game_time: int, controller: Optional[object] = None) -> None:
+        """Append a single village state to the snapshot store (or fold it into the aggregates)."""
+        location = getattr(village, "location", None)
+        population = getattr(village, "population", 0)
+        # read lazily-accrued stock and culture at the snapshot time rather than the owner's last wake
+        if hasattr(village, "resources_at"):
+            stored = village.resources_at(game_time)
+            culture_total = village.culture_total_at(game_time)
+        else:
+            stored = list(getattr(village, "stored", [0, 0, 0, 0]))
+            culture_total = getattr(village, "culture_points_total", 0.0)
+        culture_rate = getattr(village, "culture_points_rate", 0.0)
+        total_yield = getattr(village, "total_yield", 0.0)
+        try:
+            yield_values = list(village.yield_calc())
+        except Exception:  # pragma: no cover - defensive; yield_calc should not raise.
+            yield_values = [0.0, 0.0, 0.0, 0.0]
+        # convert per-second yield to per-hour for readability
+        wood_yield = yield_values[0] * 3600 if len(yield_values) > 0 else 0.0
+        clay_yield = yield_values[1] * 3600 if len(yield_values) > 1 else 0.0
+        iron_yield = yield_values[2] * 3600 if len(yield_values) > 2 else 0.0
+        crop_yield = yield_values[3] * 3600 if len(yield_values) > 3 else 0.0
+        crop_stock = stored[3] if len(stored) > 3 else 0.0
+        controller_ref = controller or getattr(village, "owner", None)
+        settlers_built = getattr(controller_ref, "settlers_built", 0)
+        settle_points = getattr(controller_ref, "settle_points", 0)
+        self.store.append(
+            int(game_time),
+            player_name,
+            ai_label,
+            location,
+            self.variant,
+            wood_yield=wood_yield,
+            clay_yield=clay_yield,
+            iron_yield=iron_yield,
+            crop_yield=crop_yield,
+            crop_stock=crop_stock,
+            population=population,
+            total_yield=total_yield,
+            culture_total=culture_total,
+            culture_rate=culture_rate,
+            settlers_built=settlers_built,
+            settle_points=settle_points,
+        )
+
+    def capture_snapshot(self, game_time: int, player_dict: Dict[str, object]) -> None:
+        """Persist the current village state for every controller."""
+        for controller, player_name, ai_label, village in _iter_villages(player_dict):
+            self._record_village(player_name, ai_label, village, game_time, controller)
+
+    def capture_initial(self, game_time: int, player_dict: Dict[str, object]) -> None:
+        """Take an initial snapshot before the first tick."""
+        self.capture_snapshot(game_time, player_dict)
+
+    def maybe_capture(self, game_time: int, player_dict: Dict[str, object], include_current: bool = True) -> None:
+        """Record snapshots for every scheduled boundary up to ``game_time``.
+
+        Boundaries the clock skipped over are stamped at the boundary itself:
+        village state only changes at ticks, and stock and culture are read
+        through the villages' lazy accrual, so the values are exact provided
+        this runs before the tick's events (``include_current=False`` leaves a
+        boundary equal to ``game_time`` for the call after them).
+        """
+        if self.next_snapshot_due is None:
+            return
+        while game_time > self.next_snapshot_due or (include_current and game_time == self.next_snapshot_due):
+            self.capture_snapshot(self.next_snapshot_due, player_dict)
+            self.next_snapshot_due = self._boundary_after(self.next_snapshot_due)
+
+    def final_capture(self, game_time: int, player_dict: Dict[str, object]) -> None:
+        """Force a final snapshot regardless of schedule."""
+        self.capture_snapshot(game_time, player_dict)
+
+    def seconds_until_next_snapshot(self, game_time: int) -> Optional[int]:
+        """Return seconds remaining until the next scheduled snapshot."""
+        if self.next_snapshot_due is None:
+            return None
+        delta = self.next_snapshot_due - game_time
+        if delta <= 0:
+            return 0
+        return delta
+
+    def get_snapshots(self) -> List[Dict[str, object]]:
+        """Materialise the collected rows as one dict per village snapshot."""
+        return self.store.records()
+
+    def export_results(
+        self,
+        run_id: Optional[str],
+        output_label: str,
+        output_dir: Optional[Path] = None,
+        writer: Optional[BackgroundWriter] = None,
+        on_error: Optional[Callable[[BaseException], object]] = None,
+    ):
+        """Write snapshot and aggregate data frames to disk and emit charts.
+
+        Pass the run logger's id to pair the export with its log; ``None`` claims a fresh id.
+        With a ``writer`` the files are produced on its background thread and a
+        ``Future`` resolving to the two data frames is returned instead; a failure
+        there goes to ``on_error`` when given, rather than being raised by ``writer.flush()``.
+        """
+        if not len(self.store):
+            return None, None
+
+        try:
+            import pandas  # type: ignore  # noqa: F401
+        except ImportError:  # pragma: no cover - optional dependency
+            raise RuntimeError("pandas is required to export monitoring snapshots.") from None
+
+        if output_dir is None:
+            output_dir = Path("simulation_logs") / "monitoring"
+        output_dir.mkdir(parents=True, exist_ok=True)
+        if run_id is None:
+            run_id = allocate_run_id(output_dir.parent)
+        run_dir = output_dir / f"run_{run_id}_{output_label}"
+        if isinstance(self.store, IntervalAggregates):
+            df = None
+            aggregated = self.store.aggregate_frame()
+        else:
+            #the frame views the store's arrays; later captures only write past its last row
+            df = self.store.to_frame()
+            aggregated = None
+        resolution = describe_schedule(self.schedule)
+        if writer is not None:
+            if on_error is not None:
+                return writer.submit_handled(on_error, _write_exports, df, run_dir, aggregated, resolution)
+            return writer.submit(_write_exports, df, run_dir, aggregated, resolution)
+        return _write_exports(df, run_dir, aggregated, resolution)
+
+
+# Default monitor backing the module-level helpers.
+_default_monitor = PeriodicMonitor()
+
+
+def reset(
+    interval: int = SNAPSHOT_INTERVAL_DEFAULT,
+    variant: Optional[str] = None,
+    metadata: Optional[Dict[str, object]] = None,
+    aggregate_only: Optional[bool] = None,
+    schedule: Optional[SnapshotSchedule] = None,
+) -> None:
+    """Prepare snapshot storage for a new simulation run."""
+    _default_monitor.reset(
+        interval=interval,
+        variant=variant,
+        metadata=metadata,
+        aggregate_only=aggregate_only,
+        schedule=schedule,
+    )
+
+
+def capture_snapshot(game_time: int, player_dict: Dict[str, object]) -> None:
+    """Persist the current village state for every controller."""
+    _default_monitor.capture_snapshot(game_time, player_dict)
+
+
+def capture_initial(game_time: int, player_dict: Dict[str, object]) -> None:
+    """Take an initial snapshot before the first tick."""
+    _default_monitor.capture_initial(game_time, player_dict)
+
+
+def maybe_capture(game_time: int, player_dict: Dict[str, object], include_current: bool = True) -> None:
+    """Record snapshots for every scheduled boundary up to ``game_time``."""
+    _default_monitor.maybe_capture(game_time, player_dict, include_current=include_current)
+
+
+def final_capture(game_time: int, player_dict: Dict[str, object]) -> None:
+    """Force a final snapshot regardless of schedule."""
+    _default_monitor.final_capture(game_time, player_dict)
+
+
+def seconds_until_next_snapshot(game_time: int) -> Optional[int]:
+    """Return seconds remaining until the next scheduled snapshot."""
+    return _default_monitor.seconds_until_next_snapshot(game_time)
+
+
+def get_snapshots() -> List[Dict[str, object]]:
+    """Expose a shallow copy of the collected records."""
+    return _default_monitor.get_snapshots()
+
+
+def export_results(
+    run_id: Optional[str],
+    output_label: str,
+    output_dir: Optional[Path] = None,
+    writer: Optional[BackgroundWriter] = None,
+    on_error: Optional[Callable[[BaseException], object]] = None,
+):
+    """Write snapshot and aggregate data frames to disk and emit charts."""
+    return _default_monitor.export_results(run_id, output_label, output_dir, writer, on_error)
@@ -0,0 +1,76 @@
+"""Concurrency-safe allocation of sequential run ids.
+
+Each id is claimed by exclusively creating a marker file under
+``<registry_dir>/run_ids/``; ``O_CREAT | O_EXCL`` is atomic on every
+platform, so parallel workers sharing a log directory can never be handed
+the same id. A ``next`` hint file remembers where the last allocation
+stopped, so claiming an id costs a handful of file operations rather than
+a scan over every earlier run. The hint is advisory only: a stale or
+missing hint just means a few extra probes.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+from pathlib import Path
+from typing import Optional
+
+RUN_ID_REGISTRY_DIR = Path("simulation_logs")
+_RESERVATION_DIR = "run_ids"
+_HINT_FILE = "next"
+_ID_PATTERN = re.compile(r"run_(\d+)")
+
+
+def _format_run_id(number: int) -> str:
+    return f"{number:05d}"
+
+
+def _read_hint(reservations: Path) -> Optional[int]:
+    try:
+        return max(1, int((reservations / _HINT_FILE).read_text(encoding="utf-8").strip()))
+    except (OSError, ValueError):
+        return None
+
+
+def _write_hint(reservations: Path, number: int) -> None:
+    # rename into place so a concurrent reader never sees a half-written number
+    tmp_path = reservations / f"{_HINT_FILE}.{os.getpid()}.tmp"
+    try:
+        tmp_path.write_text(str(number), encoding="utf-8")
+        os.replace(tmp_path, reservations / _HINT_FILE)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+
+
+def _first_free_after_existing_runs(registry_dir: Path) -> int:
+    # one-off scan for directories that predate the registry
+    highest = 0
+    for path in registry_dir.glob("run_*"):
+        match = _ID_PATTERN.match(path.name)
+        if match:
+            highest = max(highest, int(match.group(1)))
+    return highest + 1
+
+
+def allocate_run_id(registry_dir: Optional[Path] = None) -> str:
+    """Claim the next unused run id under ``registry_dir`` and return it as a zero-padded string."""
+    registry_dir = Path(registry_dir) if registry_dir is not None else RUN_ID_REGISTRY_DIR
+    reservations = registry_dir / _RESERVATION_DIR
+    reservations.mkdir(parents=True, exist_ok=True)
+    number = _read_hint(reservations)
+    if number is None:
+        number = _first_free_after_existing_runs(registry_dir)
+    while True:
+        run_id = _format_run_id(number)
+        try:
+            fd = os.open(reservations / run_id, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            number += 1
+            continue
+        os.close(fd)
+        _write_hint(reservations, number + 1)
+        return run_id
+
+
+__all__ = ["RUN_ID_REGISTRY_DIR", "allocate_run_id"]
@@ -1,58 +1,81 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import IO, Any, Callable, Dict, Iterator, List, Optional, Union
+import gzip
 import json
+import lzma
 
-RUN_METADATA: Dict[str, Any] = {}
-RUN_EVENTS: List[Dict[str, Any]] = []
+from simulation_runner.background_writer import BackgroundWriter
+from simulation_runner.run_ids import allocate_run_id
 
 LOG_DIR = Path("simulation_logs")
 LOG_DIR.mkdir(parents=True, exist_ok=True)
 SCOREBOARD_DIR = LOG_DIR / "scoreboards"
 SCOREBOARD_DIR.mkdir(parents=True, exist_ok=True)
 
+#compression name -> file suffix; None writes plain text
+COMPRESSION_SUFFIXES = {None: "", "gzip": ".gz", "lzma": ".xz"}
+_COMPACT_SEPARATORS = (",", ":")
 
-def reset() -> None:
-    RUN_METADATA.clear()
-    RUN_EVENTS.clear()
 
+def _open_text(path: Path, mode: str) -> IO[str]:
+    """Open a log or scoreboard file, (de)compressing according to its suffix."""
+    if path.suffix == ".gz":
+        #level 6 is close to level 9 in size on JSON and several times faster to write
+        return gzip.open(path, mode + "t", encoding="utf-8", compresslevel=6)
+    if path.suffix in (".xz", ".lzma"):
+        return lzma.open(path, mode + "t", encoding="utf-8")
+    return path.open(mode, encoding="utf-8", buffering=1 << 16)
 
-def start_run(metadata: Dict[str, Any]) -> None:
-    """Initialise logging for a new simulation run."""
-    reset()
-    RUN_METADATA.update(metadata)
-    log_event("run_started", {"metadata": metadata})
 
+def _dumps(payload: Any) -> str:
+    return json.dumps(payload, separators=_COMPACT_SEPARATORS)
+
+
+def _is_whole_document(path: Path) -> bool:
+    #run_<id>.json(.gz) logs predate streaming and hold one {"metadata", "events", ...} object
+    return path.name.split(".")[1:2] == ["json"]
+
+
+VERBOSITY_OFF = "off"
+VERBOSITY_FULL = "full"
+#header and summary events carry the run's metadata and results, so they are never filtered
+_UNFILTERED_EVENTS = ("run_started", "run_summary")
+
+
+#column order of scoreboard rows as written to scoreboard_<id>.json
+_SCOREBOARD_COLUMNS = (
+    "player",
+    "actions",
+    "completions",
+    "ai_label",
+    "population",
+    "culture_rate",
+    "culture_total",
+    "total_yield",
+    "resources",
+    "storage_cap",
+    "settlers_built",
+    "settle_points",
+    "last_game_time",
+    "last_village",
+    "last_event_type",
+    "last_action_type",
+    "last_target",
+    "last_wait_time",
+)
 
-def log_event(event_type: str, payload: Dict[str, Any]) -> None:
-    """Append an arbitrary event payload to the log."""
-    entry = {"event": event_type}
-    entry.update(payload)
-    RUN_EVENTS.append(entry)
-
-
-def log_tick(
-    *,
-    turn: int,
-    game_time: int,
-    elapsed: int,
-    scheduled_delay: int,
-    passive_candidates: List[int],
-    player_candidates: List[int],
-) -> None:
-    """Record summary information for a single scheduler tick."""
-    log_event(
-        "tick",
-        {
-            "turn": turn,
-            "game_time": game_time,
-            "elapsed": elapsed,
-            "scheduled_delay": scheduled_delay,
-            "passive_candidates": list(passive_candidates),
-            "player_candidates": list(player_candidates),
-        },
-    )
+
+def _sample_interval(level: Any) -> int:
+    """Map a verbosity level to "keep every Nth event"; 0 drops the type entirely."""
+    if level is None or level == VERBOSITY_FULL or level is True:
+        return 1
+    if level == VERBOSITY_OFF or level is False:
+        return 0
+    if isinstance(level, int) and level >= 1:
+        return level
+    raise ValueError(f"Verbosity must be 'off', 'full' or a positive sample interval, received {level!r}")
 
 
 def _serialise_location(location: Optional[Any]) -> Optional[Any]:
@@ -63,218 +86,540 @@ def _serialise_location(location: Optional[Any]) -> Optional[Any]:
     return location
 
 
-def log_action(
-    *,
-    player: str,
-    village_location: Optional[Any],
-    action_type: str,
-    target: Optional[str],
-    wait_time: Optional[int],
-    reason: Optional[str] = None,
-    population: Optional[int] = None,
-    culture_rate: Optional[float] = None,
-    culture_total: Optional[float] = None,
-    total_yield: Optional[float] = None,
-    ai_label: Optional[str] = None,
-) -> None:
-    """Record the action (or inaction) chosen by a controller."""
-    payload: Dict[str, Any] = {
-        "player": player,
-        "village": _serialise_location(village_location),
-        "action_type": action_type,
-        "target": target,
-        "wait_time": wait_time,
-    }
-    if reason is not None:
-        payload["reason"] = reason
-    if population is not None:
-        payload["population"] = population
-    if culture_rate is not None:
-        payload["culture_rate"] = culture_rate
-    if culture_total is not None:
-        payload["culture_total"] = culture_total
-    if total_yield is not None:
-        payload["total_yield"] = total_yield
-    if ai_label is not None:
-        payload["ai_label"] = ai_label
-    log_event("action", payload)
-
-
-def log_completion(
-    *,
-    player: str,
-    village_location: Optional[Any],
-    job_type: str,
-    target: str,
-    population: Optional[int] = None,
-    culture_rate: Optional[float] = None,
-    culture_total: Optional[float] = None,
-    total_yield: Optional[float] = None,
-    resources: Optional[List[float]] = None,
-    storage_cap: Optional[List[float]] = None,
-    ai_label: Optional[str] = None,
-    game_time: Optional[int] = None,
-    settlers_built: Optional[int] = None,
-    settle_points: Optional[int] = None,
-) -> None:
-    """Record completion of a queued job."""
-    payload: Dict[str, Any] = {
-        "player": player,
-        "village": _serialise_location(village_location),
-        "job_type": job_type,
-        "target": target,
-    }
-    if game_time is not None:
-        payload["game_time"] = game_time
-    if population is not None:
-        payload["population"] = population
-    if culture_rate is not None:
-        payload["culture_rate"] = culture_rate
-    if culture_total is not None:
-        payload["culture_total"] = culture_total
-    if total_yield is not None:
-        payload["total_yield"] = total_yield
-    if resources is not None:
-        payload["resources"] = list(resources)
-    if storage_cap is not None:
-        payload["storage_cap"] = list(storage_cap)
-    if ai_label is not None:
-        payload["ai_label"] = ai_label
-    if settlers_built is not None:
-        payload["settlers_built"] = settlers_built
-    if settle_points is not None:
-        payload["settle_points"] = settle_points
-    log_event("completion", payload)
+class EventStream:
+    """Re-iterable view over a run's JSON Lines event file.
 
+    Each iteration re-reads the file from the start, so only one event is
+    held in memory at a time. ``flush`` is called first so events still
+    sitting in the writer's buffer are visible mid-run; gzip logs are
+    sync-flushed, while lzma logs only expose complete compressed blocks
+    until the run is finalised.
+    """
 
+    def __init__(self, path: Path, count: int, flush: Optional[Callable[[], None]] = None) -> None:
+        self.path = path
+        self._count = count
+        self._flush = flush
 
-def finalise_run(summary: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-    """Close out the run and return the collected log."""
-    if summary is None:
-        summary = {}
-    settle_goal = RUN_METADATA.get("settle_goal")
-    if settle_goal is not None and "settle_goal" not in summary:
-        summary["settle_goal"] = settle_goal
-    player_settle_points: Dict[str, int] = {}
-    total_settlements = 0
-    settle_goal_time: Optional[int] = None
-    for event in RUN_EVENTS:
-        if event.get("event") != "completion" or event.get("job_type") != "settle":
-            continue
-        total_settlements += 1
-        player = event.get("player")
-        if player is not None:
-            points = event.get("settle_points")
-            if points is not None:
-                player_settle_points[player] = points
-            else:
-                player_settle_points[player] = player_settle_points.get(player, 0) + 1
-        if settle_goal_time is None and isinstance(settle_goal, int) and total_settlements >= settle_goal:
-            settle_goal_time = event.get("game_time")
-    summary.setdefault("total_settlements", total_settlements)
-    summary.setdefault("settle_goal_reached_time", settle_goal_time)
-    summary.setdefault("settle_points", player_settle_points)
-    threshold_met = False
-    if isinstance(settle_goal, int):
-        threshold_met = total_settlements >= settle_goal
-    summary.setdefault("settle_threshold_met", threshold_met)
-    settle_points_map = summary.get("settle_points") or {}
-    if isinstance(settle_points_map, dict):
-        max_points = max(settle_points_map.values(), default=0)
-        winners = [player for player, points in settle_points_map.items() if points == max_points and points > 0]
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        if self._flush is not None:
+            self._flush()
+        with _open_text(self.path, "r") as fh:
+            if _is_whole_document(self.path):
+                yield from json.load(fh).get("events", [])
+                return
+            try:
+                for line in fh:
+                    if line.strip():
+                        yield json.loads(line)
+            except EOFError:
+                #a compressed log that is still being written has no end-of-stream marker yet
+                if self._flush is None:
+                    raise
+
+    def __len__(self) -> int:
+        return self._count
+
+
+def read_events(path: Path) -> EventStream:
+    """Iterate the events of a finished run log, plain or compressed, without loading it whole."""
+    path = Path(path)
+    if _is_whole_document(path):
+        with _open_text(path, "r") as fh:
+            count = len(json.load(fh).get("events", []))
     else:
-        winners = []
-    summary.setdefault("settle_winners", winners)
-    if summary is not None:
-        log_event("run_summary", summary)
-    payload = {"metadata": RUN_METADATA.copy(), "events": list(RUN_EVENTS)}
-    scoreboard = _build_scoreboard(summary.get("settle_points") if isinstance(summary.get("settle_points"), dict) else None)
-    payload["scoreboard"] = {"players": scoreboard}
-    run_id = _write_log_to_disk(payload)
-    scoreboard_path = _write_scoreboard_to_disk(run_id, scoreboard)
-    payload["metadata"]["scoreboard_path"] = str(scoreboard_path)
-    return payload
-
-
-def _write_log_to_disk(payload: Dict[str, Any]) -> str:
-    run_id = payload["metadata"].get("run_id")
-    if run_id is None:
-        existing = sorted(LOG_DIR.glob("run_*.json"))
-        next_id = len(existing) + 1
-        run_id = f"{next_id:05d}"
-        payload["metadata"]["run_id"] = run_id
-    log_path = LOG_DIR / f"run_{run_id}.json"
-    with log_path.open("w", encoding="utf-8") as fh:
-        json.dump(payload, fh, indent=2)
-    return run_id
-
-
-def _write_scoreboard_to_disk(run_id: str, scoreboard: List[Dict[str, Any]]) -> Path:
-    scoreboard_path = SCOREBOARD_DIR / f"scoreboard_{run_id}.json"
+        with _open_text(path, "r") as fh:
+            count = sum(1 for line in fh if line.strip())
+    return EventStream(path, count)
+
+
+def read_scoreboard(path: Path) -> Dict[str, Any]:
+    """Load a scoreboard file, plain or compressed."""
+    with _open_text(Path(path), "r") as fh:
+        return json.load(fh)
+
+
+def _write_scoreboard(scoreboard_path: Path, run_id: str, scoreboard: List[Dict[str, Any]]) -> None:
+    scoreboard_path.parent.mkdir(parents=True, exist_ok=True)
     payload = {"run_id": run_id, "players": scoreboard}
-    with scoreboard_path.open("w", encoding="utf-8") as fh:
-        json.dump(payload, fh, indent=2)
-    return scoreboard_path
+    with _open_text(scoreboard_path, "w") as fh:
+        json.dump(payload, fh, separators=_COMPACT_SEPARATORS)
 
 
-def _build_scoreboard(settle_points_map: Optional[Dict[str, int]] = None) -> List[Dict[str, Any]]:
-    per_player: Dict[str, Dict[str, Any]] = {}
-    for event in RUN_EVENTS:
-        player = event.get("player")
-        if player is None:
-            continue
-        entry = per_player.setdefault(
+class RunLogger:
+    """Event log for a single simulation run.
+
+    Each ``GameState`` owns one instance so several runs can share an
+    interpreter; the module-level helpers below delegate to a default
+    instance for callers that only ever run one simulation at a time.
+
+    Between ``start_run`` and ``finalise_run`` events are streamed to
+    ``run_<id>.jsonl`` as they are logged. They are only kept in ``events``
+    as well when ``retain_events`` is set; events logged outside a run have
+    nowhere else to go and are always kept.
+
+    ``compression`` ("gzip" or "lzma") compresses the event log and the
+    scoreboard as they are written; a run can also choose it with a
+    ``log_compression`` metadata entry.
+
+    With a ``writer`` (see ``background_writer``) the scoreboard file is
+    written off the simulation thread; its path is returned straight away
+    and the file exists once the writer has been flushed. The event log
+    itself is closed synchronously so the returned event stream is always
+    complete.
+
+    ``verbosity`` maps event types ("tick", "action", "completion", ...) to
+    ``"off"``, ``"full"`` or an integer N that keeps every Nth event. Types
+    not listed are logged in full. A run can override individual types with
+    a ``log_verbosity`` entry in its ``start_run`` metadata. Filtered events
+    are dropped before their payload is built.
+
+    The per-player scoreboard and settlement tally are updated on every
+    ``log_action``/``log_completion`` call, filtered or not, so they can be
+    read mid-run through ``scoreboard()`` and ``finalise_run`` never has to
+    rescan the event log.
+    """
+
+    def __init__(
+        self,
+        log_dir: Optional[Path] = None,
+        scoreboard_dir: Optional[Path] = None,
+        retain_events: bool = False,
+        verbosity: Optional[Dict[str, Any]] = None,
+        compression: Optional[str] = None,
+        writer: Optional[BackgroundWriter] = None,
+    ) -> None:
+        self.metadata: Dict[str, Any] = {}
+        self.events: List[Dict[str, Any]] = []
+        self.log_dir = log_dir if log_dir is not None else LOG_DIR
+        self.scoreboard_dir = scoreboard_dir if scoreboard_dir is not None else SCOREBOARD_DIR
+        self.retain_events = retain_events
+        self.log_path: Optional[Path] = None
+        self.event_count = 0
+        self._sink: Optional[IO[str]] = None
+        self.writer = writer
+        self.compression = compression
+        self._run_compression = compression
+        self.verbosity: Dict[str, Any] = dict(verbosity or {})
+        self._sample_intervals: Dict[str, int] = {}
+        self._sample_seen: Dict[str, int] = {}
+        self.configure_verbosity(self.verbosity)
+        self._scores: Dict[str, Dict[str, Any]] = {}
+        self.total_settlements = 0
+        self.settle_points: Dict[str, int] = {}
+        self.settle_goal_reached_time: Optional[int] = None
+
+    def reset(self) -> None:
+        self._close_sink()
+        self.log_path = None
+        self.event_count = 0
+        self._run_compression = self.compression
+        self.metadata.clear()
+        self.events.clear()
+        self.configure_verbosity(self.verbosity)
+        self._scores.clear()
+        self.total_settlements = 0
+        self.settle_points.clear()
+        self.settle_goal_reached_time = None
+
+    def start_run(self, metadata: Dict[str, Any]) -> None:
+        """Initialise logging for a new simulation run."""
+        self.reset()
+        self.metadata.update(metadata)
+        if metadata.get("log_verbosity") is not None:
+            #per-run levels layer over the logger's own defaults
+            self.configure_verbosity({**self.verbosity, **metadata["log_verbosity"]})
+        if metadata.get("log_compression") is not None:
+            self._run_compression = metadata["log_compression"]
+        self._open_sink()
+        self.log_event("run_started", {"metadata": metadata})
+
+    def configure_verbosity(self, verbosity: Dict[str, Any]) -> None:
+        """Apply per-event-type verbosity levels and restart sampling counters."""
+        intervals: Dict[str, int] = {}
+        for event_type, level in verbosity.items():
+            interval = _sample_interval(level)
+            if interval != 1 and event_type not in _UNFILTERED_EVENTS:
+                intervals[event_type] = interval
+        #only filtered types are stored, so the common full-verbosity check is one dict miss
+        self._sample_intervals = intervals
+        self._sample_seen = {}
+
+    def _keep(self, event_type: str) -> bool:
+        interval = self._sample_intervals.get(event_type)
+        if interval is None:
+            return True
+        if interval == 0:
+            return False
+        seen = self._sample_seen.get(event_type, 0)
+        self._sample_seen[event_type] = seen + 1
+        return seen % interval == 0
+
+    def _open_sink(self) -> None:
+        run_id = self.metadata.get("run_id")
+        if run_id is None:
+            run_id = allocate_run_id(self.log_dir)
+            self.metadata["run_id"] = run_id
+        if self._run_compression not in COMPRESSION_SUFFIXES:
+            raise ValueError(f"Unknown log compression {self._run_compression!r}; use 'gzip' or 'lzma'")
+        self.log_dir.mkdir(parents=True, exist_ok=True)
+        self.log_path = self.log_dir / f"run_{run_id}.jsonl{COMPRESSION_SUFFIXES[self._run_compression]}"
+        self._sink = _open_text(self.log_path, "w")
+
+    def _close_sink(self) -> None:
+        if self._sink is not None:
+            self._sink.close()
+            self._sink = None
+
+    def _flush_sink(self) -> None:
+        if self._sink is not None:
+            self._sink.flush()
+
+    def log_event(self, event_type: str, payload: Dict[str, Any]) -> None:
+        """Append an arbitrary event payload to the log."""
+        if self._keep(event_type):
+            self._record(event_type, payload)
+
+    def _record(self, event_type: str, payload: Dict[str, Any]) -> None:
+        entry = {"event": event_type}
+        entry.update(payload)
+        self.event_count += 1
+        if self._sink is not None:
+            self._sink.write(_dumps(entry))
+            self._sink.write("\n")
+            if not self.retain_events:
+                return
+        self.events.append(entry)
+
+    def log_tick(
+        self,
+        *,
+        turn: int,
+        game_time: int,
+        elapsed: int,
+        scheduled_delay: int,
+        passive_candidates: List[int],
+        player_candidates: List[int],
+    ) -> None:
+        """Record summary information for a single scheduler tick."""
+        if not self._keep("tick"):
+            return
+        self._record(
+            "tick",
+            {
+                "turn": turn,
+                "game_time": game_time,
+                "elapsed": elapsed,
+                "scheduled_delay": scheduled_delay,
+                "passive_candidates": list(passive_candidates),
+                "player_candidates": list(player_candidates),
+            },
+        )
+
+    def log_action(
+        self,
+        *,
+        player: str,
+        village_location: Optional[Any],
+        action_type: str,
+        target: Optional[str],
+        wait_time: Optional[int],
+        reason: Optional[str] = None,
+        population: Optional[int] = None,
+        culture_rate: Optional[float] = None,
+        culture_total: Optional[float] = None,
+        total_yield: Optional[float] = None,
+        ai_label: Optional[str] = None,
+    ) -> None:
+        """Record the action (or inaction) chosen by a controller."""
+        self._score(
             player,
-            {"actions": 0, "completions": 0, "last_event": None, "settlers_built": 0, "settle_points": 0},
+            "action",
+            village_location,
+            action_type,
+            target,
+            wait_time,
+            population,
+            culture_rate,
+            culture_total,
+            total_yield,
+            ai_label,
         )
-        if event.get("event") == "action":
-            entry["actions"] += 1
-        elif event.get("event") == "completion":
-            entry["completions"] += 1
-        entry["last_event"] = event
-        if "settlers_built" in event:
-            entry["settlers_built"] = event["settlers_built"]
-        if "settle_points" in event:
-            entry["settle_points"] = event["settle_points"]
-
-    scoreboard: List[Dict[str, Any]] = []
-    for player, stats in per_player.items():
-        last_event = stats.get("last_event") or {}
-        settle_points = stats.get("settle_points", 0)
-        if settle_points_map is not None:
-            settle_points = settle_points_map.get(player, settle_points)
-        scoreboard.append(
-            {
-                "player": player,
-                "actions": stats["actions"],
-                "completions": stats["completions"],
-                "ai_label": last_event.get("ai_label"),
-                "population": last_event.get("population"),
-                "culture_rate": last_event.get("culture_rate"),
-                "culture_total": last_event.get("culture_total"),
-                "total_yield": last_event.get("total_yield"),
-                "resources": last_event.get("resources"),
-                "storage_cap": last_event.get("storage_cap"),
-                "settlers_built": stats.get("settlers_built"),
-                "settle_points": settle_points,
-                "last_game_time": last_event.get("game_time"),
-                "last_village": _serialise_location(last_event.get("village")),
-                "last_event_type": last_event.get("event"),
-                "last_action_type": last_event.get("action_type") or last_event.get("job_type"),
-                "last_target": last_event.get("target"),
-                "last_wait_time": last_event.get("wait_time"),
-            }
+        if not self._keep("action"):
+            return
+        payload: Dict[str, Any] = {
+            "player": player,
+            "village": _serialise_location(village_location),
+            "action_type": action_type,
+            "target": target,
+            "wait_time": wait_time,
+        }
+        if reason is not None:
+            payload["reason"] = reason
+        if population is not None:
+            payload["population"] = population
+        if culture_rate is not None:
+            payload["culture_rate"] = culture_rate
+        if culture_total is not None:
+            payload["culture_total"] = culture_total
+        if total_yield is not None:
+            payload["total_yield"] = total_yield
+        if ai_label is not None:
+            payload["ai_label"] = ai_label
+        self._record("action", payload)
+
+    def log_completion(
+        self,
+        *,
+        player: str,
+        village_location: Optional[Any],
+        job_type: str,
+        target: str,
+        population: Optional[int] = None,
+        culture_rate: Optional[float] = None,
+        culture_total: Optional[float] = None,
+        total_yield: Optional[float] = None,
+        resources: Optional[List[float]] = None,
+        storage_cap: Optional[List[float]] = None,
+        ai_label: Optional[str] = None,
+        game_time: Optional[int] = None,
+        settlers_built: Optional[int] = None,
+        settle_points: Optional[int] = None,
+    ) -> None:
+        """Record completion of a queued job."""
+        self._score(
+            player,
+            "completion",
+            village_location,
+            job_type,
+            target,
+            None,
+            population,
+            culture_rate,
+            culture_total,
+            total_yield,
+            ai_label,
+            resources,
+            storage_cap,
+            game_time,
+            settlers_built,
+            settle_points,
         )
-    scoreboard.sort(
-        key=lambda item: (
-            -(item.get("settle_points") or 0),
-            -(item.get("population") or 0),
-            -(item.get("culture_total") or 0.0),
+        if job_type == "settle":
+            self._count_settlement(player, settle_points, game_time)
+        if not self._keep("completion"):
+            return
+        payload: Dict[str, Any] = {
+            "player": player,
+            "village": _serialise_location(village_location),
+            "job_type": job_type,
+            "target": target,
+        }
+        if game_time is not None:
+            payload["game_time"] = game_time
+        if population is not None:
+            payload["population"] = population
+        if culture_rate is not None:
+            payload["culture_rate"] = culture_rate
+        if culture_total is not None:
+            payload["culture_total"] = culture_total
+        if total_yield is not None:
+            payload["total_yield"] = total_yield
+        if resources is not None:
+            payload["resources"] = list(resources)
+        if storage_cap is not None:
+            payload["storage_cap"] = list(storage_cap)
+        if ai_label is not None:
+            payload["ai_label"] = ai_label
+        if settlers_built is not None:
+            payload["settlers_built"] = settlers_built
+        if settle_points is not None:
+            payload["settle_points"] = settle_points
+        self._record("completion", payload)
+
+    def _score(
+        self,
+        player: Optional[str],
+        event_type: str,
+        village_location: Optional[Any],
+        kind: Optional[str],
+        target: Optional[str],
+        wait_time: Optional[int],
+        population: Optional[int],
+        culture_rate: Optional[float],
+        culture_total: Optional[float],
+        total_yield: Optional[float],
+        ai_label: Optional[str],
+        resources: Optional[List[float]] = None,
+        storage_cap: Optional[List[float]] = None,
+        game_time: Optional[int] = None,
+        settlers_built: Optional[int] = None,
+        settle_points: Optional[int] = None,
+    ) -> None:
+        if player is None:
+            return
+        row = self._scores.get(player)
+        if row is None:
+            row = dict.fromkeys(_SCOREBOARD_COLUMNS)
+            row.update(player=player, actions=0, completions=0, settlers_built=0, settle_points=0)
+            self._scores[player] = row
+        if event_type == "action":
+            row["actions"] += 1
+        else:
+            row["completions"] += 1
+        #the stat columns mirror the player's most recent event, including fields it left unset
+        row["ai_label"] = ai_label
+        row["population"] = population
+        row["culture_rate"] = culture_rate
+        row["culture_total"] = culture_total
+        row["total_yield"] = total_yield
+        row["resources"] = list(resources) if resources is not None else None
+        row["storage_cap"] = list(storage_cap) if storage_cap is not None else None
+        if settlers_built is not None:
+            row["settlers_built"] = settlers_built
+        if settle_points is not None:
+            row["settle_points"] = settle_points
+        row["last_game_time"] = game_time
+        row["last_village"] = _serialise_location(village_location)
+        row["last_event_type"] = event_type
+        row["last_action_type"] = kind or None
+        row["last_target"] = target
+        row["last_wait_time"] = wait_time
+
+    def _count_settlement(self, player: Optional[str], settle_points: Optional[int], game_time: Optional[int]) -> None:
+        self.total_settlements += 1
+        if player is not None:
+            if settle_points is not None:
+                self.settle_points[player] = settle_points
+            else:
+                self.settle_points[player] = self.settle_points.get(player, 0) + 1
+        settle_goal = self.metadata.get("settle_goal")
+        if self.settle_goal_reached_time is None and isinstance(settle_goal, int) and self.total_settlements >= settle_goal:
+            self.settle_goal_reached_time = game_time
+
+    def finalise_run(self, summary: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Close out the run and return the collected log."""
+        if summary is None:
+            summary = {}
+        settle_goal = self.metadata.get("settle_goal")
+        if settle_goal is not None and "settle_goal" not in summary:
+            summary["settle_goal"] = settle_goal
+        total_settlements = self.total_settlements
+        summary.setdefault("total_settlements", total_settlements)
+        summary.setdefault("settle_goal_reached_time", self.settle_goal_reached_time)
+        summary.setdefault("settle_points", dict(self.settle_points))
+        threshold_met = False
+        if isinstance(settle_goal, int):
+            threshold_met = total_settlements >= settle_goal
+        summary.setdefault("settle_threshold_met", threshold_met)
+        settle_points_map = summary.get("settle_points") or {}
+        if isinstance(settle_points_map, dict):
+            max_points = max(settle_points_map.values(), default=0)
+            winners = [player for player, points in settle_points_map.items() if points == max_points and points > 0]
+        else:
+            winners = []
+        summary.setdefault("settle_winners", winners)
+        if summary is not None:
+            self.log_event("run_summary", summary)
+        if self._sink is None:
+            #finalising without start_run: write whatever was collected in memory
+            self._open_sink()
+            for event in self.events:
+                self._sink.write(_dumps(event))
+                self._sink.write("\n")
+        self._close_sink()
+        payload = {"metadata": self.metadata.copy(), "events": self.get_events()}
+        scoreboard = self.scoreboard(summary.get("settle_points") if isinstance(summary.get("settle_points"), dict) else None)
+        payload["scoreboard"] = {"players": scoreboard}
+        run_id = self.metadata["run_id"]
+        scoreboard_path = self._scoreboard_path(run_id)
+        if self.writer is not None:
+            self.writer.submit(_write_scoreboard, scoreboard_path, run_id, scoreboard)
+        else:
+            _write_scoreboard(scoreboard_path, run_id, scoreboard)
+        payload["metadata"]["log_path"] = str(self.log_path)
+        payload["metadata"]["scoreboard_path"] = str(scoreboard_path)
+        return payload
+
+    def _scoreboard_path(self, run_id: str) -> Path:
+        return self.scoreboard_dir / f"scoreboard_{run_id}.json{COMPRESSION_SUFFIXES[self._run_compression]}"
+
+    def scoreboard(self, settle_points_map: Optional[Dict[str, int]] = None) -> List[Dict[str, Any]]:
+        """Current per-player standings, best first; safe to call mid-run."""
+        scoreboard: List[Dict[str, Any]] = []
+        for player, row in self._scores.items():
+            entry = dict(row)
+            if settle_points_map is not None:
+                entry["settle_points"] = settle_points_map.get(player, entry["settle_points"])
+            scoreboard.append(entry)
+        scoreboard.sort(
+            key=lambda item: (
+                -(item.get("settle_points") or 0),
+                -(item.get("population") or 0),
+                -(item.get("culture_total") or 0.0),
+            )
         )
-    )
-    return scoreboard
+        return scoreboard
+
+    def get_events(self) -> Union[List[Dict[str, Any]], EventStream]:
+        """Expose the run's events: a shallow copy when held in memory, else a stream over the log file."""
+        if self.log_path is None or self.retain_events:
+            return list(self.events)
+        return EventStream(self.log_path, self.event_count, self._flush_sink)
+
+
+# Default logger backing the module-level helpers.
+_default_logger = RunLogger()
+RUN_METADATA: Dict[str, Any] = _default_logger.metadata
+#only populated outside a run or with retain_events; use get_events() to read a streamed run
+RUN_EVENTS: List[Dict[str, Any]] = _default_logger.events
+
+
+def reset() -> None:
+    _default_logger.reset()
+
+
+def start_run(metadata: Dict[str, Any]) -> None:
+    """Initialise logging for a new simulation run."""
+    _default_logger.start_run(metadata)
+
+
+def configure_verbosity(verbosity: Dict[str, Any]) -> None:
+    """Apply per-event-type verbosity levels to the default logger."""
+    _default_logger.verbosity = dict(verbosity)
+    _default_logger.configure_verbosity(_default_logger.verbosity)
+
+
+def log_event(event_type: str, payload: Dict[str, Any]) -> None:
+    """Append an arbitrary event payload to the log."""
+    _default_logger.log_event(event_type, payload)
+
+
+def log_tick(**kwargs: Any) -> None:
+    """Record summary information for a single scheduler tick."""
+    _default_logger.log_tick(**kwargs)
+
+
+def log_action(**kwargs: Any) -> None:
+    """Record the action (or inaction) chosen by a controller."""
+    _default_logger.log_action(**kwargs)
+
+
+def log_completion(**kwargs: Any) -> None:
+    """Record completion of a queued job."""
+    _default_logger.log_completion(**kwargs)
+
+
+def finalise_run(summary: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Close out the run and return the collected log."""
+    return _default_logger.finalise_run(summary)
+
+
+def scoreboard() -> List[Dict[str, Any]]:
+    """Current per-player standings of the default logger."""
+    return _default_logger.scoreboard()
 
 
-def get_events() -> List[Dict[str, Any]]:
-    """Expose a shallow copy of the accumulated events."""
-    return list(RUN_EVENTS)
+def get_events() -> Union[List[Dict[str, Any]], EventStream]:
+    """Expose the accumulated events, streaming them from disk when not retained."""
+    return _default_logger.get_events()
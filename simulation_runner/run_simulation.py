@@ -1,3 +1,4 @@
+import random
 import sys
 from pathlib import Path
 from typing import Optional
@@ -10,24 +11,38 @@ if __package__ in (None, ""):
 
 from master_controller.simulation_constraints import create_simulation_constraints
 from master_controller import game_rules
-from Specific_Functions.map_creation import map_creation, modify_base_map
+from Specific_Functions.map_creation import modify_base_map
+from Specific_Functions.world_cache import cached_map_creation
 from Specific_Functions.populate_players import populate_players_with_villages
-from simulation_runner import game_state_progression as progress_state
-from simulation_runner import run_logger
-from simulation_runner import periodic_monitor
+from simulation_runner.game_state_progression import GameState
+from simulation_runner.run_logger import RunLogger
+from simulation_runner import background_writer
 
 
-def _reset_progress_state():
-    """Zero the global counters so consecutive runs start clean."""
-    progress_state.game_counter = 0
-    progress_state.turn_counter = 0
-    progress_state.time_elapsed = 0
-    progress_state.time_will_elapse = 0
-    progress_state.global_last_active = 0
+def _execute_simulation(
+    num_ticks,
+    num_players,
+    base_random_seed,
+    map_radius,
+    label,
+    log_settlement_events=False,
+    log_verbosity=None,
+    log_compression=None,
+    writer=None,
+    monitor_aggregate_only=False,
+    monitor_schedule=None,
+):
+    """Run a single simulation instance with the provided configuration.
 
-
-def _execute_simulation(num_ticks, num_players, base_random_seed, map_radius, label, log_settlement_events=False):
-    """Run a single simulation instance with the provided configuration."""
+    ``log_verbosity`` is passed to the run logger, e.g. ``{"tick": "off", "action": 50}``;
+    ``log_compression`` ("gzip" or "lzma") compresses its log and scoreboard.
+    With a background ``writer`` the scoreboard and monitoring export are queued
+    on it rather than written before returning; call ``writer.flush()`` to wait.
+    ``monitor_aggregate_only`` keeps only per-interval aggregates in the monitor
+    (no snapshots.csv), which bounds its memory for long runs.
+    ``monitor_schedule`` swaps the fixed 15-minute snapshots for (until, interval)
+    segments, e.g. ``periodic_monitor.LONG_RUN_SCHEDULE``.
+    """
     # Derive constraints (seed may override map/player defaults downstream).
     radius, players = create_simulation_constraints(
         rng_seed=base_random_seed,
@@ -35,17 +50,21 @@ def _execute_simulation(num_ticks, num_players, base_random_seed, map_radius, la
         num_players=num_players,
     )
 
-    base_map = map_creation(radius)
+    #same seed and radius reuse the terrain cached on disk
+    base_map = cached_map_creation(radius, base_random_seed)
     base_map = modify_base_map(base_map)
-    player_dict = populate_players_with_villages(base_map, players)
+    #one seeded stream for placement and every AI decision in this run, never the global random
+    rng = random.Random(base_random_seed)
+    player_dict = populate_players_with_villages(base_map, players, rng_holder=rng)
     previous_settle_points = {player.name: player.settle_points for player in player_dict.values()}
     run_context = {
         "global_settles_completed": 0,
         "settle_goal": game_rules.target_settles(players),
     }
 
-    _reset_progress_state()
-    periodic_monitor.reset(
+    # fresh kernel per run; clock, monitor and logger never leak between runs
+    state = GameState(base_map, player_dict, logger=RunLogger(writer=writer), rng=rng)
+    state.monitor.reset(
         interval=900,
         variant=label,
         metadata={
@@ -53,9 +72,11 @@ def _execute_simulation(num_ticks, num_players, base_random_seed, map_radius, la
             "map_radius": radius,
             "num_players": players,
         },
+        aggregate_only=monitor_aggregate_only,
+        schedule=monitor_schedule,
     )
-    periodic_monitor.capture_initial(progress_state.game_counter, player_dict)
-    run_logger.start_run(
+    state.monitor.capture_initial(state.game_counter, player_dict)
+    state.logger.start_run(
         {
             "map_radius": radius,
             "num_players": players,
@@ -68,12 +89,14 @@ def _execute_simulation(num_ticks, num_players, base_random_seed, map_radius, la
             "settle_cost": game_rules.SETTLE_COST,
             "settle_time": game_rules.SETTLE_TIME,
             "cp_settlement_threshold": game_rules.CP_THRESHOLD,
+            "log_verbosity": log_verbosity,
+            "log_compression": log_compression,
         }
     )
 
     goal_reached_at: Optional[int] = None
     for _ in range(num_ticks):
-        progress_state.simulate_time(base_map, player_dict)
+        state.simulate_time()
         total_settlements = sum(player.settle_points for player in player_dict.values())
         run_context["global_settles_completed"] = total_settlements
         if log_settlement_events:
@@ -82,18 +105,18 @@ def _execute_simulation(num_ticks, num_players, base_random_seed, map_radius, la
                 prev_points = previous_settle_points.get(player.name, 0)
                 if current_points > prev_points:
                     print(
-                        f"[{label}] t={progress_state.game_counter}s tick={progress_state.turn_counter} "
+                        f"[{label}] t={state.game_counter}s tick={state.turn_counter} "
                         f"{player.name} completed settlement #{current_points}"
                     )
                 previous_settle_points[player.name] = current_points
         if total_settlements >= run_context["settle_goal"]:
-            goal_reached_at = progress_state.game_counter
+            goal_reached_at = state.game_counter
             break
 
-    final_ticks = progress_state.turn_counter
-    final_time = progress_state.game_counter
-    periodic_monitor.final_capture(final_time, player_dict)
-    log_output = run_logger.finalise_run(
+    final_ticks = state.turn_counter
+    final_time = state.game_counter
+    state.monitor.final_capture(final_time, player_dict)
+    log_output = state.logger.finalise_run(
         {
             "ticks": final_ticks,
             "final_game_time": final_time,
@@ -106,10 +129,15 @@ def _execute_simulation(num_ticks, num_players, base_random_seed, map_radius, la
         }
     )
     run_id = log_output.get("metadata", {}).get("run_id", "unknown")
+
+    def report_export_failure(exc):
+        #one run's export failing is reported and skipped, never fatal to the batch
+        print(f"[{label}] Monitoring export skipped: {exc}")
+
     try:
-        periodic_monitor.export_results(run_id, label)
+        state.monitor.export_results(run_id, label, writer=writer, on_error=report_export_failure)
     except RuntimeError as exc:
-        print(f"[{label}] Monitoring export skipped: {exc}")
+        report_export_failure(exc)
     if goal_reached_at is not None:
         print(
             f"[{label}] Settlement goal reached at t={goal_reached_at}s; "
@@ -123,8 +151,23 @@ def _execute_simulation(num_ticks, num_players, base_random_seed, map_radius, la
     return log_output
 
 
-def run_simulation(num_ticks, num_players, base_random_seed, map_radius, log_settlement_events=False):
-    """Run the requested configuration, then a fixed comparison pass."""
+def run_simulation(
+    num_ticks,
+    num_players,
+    base_random_seed,
+    map_radius,
+    log_settlement_events=False,
+    log_verbosity=None,
+    log_compression=None,
+    monitor_aggregate_only=False,
+    monitor_schedule=None,
+):
+    """Run the requested configuration, then a fixed comparison pass.
+
+    Each run's artefacts are written in the background while the next run
+    proceeds; all of them are on disk (or their failure raised) on return.
+    """
+    writer = background_writer.default_writer()
     primary_log = _execute_simulation(
         num_ticks=num_ticks,
         num_players=num_players,
@@ -132,6 +175,11 @@ def run_simulation(num_ticks, num_players, base_random_seed, map_radius, log_set
         map_radius=map_radius,
         label="primary",
         log_settlement_events=log_settlement_events,
+        log_verbosity=log_verbosity,
+        log_compression=log_compression,
+        writer=writer,
+        monitor_aggregate_only=monitor_aggregate_only,
+        monitor_schedule=monitor_schedule,
     )
     comparison_log = _execute_simulation(
         num_ticks=2000,
@@ -140,7 +188,13 @@ def run_simulation(num_ticks, num_players, base_random_seed, map_radius, log_set
         map_radius=map_radius,
         label="comparison",
         log_settlement_events=log_settlement_events,
+        log_verbosity=log_verbosity,
+        log_compression=log_compression,
+        writer=writer,
+        monitor_aggregate_only=monitor_aggregate_only,
+        monitor_schedule=monitor_schedule,
     )
+    writer.flush()
     return primary_log, comparison_log
 
 
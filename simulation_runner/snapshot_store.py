@@ -0,0 +1,293 @@
+from __future__ import annotations
+
+import math
+from typing import Dict, Hashable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+#numeric columns in the order they appear in snapshot records
+FLOAT_COLUMNS: Tuple[str, ...] = (
+    "wood_yield",
+    "clay_yield",
+    "iron_yield",
+    "crop_yield",
+    "crop_stock",
+    "total_yield",
+    "culture_total",
+    "culture_rate",
+)
+INT_COLUMNS: Tuple[str, ...] = ("time", "population", "settlers_built", "settle_points")
+#label columns stored as int32 codes into a per-store list of distinct values; -1 is None
+CODE_COLUMNS: Tuple[str, ...] = ("player", "ai_label", "village_location", "run_variant")
+RECORD_COLUMNS: Tuple[str, ...] = (
+    "time",
+    "minutes",
+    "player",
+    "ai_label",
+    "village_location",
+    "wood_yield",
+    "clay_yield",
+    "iron_yield",
+    "crop_yield",
+    "crop_stock",
+    "population",
+    "total_yield",
+    "culture_total",
+    "culture_rate",
+    "settlers_built",
+    "settle_points",
+    "run_variant",
+)
+_INITIAL_CAPACITY = 1024
+
+
+class _Interner:
+    """Assigns dense int codes to hashable labels in first-seen order."""
+
+    __slots__ = ("values", "_codes")
+
+    def __init__(self) -> None:
+        self.values: List[Hashable] = []
+        self._codes: Dict[Hashable, int] = {}
+
+    def code(self, value: Optional[Hashable]) -> int:
+        if value is None:
+            return -1
+        code = self._codes.get(value)
+        if code is None:
+            code = len(self.values)
+            self._codes[value] = code
+            self.values.append(value)
+        return code
+
+
+class SnapshotStore:
+    """Columnar snapshot rows: one NumPy array per metric, grown geometrically.
+
+    Labels (player, AI label, village location, run variant) are interned to
+    int32 codes, and run-level metadata is kept once rather than per row.
+    Columns are only ever appended to and a grow allocates fresh arrays, so
+    slices handed out by ``columns()`` stay valid while capture continues.
+    """
+
+    def __init__(self, metadata: Optional[Dict[str, object]] = None, capacity: int = _INITIAL_CAPACITY) -> None:
+        self.metadata: Dict[str, object] = dict(metadata or {})
+        self._size = 0
+        self._capacity = max(1, int(capacity))
+        self._floats = {name: np.empty(self._capacity, dtype=np.float64) for name in FLOAT_COLUMNS}
+        self._ints = {name: np.empty(self._capacity, dtype=np.int64) for name in INT_COLUMNS}
+        self._codes = {name: np.empty(self._capacity, dtype=np.int32) for name in CODE_COLUMNS}
+        self._labels = {name: _Interner() for name in CODE_COLUMNS}
+        #(player code, location code) -> time of that village's latest row
+        self._last_time: Dict[Tuple[int, int], int] = {}
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _grow(self) -> None:
+        capacity = self._capacity * 2
+        for table in (self._floats, self._ints, self._codes):
+            for name, column in table.items():
+                grown = np.empty(capacity, dtype=column.dtype)
+                grown[: self._size] = column[: self._size]
+                table[name] = grown
+        self._capacity = capacity
+
+    def append(
+        self,
+        time: int,
+        player: Optional[str],
+        ai_label: Optional[str],
+        village_location: Optional[Hashable],
+        run_variant: Optional[str],
+        **values: float,
+    ) -> bool:
+        """Add one village row; returns False if that village already has a row at ``time``.
+
+        Captures arrive in chronological order, so comparing with the village's
+        latest row is enough to drop duplicates.
+        """
+        player_code = self._labels["player"].code(player)
+        location_code = self._labels["village_location"].code(village_location)
+        key = (player_code, location_code)
+        if self._last_time.get(key) == time:
+            return False
+        self._last_time[key] = time
+        if self._size == self._capacity:
+            self._grow()
+        row = self._size
+        self._ints["time"][row] = time
+        self._codes["player"][row] = player_code
+        self._codes["ai_label"][row] = self._labels["ai_label"].code(ai_label)
+        self._codes["village_location"][row] = location_code
+        self._codes["run_variant"][row] = self._labels["run_variant"].code(run_variant)
+        for name in FLOAT_COLUMNS:
+            self._floats[name][row] = values[name]
+        for name in ("population", "settlers_built", "settle_points"):
+            self._ints[name][row] = values[name]
+        self._size = row + 1
+        return True
+
+    def columns(self) -> Dict[str, np.ndarray]:
+        """Views of the filled part of every numeric and code column (no copies)."""
+        size = self._size
+        views: Dict[str, np.ndarray] = {}
+        for table in (self._floats, self._ints, self._codes):
+            for name, column in table.items():
+                views[name] = column[:size]
+        return views
+
+    def labels(self, name: str) -> List[Hashable]:
+        """Distinct values of a code column, indexed by code."""
+        return list(self._labels[name].values)
+
+    def to_frame(self):
+        """DataFrame over the stored rows in record column order, backed by the store's arrays."""
+        import pandas as pd  # type: ignore
+
+        views = self.columns()
+        data: Dict[str, object] = {}
+        for name in RECORD_COLUMNS:
+            if name == "minutes":
+                data[name] = views["time"] / 60.0
+            elif name in CODE_COLUMNS:
+                data[name] = self._categorical(name, views[name])
+            else:
+                data[name] = views[name]
+        frame = pd.DataFrame(data, copy=False)
+        for key, value in self.metadata.items():
+            frame[key] = value
+        return frame
+
+    def _categorical(self, name: str, codes: np.ndarray):
+        import pandas as pd  # type: ignore
+
+        values = self._labels[name].values
+        try:
+            order = sorted(range(len(values)), key=values.__getitem__)
+        except TypeError:
+            order = list(range(len(values)))
+        if order != list(range(len(values))):
+            #categories must be in value order so groupby/sort match plain object columns;
+            #interned codes follow first sight, so remap (the only column copied)
+            remap = np.empty(len(values) + 1, dtype=np.int32)
+            remap[np.asarray(order, dtype=np.int64)] = np.arange(len(values), dtype=np.int32)
+            remap[-1] = -1
+            codes = remap[codes]
+            values = [values[index] for index in order]
+        categories = pd.Index(values, dtype=object, tupleize_cols=False)
+        return pd.Categorical.from_codes(codes, categories=categories)
+
+    def records(self) -> List[Dict[str, object]]:
+        """Materialise the rows as the per-village dicts the monitor used to keep."""
+        views = self.columns()
+        labels = {name: self._labels[name].values for name in CODE_COLUMNS}
+        records: List[Dict[str, object]] = []
+        for row in range(self._size):
+            record: Dict[str, object] = {}
+            for name in RECORD_COLUMNS:
+                if name == "minutes":
+                    record[name] = int(views["time"][row]) / 60.0
+                elif name in CODE_COLUMNS:
+                    code = int(views[name][row])
+                    record[name] = labels[name][code] if code >= 0 else None
+                elif name in FLOAT_COLUMNS:
+                    record[name] = float(views[name][row])
+                else:
+                    record[name] = int(views[name][row])
+            record.update(self.metadata)
+            records.append(record)
+        return records
+
+
+class IntervalAggregates:
+    """Running best/worst/mean per (run_variant, ai_label, time) instead of raw rows.
+
+    Accepts the same ``append`` calls as ``SnapshotStore`` but folds each row
+    into min, max and a compensated sum straight away, so memory grows with
+    labels x intervals rather than villages x intervals. Sums use the same
+    Kahan update as pandas' grouped mean, so averages match a DataFrame
+    aggregation of the equivalent raw rows exactly.
+    """
+
+    def __init__(self, metrics: Sequence[str]) -> None:
+        self.metrics: Tuple[str, ...] = tuple(metrics)
+        #(run_variant, ai_label, time) -> [row count, [min, max, sum, compensation] per metric]
+        self._groups: Dict[Tuple[object, object, int], list] = {}
+        self._last_time: Dict[Tuple[object, object], int] = {}
+        self._rows = 0
+
+    def __len__(self) -> int:
+        return self._rows
+
+    def append(
+        self,
+        time: int,
+        player: Optional[str],
+        ai_label: Optional[str],
+        village_location: Optional[Hashable],
+        run_variant: Optional[str],
+        **values: float,
+    ) -> bool:
+        """Fold one village row into its interval group; returns False for a duplicate capture."""
+        village_key = (player, village_location)
+        if self._last_time.get(village_key) == time:
+            return False
+        self._last_time[village_key] = time
+        self._rows += 1
+        if run_variant is None or ai_label is None:
+            #rows without a group label are dropped by the DataFrame groupby as well
+            return True
+        group_key = (run_variant, ai_label, time)
+        group = self._groups.get(group_key)
+        if group is None:
+            group = [0, [[math.inf, -math.inf, 0.0, 0.0] for _ in self.metrics]]
+            self._groups[group_key] = group
+        group[0] += 1
+        for stat, name in zip(group[1], self.metrics):
+            value = float(values[name])
+            if value < stat[0]:
+                stat[0] = value
+            if value > stat[1]:
+                stat[1] = value
+            adjusted = value - stat[3]
+            total = stat[2] + adjusted
+            compensation = total - stat[2] - adjusted
+            stat[3] = compensation if compensation == compensation else 0.0
+            stat[2] = total
+        return True
+
+    def aggregate_frame(self):
+        """Long best/worst/average table in the layout of ``periodic_monitor.aggregate_snapshots``."""
+        import pandas as pd  # type: ignore
+
+        columns: Dict[str, list] = {name: [] for name in ("run_variant", "ai_label", "time", "metric", "best", "worst", "average")}
+        for (run_variant, ai_label, time), (count, stats) in sorted(self._groups.items(), key=lambda item: item[0]):
+            for name, (low, high, total, _) in zip(self.metrics, stats):
+                columns["run_variant"].append(run_variant)
+                columns["ai_label"].append(ai_label)
+                columns["time"].append(time)
+                columns["metric"].append(name)
+                columns["best"].append(high)
+                columns["worst"].append(low)
+                columns["average"].append(total / count)
+        frame = pd.DataFrame(
+            {
+                "run_variant": pd.Series(columns["run_variant"], dtype=object),
+                "ai_label": pd.Series(columns["ai_label"], dtype=object),
+                "time": np.asarray(columns["time"], dtype=np.int64),
+                "minutes": np.asarray(columns["time"], dtype=np.int64) / 60.0,
+                "metric": pd.Series(columns["metric"], dtype=object),
+                "best": np.asarray(columns["best"], dtype=np.float64),
+                "worst": np.asarray(columns["worst"], dtype=np.float64),
+                "average": np.asarray(columns["average"], dtype=np.float64),
+            }
+        )
+        return frame
+
+    def records(self) -> List[Dict[str, object]]:
+        """Raw rows are not retained in aggregate-only mode."""
+        return []
+
+
+__all__ = ["FLOAT_COLUMNS", "INT_COLUMNS", "CODE_COLUMNS", "RECORD_COLUMNS", "SnapshotStore", "IntervalAggregates"]